@@ -0,0 +1,695 @@
+"""On-disk caches which persist between runs of fontbakery.
+
+Everything is kept below a single directory: ``$FONTBAKERY_CACHE_DIR`` if
+set, otherwise the ``fontbakery`` directory of the user's cache directory
+(``$XDG_CACHE_HOME``, or ``~/.cache``). Entries are addressed by hex
+digests of whatever determines their contents, so they never need to be
+invalidated; stale entries are simply not looked up anymore, and the whole
+directory can be deleted at any time. The cache of external tool runs is
+the only one which is limited in size. Downloads are the exception to the
+digest rule: they are kept by URL, and revalidated with the server. So are
+the statuses of links, which are checked again after a while.
+"""
+
+from concurrent.futures import Future, ThreadPoolExecutor
+import functools
+import hashlib
+import importlib.metadata
+import json
+import os
+import shutil
+import subprocess
+import tempfile
+import threading
+import time
+from typing import Dict, List, NamedTuple, Optional
+
+from fontbakery.message import Message
+from fontbakery.result import Subresult
+from fontbakery.status import Status
+
+
+def cache_dir(*subdirs):
+    """The path of a (sub)directory of the cache, which is created if needed."""
+    base = os.environ.get("FONTBAKERY_CACHE_DIR")
+    if not base:
+        user_cache = os.environ.get("XDG_CACHE_HOME") or os.path.join(
+            os.path.expanduser("~"), ".cache"
+        )
+        base = os.path.join(user_cache, "fontbakery")
+    path = os.path.join(base, *subdirs)
+    os.makedirs(path, exist_ok=True)
+    return path
+
+
+def digest(*parts):
+    """A hex digest of the JSON serialization of the given values."""
+    serialized = json.dumps(parts, sort_keys=True, default=repr)
+    return hashlib.sha256(serialized.encode("utf-8")).hexdigest()
+
+
+def file_digest(path):
+    """A hex digest of the contents of a file or, for directories such as
+    UFOs, of the relative paths and contents of all the files they contain."""
+    sha = hashlib.sha256()
+    if os.path.isdir(path):
+        for root, dirs, files in os.walk(path):
+            dirs.sort()
+            for name in sorted(files):
+                filename = os.path.join(root, name)
+                sha.update(os.path.relpath(filename, path).encode("utf-8") + b"\0")
+                sha.update(file_digest(filename).encode("ascii"))
+        return sha.hexdigest()
+
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            sha.update(chunk)
+    return sha.hexdigest()
+
+
+def write_atomically(path, data: bytes):
+    """Write a file so that concurrent readers (and writers, in other
+    threads or processes) never see it partially written."""
+    directory = os.path.dirname(path)
+    os.makedirs(directory, exist_ok=True)
+    fd, temporary = tempfile.mkstemp(dir=directory, prefix=".tmp-")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+        os.replace(temporary, path)
+    except BaseException:
+        os.unlink(temporary)
+        raise
+
+
+class JSONCache:
+    """A directory of JSON documents addressed by hex digest."""
+
+    def __init__(self, directory):
+        self.directory = directory
+
+    def _path(self, key):
+        return os.path.join(self.directory, key[:2], key + ".json")
+
+    def get(self, key):
+        """The document stored under the key, or None."""
+        try:
+            with open(self._path(key), "rb") as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return None
+
+    def put(self, key, document):
+        write_atomically(self._path(key), json.dumps(document).encode("utf-8"))
+
+
+class ResultCache(JSONCache):
+    """The subresults of check runs, keyed by everything their outcome
+    depends on (see ``CheckRunner._result_cache_key``)."""
+
+    def __init__(self, directory=None):
+        super().__init__(directory or cache_dir("results"))
+
+    def get_subresults(self, key):
+        document = self.get(key)
+        if document is None:
+            return None
+        return [
+            Subresult(
+                Status(item["status"], item["weight"]),
+                Message(item["code"], item["message"]),
+            )
+            for item in document
+        ]
+
+    def put_subresults(self, key, subresults):
+        self.put(
+            key,
+            [
+                {
+                    "status": subresult.status.name,
+                    "weight": subresult.status.weight,
+                    "code": subresult.message.code,
+                    "message": str(subresult.message.message),
+                }
+                for subresult in subresults
+            ],
+        )
+
+
+class CostHistory:
+    """How many seconds each check and each condition took in earlier runs,
+    so that the slowest ones can be started first (see ``CheckRunner``).
+
+    Costs are kept per check id and per condition name, averaged over the
+    files they ran on, and each run is blended with the earlier ones. If the
+    cache directory can not be used, the costs are only kept in memory.
+    """
+
+    def __init__(self, path=None):
+        try:
+            self.path = path or os.path.join(cache_dir(), "costs.json")
+        except OSError:
+            self.path = None
+        self._lock = threading.Lock()
+        try:
+            with open(self.path, "rb") as f:
+                document = json.load(f)
+            self.checks = dict(document["checks"])
+            self.conditions = dict(document["conditions"])
+        except (OSError, ValueError, KeyError, TypeError):
+            self.checks = {}
+            self.conditions = {}
+
+    def check(self, check_id):
+        """The expected cost of a check. Checks which never ran before are
+        expected to take as long as the average check."""
+        if check_id in self.checks:
+            return self.checks[check_id]
+        if self.checks:
+            return sum(self.checks.values()) / len(self.checks)
+        return 0.0
+
+    def condition(self, name):
+        return self.conditions.get(name, 0.0)
+
+    @staticmethod
+    def _blend(history, costs):
+        """Average costs, given by (name, iterargs), per name, and blend them
+        into the history."""
+        runs = {}
+        for (name, _), cost in costs.items():
+            runs.setdefault(name, []).append(cost)
+        for name, values in runs.items():
+            cost = sum(values) / len(values)
+            if name in history:
+                cost = (history[name] + cost) / 2
+            history[name] = cost
+
+    def update(self, check_costs, condition_costs):
+        with self._lock:
+            self._blend(self.checks, check_costs)
+            self._blend(self.conditions, condition_costs)
+
+    def save(self):
+        with self._lock:
+            document = {"checks": self.checks, "conditions": self.conditions}
+        if self.path is None:
+            return
+        try:
+            write_atomically(self.path, json.dumps(document).encode("utf-8"))
+        except OSError:
+            pass
+
+
+# The size, in bytes, beyond which the least recently used tool runs are evicted.
+DEFAULT_TOOL_CACHE_SIZE = 256 * 1024 * 1024
+
+
+def tool_version(executable, package=None):
+    """What tells apart the versions of an external tool: the path, size and
+    modification time of its executable and, if it comes with a Python
+    package, the version of the package. Raises FileNotFoundError if the
+    tool is not installed."""
+    path = shutil.which(executable)
+    if path is None:
+        raise FileNotFoundError(f"{executable} is not available")
+    stat = os.stat(path)
+    version = [path, stat.st_size, stat.st_mtime_ns]
+    if package:
+        version.append(importlib.metadata.version(package))
+    return version
+
+
+class ToolRun(NamedTuple):
+    returncode: int
+    stdout: bytes
+    stderr: bytes
+    # The files the tool wrote to its output directory, by relative path
+    files: Dict[str, bytes]
+
+
+def _text(output: bytes):
+    return output.decode("utf-8", "surrogateescape")
+
+
+def _bytes(text: str):
+    return text.encode("utf-8", "surrogateescape")
+
+
+def _read_files(directory):
+    """The contents of the files below a directory, by relative path."""
+    files = {}
+    for root, _, names in os.walk(directory):
+        for name in names:
+            path = os.path.join(root, name)
+            with open(path, "rb") as f:
+                files[os.path.relpath(path, directory)] = f.read()
+    return files
+
+
+class ToolCache:
+    """The outcome of running external tools (validators and the like) on
+    files, keyed by the paths and contents of the files, the version of the
+    tool and its arguments, so that a tool runs only once on a given font.
+
+    Entries are directories holding a ``result.json`` document and the
+    files the tool wrote, if any. Once the entries take more than
+    `max_size` bytes, the least recently used ones are evicted. If the cache
+    directory can not be created, the tools just run every time.
+    """
+
+    def __init__(self, directory=None, max_size=DEFAULT_TOOL_CACHE_SIZE):
+        try:
+            self.directory = directory or cache_dir("tools")
+        except OSError:
+            self.directory = None
+        self.max_size = max_size
+
+    def _entry(self, key):
+        return os.path.join(self.directory, key[:2], key)
+
+    def _get(self, key):
+        if self.directory is None:
+            return None
+        entry = self._entry(key)
+        try:
+            with open(os.path.join(entry, "result.json"), "rb") as f:
+                document = json.load(f)
+            files = _read_files(os.path.join(entry, "files"))
+            # Mark the entry as recently used.
+            os.utime(entry)
+        except (OSError, ValueError):
+            return None
+        return document, files
+
+    def _put(self, key, document, files_dir=None):
+        if self.directory is None:
+            return
+        parent = os.path.dirname(self._entry(key))
+        try:
+            os.makedirs(parent, exist_ok=True)
+            temporary = tempfile.mkdtemp(dir=parent, prefix=".tmp-")
+        except OSError:
+            return
+        try:
+            with open(
+                os.path.join(temporary, "result.json"), "w", encoding="utf-8"
+            ) as f:
+                json.dump(document, f)
+            if files_dir is not None:
+                shutil.copytree(files_dir, os.path.join(temporary, "files"))
+            os.rename(temporary, self._entry(key))
+        except OSError:
+            # Most likely, another thread or process stored it first.
+            shutil.rmtree(temporary, ignore_errors=True)
+            return
+        try:
+            self._evict()
+        except OSError:
+            # Another process evicting entries at the same time
+            pass
+
+    def _evict(self):
+        entries = []
+        total = 0
+        for parent in os.scandir(self.directory):
+            if not parent.is_dir():
+                continue
+            for entry in os.scandir(parent.path):
+                if entry.name.startswith(".tmp-"):
+                    continue
+                size = sum(
+                    os.path.getsize(os.path.join(root, name))
+                    for root, _, names in os.walk(entry.path)
+                    for name in names
+                )
+                entries.append((entry.stat().st_mtime_ns, size, entry.path))
+                total += size
+        for _, size, path in sorted(entries):
+            if total <= self.max_size:
+                break
+            shutil.rmtree(path, ignore_errors=True)
+            total -= size
+
+    @staticmethod
+    def _key(version, arguments, inputs):
+        return digest(version, arguments, [file_digest(path) for path in inputs])
+
+    def run(self, command, inputs, version, merge_output=False, output_dir=False):
+        """Run a command on the given input files, which it names among its
+        arguments, unless the same version of the tool already ran with the
+        same arguments on the same files, with the same contents. (Tools
+        name the files they ran on in their output and in the files they
+        write, so the same contents under another name are run on again.)
+
+        If `merge_output`, the tool's stderr goes to its stdout. If
+        `output_dir`, "{output_dir}" in the arguments is replaced by an empty
+        directory, and the files that the tool writes there are kept too.
+        """
+        arguments = [
+            os.path.abspath(argument) if argument in inputs else argument
+            for argument in command
+        ]
+        key = self._key(version, arguments, inputs)
+        cached = self._get(key)
+        if cached is not None:
+            document, files = cached
+            return ToolRun(
+                document["returncode"],
+                _bytes(document["stdout"]),
+                _bytes(document["stderr"]),
+                files,
+            )
+
+        with tempfile.TemporaryDirectory(prefix="fontbakery-") as files_dir:
+            if output_dir:
+                command = [
+                    argument.replace("{output_dir}", files_dir) for argument in command
+                ]
+            process = subprocess.run(
+                command,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.STDOUT if merge_output else subprocess.PIPE,
+                check=False,
+            )
+            stderr = process.stderr or b""
+            self._put(
+                key,
+                {
+                    "returncode": process.returncode,
+                    "stdout": _text(process.stdout),
+                    "stderr": _text(stderr),
+                },
+                files_dir if output_dir else None,
+            )
+            files = _read_files(files_dir)
+        return ToolRun(process.returncode, process.stdout, stderr, files)
+
+    def call(self, function, inputs, version, *args):
+        """The value of `function(*inputs, *args)`, which must be serializable
+        as JSON, unless it was already computed with the same arguments on
+        files with the same contents, for the same version of whatever the
+        function runs."""
+        key = self._key(
+            version, [function.__module__, function.__qualname__, *args], inputs
+        )
+        cached = self._get(key)
+        if cached is not None:
+            return cached[0]
+        value = function(*inputs, *args)
+        self._put(key, value)
+        return value
+
+
+@functools.lru_cache(maxsize=1)
+def tool_cache():
+    """The tool cache shared by the checks of this process."""
+    return ToolCache()
+
+
+_sessions = threading.local()
+
+
+def http_session():
+    """The requests session of this thread. It keeps the connections to the
+    servers it talked to open, for the next requests to the same servers."""
+    import requests
+
+    session = getattr(_sessions, "session", None)
+    if session is None:
+        session = _sessions.session = requests.Session()
+    return session
+
+
+class NotCached(OSError):
+    """A remote file was needed offline, but was never downloaded."""
+
+
+DEFAULT_HTTP_CACHE_SIZE = 512 * 1024 * 1024
+
+
+class HTTPCache:
+    """Remote files, such as the Google Fonts metadata and the fonts of the
+    families hosted there, kept on disk between runs.
+
+    Each file is stored with the ``ETag`` and ``Last-Modified`` headers its
+    server sent, so that later runs only download it again if it changed.
+    If the server can not be reached, or fails with a 5xx error, the copy
+    from an earlier run is used.
+    Offline, the copies are used without asking the server at all.
+
+    Once the files take more than `max_size` bytes, the least recently used
+    ones are evicted. If the cache directory can not be written to, the
+    files are kept in a temporary directory, for this process only.
+    """
+
+    def __init__(self, directory=None, max_size=DEFAULT_HTTP_CACHE_SIZE):
+        self.max_size = max_size
+        self._temporary = None
+        if directory is None:
+            try:
+                directory = cache_dir("http")
+            except OSError:
+                directory = None
+            if directory is None or not os.access(directory, os.W_OK):
+                self._temporary = tempfile.TemporaryDirectory(prefix="fontbakery-http-")
+                directory = self._temporary.name
+        self.directory = directory
+
+    def _paths(self, url):
+        key = digest(url)
+        entry = os.path.join(self.directory, key[:2], key)
+        return entry + ".json", entry + ".body"
+
+    @staticmethod
+    def _reuse(body_path):
+        """Mark a stored file as recently used, and return its path."""
+        try:
+            os.utime(body_path)
+        except OSError:
+            pass
+        return body_path
+
+    def _evict(self):
+        entries = []
+        total = 0
+        for parent in os.scandir(self.directory):
+            if not parent.is_dir():
+                continue
+            for entry in os.scandir(parent.path):
+                if not entry.name.endswith(".body"):
+                    continue
+                stat = entry.stat()
+                entries.append((stat.st_mtime_ns, stat.st_size, entry.path))
+                total += stat.st_size
+        for _, size, body_path in sorted(entries):
+            if total <= self.max_size:
+                break
+            headers_path = body_path[: -len(".body")] + ".json"
+            for path in (headers_path, body_path):
+                try:
+                    os.unlink(path)
+                except FileNotFoundError:
+                    pass
+            total -= size
+
+    def fetch(self, url, timeout=10, offline=False) -> str:
+        """The path of a file holding the contents of the URL, downloaded
+        if it changed since it was last downloaded. Raises ``NotCached`` if
+        `offline` and the URL was never downloaded before, and the errors of
+        ``requests`` if it can not be downloaded and there is no copy."""
+        import requests
+
+        headers_path, body_path = self._paths(url)
+        try:
+            with open(headers_path, "rb") as f:
+                validators = json.load(f)
+        except (OSError, ValueError):
+            validators = None
+        if validators is not None and not os.path.exists(body_path):
+            validators = None
+
+        if offline:
+            if validators is None:
+                raise NotCached(f"{url} was never downloaded.")
+            return self._reuse(body_path)
+
+        request_headers = {}
+        if validators is not None:
+            if validators.get("etag"):
+                request_headers["If-None-Match"] = validators["etag"]
+            if validators.get("last_modified"):
+                request_headers["If-Modified-Since"] = validators["last_modified"]
+        try:
+            with http_session().get(
+                url, headers=request_headers, timeout=timeout, stream=True
+            ) as response:
+                if response.status_code == 304 and validators is not None:
+                    return self._reuse(body_path)
+                if response.status_code >= 500 and validators is not None:
+                    # The server is in trouble: use the copy we have.
+                    return self._reuse(body_path)
+                response.raise_for_status()
+                self._store(response, headers_path, body_path)
+        except (requests.ConnectionError, requests.Timeout):
+            if validators is None:
+                raise
+            return self._reuse(body_path)
+        try:
+            self._evict()
+        except OSError:
+            # Another process evicting files at the same time
+            pass
+        return body_path
+
+    @staticmethod
+    def _store(response, headers_path, body_path):
+        directory = os.path.dirname(body_path)
+        os.makedirs(directory, exist_ok=True)
+        fd, temporary = tempfile.mkstemp(dir=directory, prefix=".tmp-")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                for chunk in response.iter_content(chunk_size=1 << 16):
+                    f.write(chunk)
+            os.replace(temporary, body_path)
+        except BaseException:
+            os.unlink(temporary)
+            raise
+        validators = {
+            "url": response.url,
+            "etag": response.headers.get("ETag"),
+            "last_modified": response.headers.get("Last-Modified"),
+        }
+        write_atomically(headers_path, json.dumps(validators).encode("utf-8"))
+
+    def get(self, url, timeout=10, offline=False) -> bytes:
+        """The contents of the URL (see ``fetch``)."""
+        with open(self.fetch(url, timeout, offline), "rb") as f:
+            return f.read()
+
+    def prefetch(self, urls, timeout=10, offline=False, max_workers=8) -> List[str]:
+        """Fetch several URLs at once, such as all the files of a family.
+        Returns the paths of their contents, in the order of the URLs."""
+        urls = list(urls)
+        if len(urls) <= 1:
+            return [self.fetch(url, timeout, offline) for url in urls]
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(urls))) as executor:
+            return list(
+                executor.map(lambda url: self.fetch(url, timeout, offline), urls)
+            )
+
+
+@functools.lru_cache(maxsize=1)
+def http_cache():
+    """The cache of downloads shared by the checks of this process."""
+    return HTTPCache()
+
+
+class LinkStatus(NamedTuple):
+    url: str
+    # None if the server did not answer
+    status_code: Optional[int] = None
+    # "timeout", or the error of a request which got no answer
+    error: Optional[str] = None
+
+    @property
+    def ok(self):
+        # "Too Many Requests" means the site is probably fine, and that we
+        # are just probing it too aggressively.
+        return self.status_code in (200, 429)
+
+
+class LinkChecker:
+    """The statuses of links: those of HEAD requests to them, following
+    redirects.
+
+    Links are checked by a few threads at once, while the thread asking for
+    them can go on with other work: ``submit`` returns a future of the
+    status. Each link is only checked once in a run (by the checks of all
+    fonts asking for it), and the statuses are kept on disk for ``ttl``
+    seconds, a day by default. That is, unless they may well be different
+    when asking again: timeouts, errors, 429 and 5xx statuses are not kept.
+    If the cache directory can not be created, the statuses are only kept
+    in memory.
+    """
+
+    # How long the statuses checked by this process are reused for, so that
+    # they are reused within a run, but not forever by a long-running server
+    RECHECK_AFTER = 600
+
+    def __init__(self, directory=None, ttl=24 * 3600, max_workers=8):
+        if directory is None:
+            try:
+                directory = cache_dir("links")
+            except OSError:
+                directory = None
+        self._cache = None if directory is None else JSONCache(directory)
+        self.ttl = ttl
+        self.max_workers = max_workers
+        self._lock = threading.Lock()
+        self._reset()
+
+    def _reset(self):
+        self._pid = os.getpid()
+        self._executor = ThreadPoolExecutor(
+            max_workers=self.max_workers, thread_name_prefix="fontbakery-links"
+        )
+        # (future, when it was submitted), by URL and timeout
+        self._submitted = {}
+
+    def submit(self, url, timeout=10) -> "Future[LinkStatus]":
+        """Start checking a link, unless it is already being checked."""
+        now = time.monotonic()
+        with self._lock:
+            if os.getpid() != self._pid:
+                # A forked worker process, which does not have the threads.
+                self._reset()
+            future, submitted = self._submitted.get((url, timeout), (None, 0))
+            if future is None or now - submitted > self.RECHECK_AFTER:
+                future = self._executor.submit(self._check, url, timeout)
+                self._submitted[(url, timeout)] = (future, now)
+            return future
+
+    def status(self, url, timeout=10) -> LinkStatus:
+        return self.submit(url, timeout).result()
+
+    def statuses(self, urls, timeout=10) -> Dict[str, LinkStatus]:
+        """Check several links at once."""
+        futures = {url: self.submit(url, timeout) for url in urls}
+        return {url: future.result() for url, future in futures.items()}
+
+    def _check(self, url, timeout):
+        import requests
+
+        key = digest("HEAD", url)
+        cached = None if self._cache is None else self._cache.get(key)
+        if cached is not None and time.time() - cached["checked"] < self.ttl:
+            return LinkStatus(url, cached["status_code"])
+
+        try:
+            response = http_session().head(url, allow_redirects=True, timeout=timeout)
+        except requests.Timeout:
+            return LinkStatus(url, error="timeout")
+        except requests.RequestException as error:
+            return LinkStatus(url, error=str(error) or type(error).__name__)
+
+        status = LinkStatus(url, response.status_code)
+        if (
+            self._cache is not None
+            and status.status_code != 429
+            and status.status_code < 500
+        ):
+            try:
+                self._cache.put(
+                    key, {"status_code": status.status_code, "checked": time.time()}
+                )
+            except OSError:
+                pass
+        return status
+
+
+@functools.lru_cache(maxsize=1)
+def link_checker():
+    """The link checker shared by the checks of this process."""
+    return LinkChecker()
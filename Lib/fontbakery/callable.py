@@ -11,11 +11,16 @@ Domain specific knowledge should be encoded only in the Profile (Checks,
 Conditions) and MAYBE in *customized* reporters e.g. subclasses.
 
 """
+import ast
 import inspect
+import textwrap
 
-from functools import update_wrapper, cached_property
+from functools import update_wrapper, cached_property, lru_cache
 from typing import Callable
 
+from fontbakery.profiling import measured_condition
+from fontbakery.testable import CheckRunContext
+
 
 class FontbakeryCallable:
     __wrapped__: Callable
@@ -208,19 +213,101 @@ class FontBakeryCheck(FontbakeryCallable):
     #  return self.id
 
 
-def condition(cls):
+class shared_condition(cached_property):
+    """A condition whose value only depends on one attribute of the object
+    it is attached to (its "key"), such as the directory of a font.
+
+    The value is computed once per key in a check run context, by the first
+    object asking for it, and every other object of the context with the
+    same key gets the same value. Objects without a context, or with a mock
+    one, compute their own, like any other condition.
+    """
+
+    def __init__(self, func, shared_by):
+        super().__init__(func)
+        self.shared_by = shared_by
+
+    def __get__(self, instance, owner=None):
+        if instance is None:
+            return self
+        context = getattr(instance, "context", None)
+        if not isinstance(context, CheckRunContext):
+            # No context, or a mock one (see fontbakery.codetesting)
+            return super().__get__(instance, owner)
+        value = context.shared_value(
+            self.attrname,
+            getattr(instance, self.shared_by),
+            lambda: self.func(instance),
+        )
+        instance.__dict__[self.attrname] = value
+        return value
+
+
+def condition(cls, shared_by=None):
+    """Add the decorated function to the class as a condition, a property
+    which is only computed once for each object.
+
+    With ``shared_by``, the name of an attribute of the class (e.g.
+    ``"family_directory"``), the condition is declared to only depend on
+    the value of that attribute, and is computed once for all the objects
+    which have the same value. See ``shared_condition``.
+    """
     if not inspect.isclass(cls):
         raise TypeError(f"Condition {cls.__name__} must be added to a class")
 
     def decorator(*args, **kwds):
         func = args[0]
-        prop = cached_property(func)
+        if shared_by is None:
+            prop = cached_property(measured_condition(func))
+        else:
+            prop = shared_condition(measured_condition(func), shared_by)
         prop.__set_name__(cls, func.__name__)
         setattr(cls, func.__name__, prop)
 
     return decorator
 
 
+@lru_cache(maxsize=None)
+def attribute_paths(func):
+    """Find the attributes that a condition reads from the object it is
+    attached to, by looking at its source code. For a condition written as
+    ``def my_condition(font)``, the expression ``font.ttFont`` gives the path
+    ``("ttFont",)`` and ``font.context.network`` gives ``("context", "network")``.
+
+    This is a best effort static analysis: attributes which are accessed
+    dynamically, e.g. with ``getattr``, are not found.
+    """
+    try:
+        tree = ast.parse(textwrap.dedent(inspect.getsource(func)))
+    except (OSError, TypeError, SyntaxError):
+        return ()
+
+    funcdef = next(
+        (
+            node
+            for node in ast.walk(tree)
+            if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef))
+        ),
+        None,
+    )
+    if funcdef is None or not funcdef.args.args:
+        return ()
+    param = funcdef.args.args[0].arg
+
+    def is_param(node):
+        return isinstance(node, ast.Name) and node.id == param
+
+    paths = []
+    for node in ast.walk(funcdef):
+        if not isinstance(node, ast.Attribute):
+            continue
+        if is_param(node.value):
+            paths.append((node.attr,))
+        elif isinstance(node.value, ast.Attribute) and is_param(node.value.value):
+            paths.append((node.value.attr, node.attr))
+    return tuple(dict.fromkeys(paths))
+
+
 def check(*args, **kwds):
     """Check wrapper, a factory for FontBakeryCheck
 
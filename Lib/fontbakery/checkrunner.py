@@ -14,10 +14,20 @@ Conditions) and MAYBE in *customized* reporters e.g. subclasses.
 
 from collections import OrderedDict
 import concurrent.futures
+from contextlib import nullcontext
+from functools import cached_property
 import inspect
+import logging
+import multiprocessing
+import os
 import threading
+import time
 from typing import Union, Tuple
+import warnings
 
+from fontbakery import __version__, reference_data
+from fontbakery.cache import digest, file_digest
+from fontbakery.callable import attribute_paths
 from fontbakery.configuration import Configuration
 from fontbakery.result import (
     CheckResult,
@@ -25,7 +35,9 @@ from fontbakery.result import (
     Identity,
 )
 from fontbakery.message import Message
+from fontbakery.profiling import profiling
 from fontbakery.utils import is_negated, format_error
+from fontbakery.testable import Font
 from fontbakery.status import (
     Status,
     ERROR,
@@ -36,6 +48,82 @@ from fontbakery.status import (
 from fontbakery.legacy_checkids import renaming_map as old_to_new
 
 
+EXECUTORS = ("threads", "processes")
+
+# The conditions which the results of the checks using them can not be
+# cached for: those which use the network, and those which read files
+# outside of the family directory (see CheckRunner._directory_digest), such
+# as the fonts of sibling families and the licenses at the root of a repo.
+UNCACHEABLE_CONDITIONS = {"network", "sibling_directories", "licenses"}
+
+# The runner (and its precomputed order) that the workers of a process pool
+# operate on. It is set in the parent right before the pool forks, so every
+# worker inherits it without having to pickle profiles, checks or fonts.
+_worker_state = None
+
+
+def _run_batch(indexes):
+    """Run the identities at the given positions of the runner's order inside
+    a process pool worker and return only picklable data: the position of
+    each identity together with its list of subresults."""
+    runner, order = _worker_state
+    identities = [order[index] for index in indexes]
+    runner._precompute_conditions(
+        identities,
+        providers={id(runner.context)}
+        | {id(runner._testable(*item)) for item in identities[0].iterargs},
+    )
+    profiler = runner.profiler
+    first_measurement = len(profiler.measurements) if profiler else 0
+    payloads = []
+    for index in indexes:
+        result = runner._run_check(order[index])
+        for subresult in result.results:
+            message = subresult.message
+            if not isinstance(message.message, str):
+                message.message = str(message.message)
+        payloads.append((index, result.results))
+    measurements = profiler.measurements[first_measurement:] if profiler else []
+    return (
+        payloads,
+        runner.legacy_checkid_references,
+        runner.check_costs,
+        runner.condition_costs,
+        measurements,
+    )
+
+
+def _run_and_write(runner, reporters, executor=None):
+    runner.run(reporters, executor)
+    for reporter in reporters:
+        reporter.write()
+
+
+def run_concurrently(runs, jobs):
+    """Run several check runners, given as (runner, reporters) pairs, on a
+    single pool of `jobs` worker threads. The reports of each runner are
+    written as soon as it is done.
+
+    Up to `jobs` runners are in progress at the same time, so that workers
+    which are done with the checks of one runner move on to the checks of
+    the next ones, instead of waiting for the slowest check of each runner
+    before the next one starts.
+    """
+    if jobs <= 1:
+        for runner, reporters in runs:
+            _run_and_write(runner, reporters)
+        return
+
+    with concurrent.futures.ThreadPoolExecutor(max_workers=jobs) as executor:
+        with concurrent.futures.ThreadPoolExecutor(max_workers=jobs) as drivers:
+            futures = [
+                drivers.submit(_run_and_write, runner, reporters, executor)
+                for runner, reporters in runs
+            ]
+            for future in futures:
+                future.result()
+
+
 class CheckRunner:
     def __init__(
         self,
@@ -43,6 +131,10 @@ class CheckRunner:
         context,
         config,
         jobs=0,
+        executor="threads",
+        result_cache=None,
+        profiler=None,
+        cost_history=None,
     ):
         # TODO: transform all iterables that are list like to tuples
         # to make sure that they won't change anymore.
@@ -55,6 +147,11 @@ class CheckRunner:
         self._exclude_checks = config.get("exclude_checks")
         self._iterargs = OrderedDict()
         self._jobs = jobs
+        if executor not in EXECUTORS:
+            raise ValueError(
+                f"Unknown executor '{executor}', must be one of: {', '.join(EXECUTORS)}"
+            )
+        self._executor = executor
         # self._iterargs is the *count of each type of thing*.
         for singular, plural in profile.iterargs.items():
             # self._iterargs["fonts"] = len(values.fonts)
@@ -68,6 +165,34 @@ class CheckRunner:
         for testable in self.context.testables:
             testable.context = self.context
 
+        # The names provided by the context and each testable, by object id.
+        self._provided_names = {}
+        self._dependency_cache = {}
+        self._iterargs_by_provider = {id(self.context): ()}
+        for singular, testables in self.context.testables_by_type.items():
+            for index, testable in enumerate(testables):
+                self._iterargs_by_provider[id(testable)] = ((singular, index),)
+        # Seconds spent computing each condition, by (name, iterargs)
+        self.condition_costs = {}
+        # Seconds spent running each check, by (check id, iterargs)
+        self.check_costs = {}
+        # A fontbakery.cache.CostHistory, to start the checks (and compute
+        # the conditions) which took longest in earlier runs first, and to
+        # record the costs of this run in.
+        self.cost_history = cost_history
+        # A fontbakery.cache.ResultCache, if results are to be reused
+        # between runs.
+        self.result_cache = result_cache
+        self._file_digests = {}
+        self._result_cache_keys = {}
+        # A fontbakery.profiling.Profiler, if the run is to be profiled.
+        self.profiler = profiler
+        if profiler is not None:
+            for provider, iterargs in self._iterargs_by_provider.items():
+                profiler.subjects[provider] = (
+                    self.get_iterarg(*iterargs[0]) if iterargs else ""
+                )
+
         self.legacy_checkid_references = set()
         self.new_to_old = {}
         for old_id, new_id in old_to_new.items():
@@ -119,17 +244,27 @@ class CheckRunner:
         """Used by e.g. reporters"""
         return self.context.testables_by_type[name][index].file_displayname
 
+    def _provides(self, thing, name):
+        """Whether the context or a testable has an attribute called `name`."""
+        names = self._provided_names.get(id(thing))
+        if names is None:
+            names = self._provided_names[id(thing)] = frozenset(dir(thing))
+        return name in names
+
+    def _testable(self, thing, index):
+        return self.context.testables_by_type[thing][index]
+
     def _get(self, name, iterargs, condition=False):
         # Is this a property of the whole collection?
-        if name in dir(self.context):
+        if self._provides(self.context, name):
             return getattr(self.context, name)
         # Is it a property of the file we're testing?
         for thing, index in iterargs:
-            specific_thing = self.context.testables_by_type[thing][index]
+            specific_thing = self._testable(thing, index)
             # Allow "font" to return the Font object itself
             if name == thing:
                 return specific_thing
-            if name not in dir(specific_thing):
+            if not self._provides(specific_thing, name):
                 continue
             return getattr(specific_thing, name)
         if condition:
@@ -139,6 +274,232 @@ class CheckRunner:
             f"This can't happen: asked for {name} but nothing provides it."
         )
 
+    def _condition_provider(self, name, iterargs):
+        """The object on which `_get` would look up `name`, if the name
+        refers to a condition (i.e. a cached property), otherwise None."""
+        if self._provides(self.context, name):
+            provider = self.context
+        else:
+            provider = None
+            for thing, index in iterargs:
+                if name == thing:
+                    return None
+                specific_thing = self._testable(thing, index)
+                if self._provides(specific_thing, name):
+                    provider = specific_thing
+                    break
+        if provider is not None and self._is_condition(type(provider), name):
+            return provider
+        return None
+
+    @staticmethod
+    def _is_condition(owner, name):
+        return isinstance(getattr(owner, name, None), cached_property)
+
+    def _dependencies(self, cls, name, _seen=None):
+        """Statically determine what the condition (or property) `name` of
+        class `cls` is using. Returns a set of tuples, which are one of:
+
+        - ("self", other_name): another condition on the same object
+        - ("context", other_name): a condition of the check run context
+        - ("testables", singular): all testables of a kind, e.g. when a
+          condition of the context iterates over ``context.fonts``
+        """
+        key = (cls, name)
+        if key in self._dependency_cache:
+            return self._dependency_cache[key]
+
+        _seen = _seen or set()
+        _seen.add(key)
+        prop = getattr(cls, name, None)
+        if isinstance(prop, cached_property):
+            func = prop.func
+        elif isinstance(prop, property):
+            func = prop.fget
+        else:
+            return set()
+
+        plurals = {
+            plural: singular for singular, plural in self.profile.iterargs.items()
+        }
+        dependencies = set()
+        for path in attribute_paths(func):
+            if path[0] == "context" and len(path) == 2:
+                dependencies.add(("context", path[1]))
+            elif len(path) != 1:
+                continue
+            elif path[0] in plurals and cls is type(self.context):
+                dependencies.add(("testables", plurals[path[0]]))
+            elif path[0] == "testables" and cls is type(self.context):
+                dependencies.update(
+                    ("testables", singular) for singular in plurals.values()
+                )
+            elif (cls, path[0]) not in _seen:
+                if self._is_condition(cls, path[0]):
+                    dependencies.add(("self", path[0]))
+                # Follow through to whatever this one is using as well
+                dependencies.update(self._dependencies(cls, path[0], _seen))
+
+        self._dependency_cache[key] = dependencies
+        return dependencies
+
+    def _conditions_fulfilled(self, identity):
+        for condition in identity.check.conditions:
+            negate, name = is_negated(condition)
+            try:
+                val = bool(self._get(name, identity.iterargs, condition=True))
+            except Exception:
+                return False
+            if val == negate:
+                return False
+        return True
+
+    def _needed_conditions(self, identities, stage, providers=None):
+        """The conditions needed by the given identities, as a dict of
+        (provider id, name) => (provider, name).
+
+        On the "conditions" stage, those are the conditions a check declares.
+        On the "args" stage, those are the conditions which are passed as
+        arguments to checks whose declared conditions are fulfilled; checks
+        that will be skipped don't need anything else to be computed.
+        """
+        needed = {}
+        for identity in identities:
+            if stage == "conditions":
+                names = [is_negated(c)[1] for c in identity.check.conditions]
+            else:
+                owned = all(
+                    providers is None or id(self._testable(*item)) in providers
+                    for item in identity.iterargs
+                )
+                if not owned or not self._conditions_fulfilled(identity):
+                    continue
+                names = identity.check.args
+            for name in names:
+                provider = self._condition_provider(name, identity.iterargs)
+                if provider is not None:
+                    needed[(id(provider), name)] = (provider, name)
+        return needed
+
+    def _condition_waves(self, needed):
+        """Sort the needed conditions into "waves": the conditions of a wave
+        only depend on conditions of earlier waves, so the conditions of each
+        provider in a wave can be computed in parallel with the ones of the
+        other providers.
+
+        Conditions of the context used by the needed conditions are added to
+        the plan, so that they are computed upfront rather than concurrently
+        from within several conditions of different testables.
+
+        Returns a list of dicts of provider id => (provider, [names]).
+        """
+        nodes = dict(needed)
+        edges = {}
+        pending = list(nodes)
+        while pending:
+            key = pending.pop()
+            provider, name = nodes[key]
+            edges[key] = set()
+            for kind, value in self._dependencies(type(provider), name):
+                if kind == "context" and self._is_condition(type(self.context), value):
+                    dependency = (id(self.context), value)
+                    if dependency not in nodes:
+                        nodes[dependency] = (self.context, value)
+                        pending.append(dependency)
+                    edges[key].add(dependency)
+                elif kind == "self":
+                    edges[key].add((id(provider), value))
+                elif kind == "testables":
+                    for testable in self.context.testables_by_type.get(value, []):
+                        edges[key].update(
+                            other for other in nodes if other[0] == id(testable)
+                        )
+
+        levels = {}
+
+        def level(key, stack):
+            if key not in levels:
+                stack.add(key)
+                levels[key] = 1 + max(
+                    (
+                        level(dependency, stack)
+                        for dependency in edges.get(key, ())
+                        if dependency in nodes and dependency not in stack
+                    ),
+                    default=-1,
+                )
+                stack.discard(key)
+            return levels[key]
+
+        waves = []
+        for key in nodes:
+            wave = level(key, set())
+            while len(waves) <= wave:
+                waves.append(OrderedDict())
+            provider, name = nodes[key]
+            waves[wave].setdefault(key[0], (provider, []))[1].append(name)
+        return waves
+
+    def _profiling(self):
+        """Have the conditions computed in this thread measured, if the
+        run is profiled."""
+        if self.profiler is None:
+            return nullcontext()
+        return profiling(self.profiler)
+
+    def _compute_conditions(self, provider, names):
+        with self._profiling():
+            self._compute_conditions_unprofiled(provider, names)
+
+    def _compute_conditions_unprofiled(self, provider, names):
+        iterargs = self._iterargs_by_provider.get(id(provider), ())
+        for name in names:
+            if name in vars(provider):
+                # Already computed, e.g. from within another condition.
+                continue
+            start = time.perf_counter()
+            try:
+                getattr(provider, name)
+            except Exception:
+                # The checks which need this condition will report the error.
+                continue
+            cost = time.perf_counter() - start
+            self.condition_costs[(name, iterargs)] = cost
+            logging.debug("Computed condition %s%s in %.3fs", name, iterargs, cost)
+
+    def _precompute_conditions(self, identities, executor=None, providers=None):
+        """Compute, once and in dependency order, all the conditions that the
+        given identities need, before running any check.
+
+        If an executor is given, the conditions of different providers are
+        computed in parallel. If `providers` (a set of object ids) is given,
+        only conditions of those providers are computed.
+        """
+        for stage in ("conditions", "args"):
+            needed = self._needed_conditions(identities, stage, providers)
+            for wave in self._condition_waves(needed):
+                batches = [
+                    batch
+                    for key, batch in wave.items()
+                    if providers is None or key in providers
+                ]
+                if executor is None:
+                    for batch in batches:
+                        self._compute_conditions(*batch)
+                else:
+                    if self.cost_history is not None:
+                        batches.sort(
+                            key=lambda batch: sum(
+                                map(self.cost_history.condition, batch[1])
+                            ),
+                            reverse=True,
+                        )
+                    list(
+                        executor.map(
+                            lambda batch: self._compute_conditions(*batch), batches
+                        )
+                    )
+
     def _get_check_dependencies(
         self, identity: Identity
     ) -> Union[
@@ -198,7 +559,186 @@ class CheckRunner:
             )
             return (status, None)
 
+    def _file_digest(self, path):
+        if path not in self._file_digests:
+            self._file_digests[path] = file_digest(path)
+        return self._file_digests[path]
+
+    def _directory_digest(self, directory):
+        """A digest of the names and contents of the files of a family
+        directory and of its subdirectories (but not deeper), which the
+        conditions and checks of its fonts read: METADATA.pb, DESCRIPTION,
+        the article, upstream.yaml, licenses, the other fonts..."""
+        key = ("directory", directory)
+        if key not in self._file_digests:
+            entries = []
+            for entry in sorted(os.listdir(directory)):
+                path = os.path.join(directory, entry)
+                if entry.startswith("."):
+                    continue
+                if os.path.isfile(path):
+                    entries.append((entry, self._file_digest(path)))
+                elif os.path.isdir(path):
+                    entries.append(
+                        (
+                            entry,
+                            [
+                                (name, self._file_digest(os.path.join(path, name)))
+                                for name in sorted(os.listdir(path))
+                                if not name.startswith(".")
+                                and os.path.isfile(os.path.join(path, name))
+                            ],
+                        )
+                    )
+            self._file_digests[key] = digest(entries)
+        return self._file_digests[key]
+
+    def _testable_digest(self, testable):
+        """A digest of the path and contents of a testable and, for fonts,
+        of the files of their family directory."""
+        parts = [
+            type(testable).__name__,
+            os.path.abspath(testable.file),
+            self._file_digest(testable.file),
+        ]
+        if isinstance(testable, Font):
+            parts.append(self._directory_digest(testable.family_directory))
+        return digest(*parts)
+
+    def _result_cache_key(self, identity: Identity):
+        """A digest of everything the result of the identity depends on, or
+        None if it must not be cached because it depends on the network or
+        on files outside of the family directory (UNCACHEABLE_CONDITIONS).
+
+        That is: the fontbakery version, the check id, the source code of
+        the modules defining the check and the conditions it uses, the
+        check's overrides and its configuration, and the paths and contents
+        of the files it runs on, together with the files of the family
+        directories of fonts. A check which uses anything from the whole
+        collection depends on all its files.
+        """
+        cache_key = identity.key
+        if cache_key in self._result_cache_keys:
+            return self._result_cache_keys[cache_key]
+
+        check = identity.check
+        context_type = type(self.context)
+        whole_context = False
+        uncacheable = False
+        pending = []
+        for name in check.args + tuple(is_negated(c)[1] for c in check.conditions):
+            if name in self.profile.iterargs or name == "config":
+                # The testables themselves are hashed, and the configuration
+                # is part of the key, below.
+                continue
+            if self._provides(self.context, name):
+                whole_context = True
+                pending.append((context_type, name))
+            else:
+                owner = self._condition_provider(name, identity.iterargs)
+                if owner is not None:
+                    pending.append((type(owner), name))
+
+        modules = {inspect.getmodule(check.__wrapped__)}
+        seen = set()
+        while pending:
+            owner, name = pending.pop()
+            if (owner, name) in seen:
+                continue
+            seen.add((owner, name))
+            uncacheable = uncacheable or name in UNCACHEABLE_CONDITIONS
+            if self._is_condition(owner, name):
+                modules.add(inspect.getmodule(getattr(owner, name).func))
+            for kind, other in self._dependencies(owner, name):
+                if kind == "self":
+                    pending.append((owner, other))
+                else:
+                    whole_context = True
+                    if kind == "context":
+                        pending.append((context_type, other))
+
+        key = None
+        if not uncacheable:
+            sources = []
+            for module in sorted(modules, key=lambda m: m.__name__):
+                try:
+                    sources.append(inspect.getsource(module))
+                except (OSError, TypeError):
+                    sources.append(module.__name__)
+
+            if "config" in check.args:
+                config = {
+                    k: v
+                    for k, v in self.config.items()
+                    if k not in ("explicit_checks", "exclude_checks", "custom_order")
+                }
+            else:
+                config = {
+                    k: v
+                    for k, v in self.config.items()
+                    if k == check.id or not isinstance(v, dict)
+                }
+                config.pop("explicit_checks", None)
+                config.pop("exclude_checks", None)
+                config.pop("custom_order", None)
+            overrides = (
+                self.profile.overrides.get(check.id),
+                self.config.get("overrides", {}).get(check.id),
+            )
+
+            if whole_context:
+                testables = self.context.testables
+            else:
+                testables = [self._testable(*item) for item in identity.iterargs]
+            contents = [self._testable_digest(testable) for testable in testables]
+            key = digest(
+                __version__,
+                check.id,
+                identity.iterargs,
+                digest(*sources),
+                config,
+                overrides,
+                contents,
+            )
+        self._result_cache_keys[cache_key] = key
+        return key
+
+    def _cached_result(self, identity: Identity):
+        """The result of the identity from the result cache, or None."""
+        key = self._result_cache_key(identity)
+        if key is None:
+            return None
+        subresults = self.result_cache.get_subresults(key)
+        if subresults is None:
+            return None
+        result = CheckResult(identity=identity)
+        result.extend(subresults)
+        return result
+
     def _run_check(self, identity: Identity):
+        start = time.perf_counter()
+        if self.profiler is None:
+            result = self._run_check_uncached(identity)
+        else:
+            subject = (
+                self.get_iterarg(*identity.iterargs[0]) if identity.iterargs else ""
+            )
+            with self._profiling(), self.profiler.measure(
+                "check", identity.check.id, subject
+            ):
+                result = self._run_check_uncached(identity)
+        self.check_costs[(identity.check.id, identity.iterargs)] = (
+            time.perf_counter() - start
+        )
+        if self.result_cache is not None and all(
+            subresult.status != ERROR for subresult in result.results
+        ):
+            key = self._result_cache_key(identity)
+            if key is not None:
+                self.result_cache.put_subresults(key, result.results)
+        return result
+
+    def _run_check_uncached(self, identity: Identity):
         result = CheckResult(identity=identity)
 
         # Do we skip this check because of dependencies?
@@ -282,7 +822,9 @@ class CheckRunner:
                                 continue
 
                 args = set(check.args)
-                context_args = set(arg for arg in args if arg in dir(self.context))
+                context_args = set(
+                    arg for arg in args if self._provides(self.context, arg)
+                )
 
                 # Either this is a check which runs on the whole collection
                 # (i.e. all of its arguments can be called as methods on the
@@ -296,7 +838,7 @@ class CheckRunner:
                     individual_args = args - context_args
                     if (
                         all(
-                            arg in dir(file)
+                            self._provides(file, arg)
                             for arg in individual_args
                             for file in files
                         )
@@ -307,32 +849,173 @@ class CheckRunner:
                             _order.append(Identity(section, check, ((singular, i),)))
         return tuple(_order)
 
-    def run(self, reporters):
+    @staticmethod
+    def _batches_by_testable(order):
+        """Group the positions in `order` by the testable they run on, so that
+        a single worker gets to run all the checks for a given file (and thus
+        computes each of its conditions only once). Checks that run on the
+        whole collection form a batch of their own."""
+        batches = OrderedDict()
+        for index, identity in enumerate(order):
+            batches.setdefault(identity.iterargs, []).append(index)
+        return list(batches.values())
+
+    def _expected_cost(self, identities):
+        """The seconds that running the identities took in earlier runs,
+        including the conditions they use."""
+        if self.cost_history is None:
+            return 0.0
+        names = set()
+        cost = 0.0
+        for identity in identities:
+            check = identity.check
+            cost += self.cost_history.check(check.id)
+            names.update(check.args)
+            names.update(is_negated(c)[1] for c in check.conditions)
+        return cost + sum(map(self.cost_history.condition, names))
+
+    def _longest_first(self, order):
+        """The identities of `order`, with those expected to take longest
+        first, so that the slowest checks don't start last and leave a long
+        tail with only a few workers busy. The order is kept among checks of
+        the same cost (and altogether if there's no cost history)."""
+        if self.cost_history is None:
+            return order
+        costs = {
+            check_id: self._expected_cost([identity])
+            for check_id, identity in {i.check.id: i for i in order}.items()
+        }
+        return sorted(order, key=lambda identity: -costs[identity.check.id])
+
+    def _run_in_processes(self, order, distribute_result):
+        global _worker_state  # pylint: disable=global-statement
+
+        mp_context = multiprocessing.get_context("fork")
+        _worker_state = (self, order)
+        # Conditions of the whole collection are computed before forking,
+        # so that the workers inherit them instead of each computing them.
+        self._precompute_conditions(order, providers={id(self.context)})
+        # And so is the reference data that the modules of the checks use.
+        reference_data.preload(
+            *reference_data.datasets_used_by(
+                {inspect.getmodule(identity.check.__wrapped__) for identity in order}
+            )
+        )
+        try:
+            with concurrent.futures.ProcessPoolExecutor(
+                max_workers=self._jobs, mp_context=mp_context
+            ) as executor:
+                batches = sorted(
+                    self._batches_by_testable(order),
+                    key=lambda batch: self._expected_cost([order[i] for i in batch]),
+                    reverse=True,
+                )
+                futures = [executor.submit(_run_batch, batch) for batch in batches]
+                for future in concurrent.futures.as_completed(futures):
+                    (
+                        payloads,
+                        legacy_checkid_references,
+                        check_costs,
+                        condition_costs,
+                        measurements,
+                    ) = future.result()
+                    self.legacy_checkid_references.update(legacy_checkid_references)
+                    self.check_costs.update(check_costs)
+                    self.condition_costs.update(condition_costs)
+                    if self.profiler is not None:
+                        self.profiler.measurements.extend(measurements)
+                    for index, subresults in payloads:
+                        result = CheckResult(identity=order[index])
+                        result.extend(subresults)
+                        distribute_result(result)
+        finally:
+            _worker_state = None
+
+    def _run_in_threads(self, order, distribute_result, executor):
+        def run_check(identity):
+            distribute_result(self._run_check(identity))
+
+        self._precompute_conditions(order, executor=executor)
+        futures = [
+            executor.submit(run_check, identity)
+            for identity in self._longest_first(order)
+        ]
+        for future in futures:
+            future.result()
+
+    def run(self, reporters, executor=None):
+        """Run the checks and send their results to the reporters.
+
+        If a thread pool executor is given, the checks run on it instead of
+        on a pool of this runner's own, which lets several runners share
+        the same workers (see `run_concurrently`).
+
+        Whichever order the checks run in, the reporters receive their
+        results in the order of `self.order`.
+        """
+        order = self.order
         # Tell all the reporters we're starting
         for reporter in reporters:
-            reporter.start(self.order)
+            reporter.start(order)
 
         reporter_lock = threading.Lock()
+        positions = {identity.key: index for index, identity in enumerate(order)}
+        # Results which came in before those of earlier identities, by position
+        early_results = {}
+        next_position = 0
 
         def distribute_result(result):
+            nonlocal next_position
             with reporter_lock:
-                for reporter in reporters:
-                    reporter.receive_result(result)
+                early_results[positions[result.identity.key]] = result
+                while next_position in early_results:
+                    result = early_results.pop(next_position)
+                    next_position += 1
+                    for reporter in reporters:
+                        reporter.receive_result(result)
 
-        if self._jobs > 1:
-            with concurrent.futures.ThreadPoolExecutor(
-                max_workers=self._jobs
-            ) as executor:
-                for identity in self.order:
-                    future = executor.submit(self._run_check, identity)
-                    future.add_done_callback(
-                        lambda future: distribute_result(future.result())
-                    )
+        if self.result_cache is not None:
+            # Replay what can be, and only run (and compute the conditions
+            # of) the remaining checks.
+            remaining = []
+            for identity in order:
+                result = self._cached_result(identity)
+                if result is None:
+                    remaining.append(identity)
+                else:
+                    distribute_result(result)
+            order = tuple(remaining)
+
+        backend = self._executor
+        if (
+            self._jobs > 1
+            and backend == "processes"
+            and "fork" not in multiprocessing.get_all_start_methods()
+        ):
+            warnings.warn(
+                "The 'processes' executor requires the 'fork' start method,"
+                " which is not available on this platform. Using threads instead."
+            )
+            backend = "threads"
+            # The fonts are now shared between the workers after all.
+            self.context.is_multithreaded = True
+
+        if executor is not None:
+            self._run_in_threads(order, distribute_result, executor)
+        elif self._jobs > 1 and backend == "processes":
+            self._run_in_processes(order, distribute_result)
+        elif self._jobs > 1:
+            with concurrent.futures.ThreadPoolExecutor(max_workers=self._jobs) as pool:
+                self._run_in_threads(order, distribute_result, pool)
         else:
-            for identity in self.order:
+            self._precompute_conditions(order)
+            for identity in order:
                 result = self._run_check(identity)
                 distribute_result(result)
 
+        if self.cost_history is not None:
+            self.cost_history.update(self.check_costs, self.condition_costs)
+
         # Tell all the reporters we're done
         for reporter in reporters:
             reporter.legacy_checkid_references = list(self.legacy_checkid_references)
@@ -1,5 +1,5 @@
 from fontbakery.prelude import FAIL, SKIP, WARN, Message, check
-from fontbakery.utils import get_glyph_name
+from fontbakery.utils import get_glyph_name, ReadOnlyGlyphSet
 
 
 @check(
@@ -22,7 +22,6 @@ from fontbakery.utils import get_glyph_name
 def check_arabic_high_hamza(ttFont):
     """Check that glyph for U+0674 ARABIC LETTER HIGH HAMZA is not a mark."""
     from fontTools.pens.areaPen import AreaPen
-    from copy import deepcopy
 
     ARABIC_LETTER_HAMZA = 0x0621
     ARABIC_LETTER_HIGH_HAMZA = 0x0674
@@ -51,22 +50,17 @@ def check_arabic_high_hamza(ttFont):
         )
         return
 
-    # This check modifies the font file with `.draw(pen)`
-    # so here we'll work with a copy of the object so that we
-    # do not affect other checks:
-    ttFont_copy = deepcopy(ttFont)
-
     # Also validate the bounding box of the glyph and compare
     # it to U+0621 expecting them to have roughly the same size
     # (within a certain tolerance margin)
-    glyph_set = ttFont_copy.getGlyphSet()
+    glyph_set = ReadOnlyGlyphSet(ttFont)
     area_pen = AreaPen(glyph_set)
 
-    glyph_set[get_glyph_name(ttFont_copy, ARABIC_LETTER_HAMZA)].draw(area_pen)
+    glyph_set[get_glyph_name(ttFont, ARABIC_LETTER_HAMZA)].draw(area_pen)
     hamza_area = area_pen.value
 
     area_pen.value = 0
-    glyph_set[get_glyph_name(ttFont_copy, ARABIC_LETTER_HIGH_HAMZA)].draw(area_pen)
+    glyph_set[get_glyph_name(ttFont, ARABIC_LETTER_HIGH_HAMZA)].draw(area_pen)
     high_hamza_area = area_pen.value
 
     if abs((high_hamza_area - hamza_area) / hamza_area) > 0.1:
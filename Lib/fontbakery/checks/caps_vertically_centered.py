@@ -1,4 +1,3 @@
-from fontTools.pens.boundsPen import BoundsPen
 from fontbakery.prelude import check, Message, PASS, WARN, SKIP
 
 
@@ -17,18 +16,12 @@ from fontbakery.prelude import check, Message, PASS, WARN, SKIP
     """,
     proposal="https://github.com/fonttools/fontbakery/issues/4139",
 )
-def check_caps_vertically_centered(ttFont):
+def check_caps_vertically_centered(ttFont, glyph_metrics):
     """Check if uppercase glyphs are vertically centered."""
 
-    from copy import deepcopy
-
-    ttFont_copy = deepcopy(ttFont)
-
     SOME_UPPERCASE_GLYPHS = ["A", "B", "C", "D", "E", "H", "I", "M", "O", "S", "T", "X"]
-    glyphSet = ttFont_copy.getGlyphSet()
-
     for glyphname in SOME_UPPERCASE_GLYPHS:
-        if glyphname not in glyphSet.keys():
+        if glyphname not in glyph_metrics:
             yield SKIP, Message(
                 "lacks-ascii",
                 "The implementation of this check relies on a few samples"
@@ -39,13 +32,11 @@ def check_caps_vertically_centered(ttFont):
     highest_point_list = []
     lowest_point_list = []
     for glyphName in SOME_UPPERCASE_GLYPHS:
-        pen = BoundsPen(glyphSet)
-        glyphSet[glyphName].draw(pen)
-        _, lowest_point, _, highest_point = pen.bounds
+        _, lowest_point, _, highest_point = glyph_metrics.bounds(glyphName)
         highest_point_list.append(highest_point)
         lowest_point_list.append(lowest_point)
 
-    upm = ttFont_copy["head"].unitsPerEm
+    upm = ttFont["head"].unitsPerEm
     line_spacing_factor = 1.20
     error_margin = (line_spacing_factor * upm) * 0.18
     average_cap_height = sum(highest_point_list) / len(highest_point_list)
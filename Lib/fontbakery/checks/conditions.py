@@ -8,14 +8,17 @@ from fontbakery.testable import (
     Designspace,
     Font,
     TTCFont,
+    ThreadSafeTTFont,
     Ufo,
 )
-from fontbakery.utils import get_glyph_name
+from fontbakery.utils import exit_with_install_instructions, get_glyph_name
 
 
 @condition(CheckRunContext)
 def network(collection):
-    return not collection.config["skip_network"]
+    return not collection.config["skip_network"] and not collection.config.get(
+        "offline"
+    )
 
 
 @condition(CheckRunContext)
@@ -226,7 +229,7 @@ def get_cjk_glyphs(font):
     return results
 
 
-@condition(Font)
+@condition(Font, shared_by="family_directory")
 def sibling_directories(font):
     """
     Given a directory, this function tries to figure out where else in the filesystem
@@ -258,7 +261,7 @@ def sibling_directories(font):
     return directories
 
 
-@condition(Font)
+@condition(Font, shared_by="family_directory")
 def superfamily(font):
     """
     Given a list of directories, this functions looks for font files
@@ -274,13 +277,19 @@ def superfamily(font):
     return result
 
 
-@condition(Font)
+@condition(Font, shared_by="family_directory")
 def superfamily_ttFonts(font):
     from fontTools.ttLib import TTFont
 
+    # Shared by all the fonts of the family, which may be checked in
+    # several threads at once.
+    if font.context is not None and font.context.is_multithreaded:
+        font_class = ThreadSafeTTFont
+    else:
+        font_class = TTFont
     result = []
     for family in font.superfamily:
-        result.append([TTFont(f) for f in family])
+        result.append([font_class(f) for f in family])
     return result
 
 
@@ -475,7 +484,7 @@ def cff_analysis(font):
     return analysis
 
 
-@condition(Font)
+@condition(Font, shared_by="family_directory")
 def licenses(font):
     """Get a list of paths for every license
     file found in a font project."""
@@ -526,23 +535,30 @@ def is_ofl(font):
 
 
 @condition(Font)
-def outlines_dict(font):
-    from beziers.path import BezierPath
+def glyph_metrics(font):
+    """Ink, bounds, area and contour count of each glyph, computed on first use."""
+    from fontbakery.glyph_metrics import FontGlyphMetrics
 
-    ttFont = font.ttFont
-    reversed_cmap = {v: k for k, v in ttFont.getBestCmap().items()}
+    return FontGlyphMetrics(font.ttFont)
 
-    def display_name(glyphname):
-        if glyphname in reversed_cmap:
-            return f"{glyphname} (U+{reversed_cmap[glyphname]:04X})"
-        return glyphname
 
-    return {
-        (glyphname, display_name(glyphname)): BezierPath.fromFonttoolsGlyph(
-            ttFont, glyphname
-        )
-        for glyphname in ttFont.getGlyphOrder()
-    }
+@condition(Font)
+def outlines(font):
+    """The outlines of all glyphs, with the geometry shared by the outline checks."""
+    from fontbakery.outlines import FontOutlines
+
+    return FontOutlines(font.ttFont)
+
+
+@condition(Font)
+def shaper(font):
+    """A HarfBuzz shaping service shared by all checks run on this font."""
+    try:
+        from fontbakery.shaper import Shaper
+    except ImportError:
+        exit_with_install_instructions("shaping")
+
+    return Shaper(font.file)
 
 
 @condition(Ufo)
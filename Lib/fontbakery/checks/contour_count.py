@@ -26,7 +26,7 @@ from fontbakery.utils import (
     """,
     proposal="https://github.com/fonttools/fontbakery/issues/4829",  # legacy check
 )
-def check_contour_count(ttFont, config):
+def check_contour_count(ttFont, glyph_metrics, config):
     """Check if each glyph has the recommended amount of contours.
 
     This check is useful to assure glyphs aren't incorrectly constructed.
@@ -74,7 +74,7 @@ def check_contour_count(ttFont, config):
         for f in desired_glyph_data_by_glyphname
     }
 
-    font_glyph_data = get_font_glyph_data(ttFont)
+    font_glyph_data = get_font_glyph_data(ttFont, glyph_metrics)
 
     if font_glyph_data is None:
         yield FAIL, Message("lacks-cmap", "This font lacks cmap data.")
@@ -7,22 +7,19 @@ from fontbakery.constants import (
 from fontbakery.prelude import check, Message, FAIL, WARN, PASS
 
 
-def _quick_and_dirty_glyph_is_empty(font, glyph_name):
+def _quick_and_dirty_glyph_is_empty(font, glyph_metrics, glyph_name):
     """
-    This is meant to be a quick-and-dirty test to see if a glyph is empty.
-    Ideally we'd use the glyph_has_ink() method for this, but for a family of
-    large CJK CFF fonts with tens of thousands of glyphs each, it's too slow.
+    This is meant to be a quick test to see if a glyph is empty.
+    TrueType glyphs are looked up in the glyph metrics table, which needs no
+    drawing, but drawing all the glyphs of a family of large CJK CFF fonts
+    with tens of thousands of glyphs each would be too slow.
 
     Caveat Utilitor:
     If this method returns True, the glyph is definitely empty.
-    If this method returns False, the glyph *might* still be empty.
+    If this method returns False, a CFF glyph *might* still be empty.
     """
     if "glyf" in font:
-        glyph = font["glyf"][glyph_name]
-        if not glyph.isComposite():
-            if glyph.numberOfContours == 0:
-                return True
-        return False
+        return not glyph_metrics.has_ink(glyph_name)
 
     if "CFF2" in font:
         top_dict = font["CFF2"].cff.topDictIndex[0]
@@ -59,7 +56,7 @@ def _quick_and_dirty_glyph_is_empty(font, glyph_name):
     """,
     proposal="https://github.com/fonttools/fontbakery/pull/2460",
 )
-def check_empty_letters(ttFont):
+def check_empty_letters(ttFont, glyph_metrics):
     """Letters in font have glyphs that are not empty?"""
     cmap = ttFont.getBestCmap()
     blank_ok_set = ALL_HANGUL_SYLLABLES_CODEPOINTS - MODERN_HANGUL_SYLLABLES_CODEPOINTS
@@ -83,7 +80,9 @@ def check_empty_letters(ttFont):
     }
     for unicode_val, glyph_name in cmap.items():
         category = unicodedata.category(chr(unicode_val))
-        glyph_is_empty = _quick_and_dirty_glyph_is_empty(ttFont, glyph_name)
+        glyph_is_empty = _quick_and_dirty_glyph_is_empty(
+            ttFont, glyph_metrics, glyph_name
+        )
 
         if glyph_is_empty and unicode_val in blank_ok_set:
             num_blank_hangul_glyphs += 1
@@ -2,7 +2,8 @@ import re
 
 from packaging.version import VERSION_PATTERN
 
-from fontbakery.prelude import FAIL, PASS, Message, check
+from fontbakery.prelude import FAIL, PASS, Message, check, condition
+from fontbakery.testable import CheckRunContext
 
 re_version = re.compile(r"^\s*" + VERSION_PATTERN + r"\s*$", re.VERBOSE | re.IGNORECASE)
 
@@ -62,6 +63,22 @@ def is_up_to_date(installed_str, latest_str):
     return not (installed_is_pre_or_dev_rel or latest_is_post_rel)
 
 
+@condition(CheckRunContext)
+def fontbakery_pypi_response(collection):
+    """PyPI's answer about the latest FontBakery release, which is asked once
+    per run rather than once per font: the response, or the error of a
+    request which got none."""
+    import requests
+
+    try:
+        return requests.get(
+            "https://pypi.org/pypi/fontbakery/json",
+            timeout=collection.config.get("timeout"),
+        )
+    except requests.exceptions.ConnectionError as err:
+        return err
+
+
 @check(
     id="fontbakery_version",
     conditions=["network"],
@@ -75,20 +92,16 @@ def is_up_to_date(installed_str, latest_str):
     """,
     proposal="https://github.com/fonttools/fontbakery/issues/2093",
 )
-def check_fontbakery_version(font, config):
+def check_fontbakery_version(font, fontbakery_pypi_response):
     """Do we have the latest version of FontBakery installed?"""
     import pip_api
     import requests
 
-    try:
-        response = requests.get(
-            "https://pypi.org/pypi/fontbakery/json", timeout=config.get("timeout")
-        )
-
-    except requests.exceptions.ConnectionError as err:
+    response = fontbakery_pypi_response
+    if isinstance(response, requests.exceptions.ConnectionError):
         return FAIL, Message(
             "connection-error",
-            f"Request to PyPI.org failed with this message:\n{err}",
+            f"Request to PyPI.org failed with this message:\n{response}",
         )
 
     status_code = response.status_code
@@ -1,6 +1,6 @@
 from pathlib import Path
-import tempfile
 
+from fontbakery.cache import tool_cache, tool_version
 from fontbakery.prelude import check, ERROR, FAIL, INFO, PASS, WARN, Message
 from fontbakery.utils import exit_with_install_instructions
 
@@ -143,9 +143,6 @@ def check_fontvalidator(font, config):
     if disabled_checks is not None:
         disabled_fval_checks = disabled_checks
 
-    report_dir = tempfile.TemporaryDirectory(prefix="fontval-")
-    import subprocess
-
     try:
         fval_cmd = [
             "FontValidator",
@@ -153,15 +150,28 @@ def check_fontvalidator(font, config):
             font.file,
             "-all-tables",
             "-report-dir",
-            report_dir.name,
+            "{output_dir}",
             "-no-raster-tests",
         ]
-        subprocess.check_output(fval_cmd, stderr=subprocess.STDOUT)
-    except subprocess.CalledProcessError as e:
+        process = tool_cache().run(
+            fval_cmd,
+            [font.file],
+            tool_version("FontValidator"),
+            merge_output=True,
+            output_dir=True,
+        )
+    except (OSError, IOError) as error:
+        yield ERROR, Message(
+            "fontval-not-available",
+            "Mono runtime and/or Microsoft Font Validator are not available!",
+        )
+        raise error
+
+    if process.returncode:
         # Filter uninteresting progress reports.
         filtered_output = [
             msg
-            for msg in e.output.decode().splitlines()
+            for msg in process.stdout.decode().splitlines()
             if not msg.startswith(
                 ("Table Test:", "Progress: Validating glyph with index")
             )
@@ -173,12 +183,6 @@ def check_fontvalidator(font, config):
                 " Output follows :\n\n{}\n"
             ).format("\n".join(filtered_output)),
         )
-    except (OSError, IOError) as error:
-        yield ERROR, Message(
-            "fontval-not-available",
-            "Mono runtime and/or Microsoft Font Validator are not available!",
-        )
-        raise error
 
     def report_message(msg, details):
         if details:
@@ -203,36 +207,35 @@ def check_fontvalidator(font, config):
         else:
             return f"MS-FonVal: {msg}"
 
-    report_file = Path(report_dir.name) / f"{Path(font.file).name}.report.xml"
+    report_xml = process.files[f"{Path(font.file).name}.report.xml"]
 
     grouped_msgs = {}
-    with open(report_file, "rb") as xml_report:
-        doc = lxml.etree.fromstring(xml_report.read())
-        for report in doc.iterfind(".//Report"):
-            msg = report.get("Message")
-            details = report.get("Details")
+    doc = lxml.etree.fromstring(report_xml)
+    for report in doc.iterfind(".//Report"):
+        msg = report.get("Message")
+        details = report.get("Details")
 
-            disable_it = False
-            if enabled_checks is not None:
-                if not any(substring in msg for substring in enabled_checks):
-                    disable_it = True
-            else:
-                if any(substring in msg for substring in disabled_fval_checks):
-                    disable_it = True
-            if disable_it:
-                continue
+        disable_it = False
+        if enabled_checks is not None:
+            if not any(substring in msg for substring in enabled_checks):
+                disable_it = True
+        else:
+            if any(substring in msg for substring in disabled_fval_checks):
+                disable_it = True
+        if disable_it:
+            continue
 
-            if msg not in grouped_msgs:
-                grouped_msgs[msg] = {
-                    "errortype": report.get("ErrorType"),
-                    "details": [details],
-                }
-            else:
-                if details not in grouped_msgs[msg]["details"]:
-                    # avoid cluttering the output with tons of identical reports
-                    # yield INFO, 'grouped_msgs[msg]["details"]: {}'.format(
-                    # grouped_msgs[msg]["details"])
-                    grouped_msgs[msg]["details"].append(details)
+        if msg not in grouped_msgs:
+            grouped_msgs[msg] = {
+                "errortype": report.get("ErrorType"),
+                "details": [details],
+            }
+        else:
+            if details not in grouped_msgs[msg]["details"]:
+                # avoid cluttering the output with tons of identical reports
+                # yield INFO, 'grouped_msgs[msg]["details"]: {}'.format(
+                # grouped_msgs[msg]["details"])
+                grouped_msgs[msg]["details"].append(details)
 
     # ---------------------------
     # Here we start emitting the grouped log messages
@@ -32,7 +32,7 @@ from fontbakery.checks.iso15008.utils import (
         "https://github.com/fonttools/fontbakery/issues/3252",
     ],
 )
-def check_iso15008_intercharacter_spacing(font, ttFont):
+def check_iso15008_intercharacter_spacing(shaper, ttFont):
     """Check if spacing between characters is adequate for display use"""
     width = stem_width(ttFont)
 
@@ -47,7 +47,7 @@ def check_iso15008_intercharacter_spacing(font, ttFont):
     l_advance = ttFont["hmtx"]["l"][0]
     l_rsb = l_advance - l_intersections[-1].point.x
 
-    l_l = l_rsb + pair_kerning(font, "l", "l") + l_lsb
+    l_l = l_rsb + pair_kerning(shaper, "l", "l") + l_lsb
     if l_l is None:
         yield FAIL, Message(
             "glyph-not-present",
@@ -72,7 +72,7 @@ def check_iso15008_intercharacter_spacing(font, ttFont):
     v_lsb = xMin
     v_rsb = v_advance - (v_lsb + xMax - xMin)
 
-    l_v = l_rsb + pair_kerning(font, "l", "v") + v_lsb
+    l_v = l_rsb + pair_kerning(shaper, "l", "v") + v_lsb
 
     if l_v is None:
         yield FAIL, Message(
@@ -89,7 +89,7 @@ def check_iso15008_intercharacter_spacing(font, ttFont):
             f" value of {width * 0.85}",
         )
 
-    if v_rsb + pair_kerning(font, "v", "v") + v_lsb <= 0:
+    if v_rsb + pair_kerning(shaper, "v", "v") + v_lsb <= 0:
         yield FAIL, Message(
             "bad-diagonal-diagonal-spacing", "Diagonal strokes (vv) were touching"
         )
@@ -1,6 +1,7 @@
 from fontTools.pens.boundsPen import BoundsPen
 
 from fontbakery.prelude import check, FAIL, Message
+from fontbakery.utils import ReadOnlyGlyphSet
 from fontbakery.checks.iso15008.utils import (
     xheight_intersections,
     pair_kerning,
@@ -24,17 +25,10 @@ from fontbakery.checks.iso15008.utils import (
         "https://github.com/fonttools/fontbakery/issues/3253",
     ],
 )
-def check_iso15008_interword_spacing(font, ttFont):
+def check_iso15008_interword_spacing(shaper, ttFont):
     """Check if spacing between words is adequate for display use"""
 
-    # This check modifies the font file with `.draw(pen)`
-    # so here we'll work with a copy of the object so that we
-    # do not affect other checks:
-    from copy import deepcopy
-
-    ttFont_copy = deepcopy(ttFont)
-
-    l_intersections = xheight_intersections(ttFont_copy, "l")
+    l_intersections = xheight_intersections(ttFont, "l")
     if len(l_intersections) < 2:
         yield FAIL, Message(
             "glyph-not-present",
@@ -42,21 +36,21 @@ def check_iso15008_interword_spacing(font, ttFont):
         )
         return
 
-    l_advance = ttFont_copy["hmtx"]["l"][0]
+    l_advance = ttFont["hmtx"]["l"][0]
     l_rsb = l_advance - l_intersections[-1].point.x
 
-    glyphset = ttFont_copy.getGlyphSet()
+    glyphset = ReadOnlyGlyphSet(ttFont)
     pen = BoundsPen(glyphset)
     glyphset["m"].draw(pen)
     (xMin, yMin, xMax, yMax) = pen.bounds
-    m_advance = ttFont_copy["hmtx"]["m"][0]
+    m_advance = ttFont["hmtx"]["m"][0]
     m_lsb = xMin
     m_rsb = m_advance - (m_lsb + xMax - xMin)
 
-    n_lsb = ttFont_copy["hmtx"]["n"][1]
+    n_lsb = ttFont["hmtx"]["n"][1]
 
-    l_m = l_rsb + pair_kerning(font, "l", "m") + m_lsb
-    space_width = ttFont_copy["hmtx"]["space"][0]
+    l_m = l_rsb + pair_kerning(shaper, "l", "m") + m_lsb
+    space_width = ttFont["hmtx"]["space"][0]
     # Add spacing caused by normal sidebearings
     space_width += m_rsb + n_lsb
 
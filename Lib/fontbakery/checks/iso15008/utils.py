@@ -1,8 +1,7 @@
 from beziers.line import Line
-from beziers.path import BezierPath
 from beziers.point import Point
 
-from fontbakery.utils import exit_with_install_instructions
+from fontbakery.utils import glyph_bezier_paths, ReadOnlyGlyphSet
 
 
 DISCLAIMER = """
@@ -11,11 +10,11 @@ DISCLAIMER = """
 
 
 def xheight_intersections(ttFont, glyph):
-    glyphset = ttFont.getGlyphSet()
+    glyphset = ReadOnlyGlyphSet(ttFont)
     if glyph not in glyphset:
         return []
 
-    paths = BezierPath.fromFonttoolsGlyph(ttFont, glyph)
+    paths = glyph_bezier_paths(glyphset, glyph)
     if len(paths) != 1:
         return []
     path = paths[0]
@@ -43,28 +42,8 @@ def stem_width(ttFont):
     return abs(i1.point.x - i2.point.x)
 
 
-def pair_kerning(font, left, right):
+def pair_kerning(shaper, left, right):
     """The kerning between two glyphs (specified by name), in font units."""
-
-    try:
-        import uharfbuzz as hb
-    except ImportError:
-        exit_with_install_instructions("iso15008")
-
-    with open(font.file, "rb") as fontfile:
-        fontdata = fontfile.read()
-    face = hb.Face(fontdata)
-    font = hb.Font(face)
-    scale = face.upem
-    font.scale = (scale, scale)
-    buf = hb.Buffer()
-    buf.add_str(left + right)
-    buf.guess_segment_properties()
-    hb.shape(font, buf, {"kern": True})
-    pos = buf.glyph_positions[0].x_advance
-    buf = hb.Buffer()
-    buf.add_str(left + right)
-    buf.guess_segment_properties()
-    hb.shape(font, buf, {"kern": False})
-    pos2 = buf.glyph_positions[0].x_advance
-    return pos - pos2
+    kerned = shaper.shape(left + right, {"features": {"kern": True}})
+    unkerned = shaper.shape(left + right, {"features": {"kern": False}})
+    return kerned.glyph_positions[0].x_advance - unkerned.glyph_positions[0].x_advance
@@ -1,5 +1,4 @@
 from fontbakery.prelude import check, Message, FAIL, WARN
-from fontbakery.utils import glyph_has_ink
 
 
 @check(
@@ -20,7 +19,7 @@ from fontbakery.utils import glyph_has_ink
     """,
     proposal="https://github.com/fonttools/fontbakery/issues/4829",  # legacy check
 )
-def check_mandatory_glyphs(ttFont):
+def check_mandatory_glyphs(ttFont, glyph_metrics):
     """Font contains '.notdef' as its first glyph?"""
     NOTDEF = ".notdef"
     glyph_order = ttFont.getGlyphOrder()
@@ -46,7 +45,7 @@ def check_mandatory_glyphs(ttFont):
             f" but has 0x{rev_cmap[NOTDEF]:04X}.",
         )
 
-    if not glyph_has_ink(ttFont, NOTDEF):
+    if not glyph_metrics.has_ink(NOTDEF):
         yield FAIL, Message(
             "notdef-is-blank",
             f"The {NOTDEF!r} glyph should contain a drawing, but it is blank.",
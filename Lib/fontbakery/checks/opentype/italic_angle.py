@@ -1,4 +1,5 @@
 from fontbakery.prelude import check, Message, FAIL, PASS, WARN
+from fontbakery.utils import glyph_bezier_paths, ReadOnlyGlyphSet
 
 
 @check(
@@ -13,19 +14,12 @@ from fontbakery.prelude import check, Message, FAIL, PASS, WARN
     """,
     proposal="https://github.com/fonttools/fontbakery/issues/4829",  # legacy check
 )
-def check_italic_angle(ttFont, style):
+def check_italic_angle(ttFont, glyph_metrics, style):
     """Checking post.italicAngle value."""
     import math
-    from beziers.path import BezierPath, Line, Point
-    from fontTools.pens.boundsPen import BoundsPen
-    from copy import deepcopy
+    from beziers.path import Line, Point
 
-    # This check modifies the font file with `.draw(boundspen)`
-    # so here we'll work with a copy of the object so that we
-    # do not affect other checks:
-    ttFont_copy = deepcopy(ttFont)
-
-    value = ttFont_copy["post"].italicAngle
+    value = ttFont["post"].italicAngle
 
     # Calculating italic angle from the font's glyph outlines
     def x_leftmost_intersection(paths, y):
@@ -50,29 +44,24 @@ def check_italic_angle(ttFont, style):
         "uni0049",  # LATIN CAPITAL LETTER I
     )
 
+    glyphset = ReadOnlyGlyphSet(ttFont)
     bad_glyphs = []
     for glyph_name in GLYPHS_TO_CHECK:
         # Get bounds
-        glyphset = ttFont_copy.getGlyphSet()
-        if glyph_name not in glyphset:
+        if glyph_name not in glyph_metrics:
             continue
-        boundspen = BoundsPen(glyphset)
-        glyphset[glyph_name].draw(boundspen)
-        if not boundspen.bounds:
+        if not glyph_metrics.bounds(glyph_name):
             bad_glyphs.append(glyph_name)
             continue
 
     calculated_italic_angle = None
     for glyph_name in GLYPHS_TO_CHECK:
         try:
-            paths = BezierPath.fromFonttoolsGlyph(ttFont_copy, glyph_name)
+            paths = glyph_bezier_paths(glyphset, glyph_name)
         except KeyError:
             continue
 
-        # Get bounds
-        boundspen = BoundsPen(ttFont_copy.getGlyphSet())
-        ttFont_copy.getGlyphSet()[glyph_name].draw(boundspen)
-        bounds = boundspen.bounds
+        bounds = glyph_metrics.bounds(glyph_name)
         if not bounds:
             continue
         (xMin, yMin, xMax, yMax) = bounds
@@ -169,14 +158,14 @@ def check_italic_angle(ttFont, style):
 
     # Checking if italicAngle matches font style:
     if "Italic" in style:
-        if ttFont_copy["post"].italicAngle == 0:
+        if ttFont["post"].italicAngle == 0:
             passed = False
             yield FAIL, Message(
                 "zero-italic",
                 "Font is italic, so post.italicAngle should be non-zero.",
             )
     else:
-        if ttFont_copy["post"].italicAngle != 0:
+        if ttFont["post"].italicAngle != 0:
             passed = False
             yield FAIL, Message(
                 "non-zero-upright",
@@ -1,18 +1,10 @@
-from fontbakery.prelude import Message, check, condition
+from fontbakery.prelude import Message, check
 from fontbakery.status import FAIL, PASS, SKIP
-from fontbakery.testable import Font
 
 # Reference codepoint to use to determine slant angle.
 REFERENCE = "H"
 
 
-@condition(Font)
-def uharfbuzz_blob(font):
-    import uharfbuzz as hb
-
-    return hb.Blob.from_file_path(font.file)
-
-
 @check(
     id="opentype/slant_direction",
     conditions=["is_variable_font"],
@@ -28,7 +20,7 @@ def uharfbuzz_blob(font):
     """,
     proposal="https://github.com/fonttools/fontbakery/pull/3910",
 )
-def check_slant_direction(ttFont, uharfbuzz_blob):
+def check_slant_direction(ttFont, shaper):
     """Checking direction of slnt axis angles."""
     import uharfbuzz as hb
     from fontbakery.utils import PointsPen, axis
@@ -46,8 +38,9 @@ def check_slant_direction(ttFont, uharfbuzz_blob):
         )
         return
 
-    hb_face = hb.Face(uharfbuzz_blob)
-    hb_font = hb.Font(hb_face)
+    # This font object gets its variations changed below, so it must not be
+    # the one shared by the shaper.
+    hb_font = hb.Font(shaper.face)
     buf = hb.Buffer()
     buf.add_str(REFERENCE)
     features = {"kern": True, "liga": True}
@@ -1,3 +1,4 @@
+from fontbakery.cache import tool_cache, tool_version
 from fontbakery.prelude import check, Message, FAIL, WARN
 
 
@@ -18,19 +19,21 @@ def check_ots(font):
     """Checking with ots-sanitize."""
     import ots
 
-    try:
-        process = ots.sanitize(font.file, check=True, capture_output=True)
-
-    except ots.CalledProcessError as e:
+    # Runs ots.sanitize(), unless it already ran on a font with the same contents.
+    process = tool_cache().run(
+        [ots.OTS_SANITIZE, font.file],
+        [font.file],
+        tool_version(ots.OTS_SANITIZE, "opentype-sanitizer"),
+    )
+    if process.returncode:
         yield FAIL, Message(
             "ots-sanitize-error",
-            f"ots-sanitize returned an error code ({e.returncode})."
-            f" Output follows:\n\n{e.stderr.decode()}{e.stdout.decode()}",
+            f"ots-sanitize returned an error code ({process.returncode})."
+            f" Output follows:\n\n{process.stderr.decode()}{process.stdout.decode()}",
+        )
+    elif process.stderr:
+        yield WARN, Message(
+            "ots-sanitize-warn",
+            "ots-sanitize passed this file, however warnings were printed:\n\n"
+            f"{process.stderr.decode()}",
         )
-    else:
-        if process.stderr:
-            yield WARN, Message(
-                "ots-sanitize-warn",
-                "ots-sanitize passed this file, however warnings were printed:\n\n"
-                f"{process.stderr.decode()}",
-            )
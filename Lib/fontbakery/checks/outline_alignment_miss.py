@@ -23,10 +23,10 @@ from fontbakery.checks.outline_settings import (
         to generate significant numbers of false positives, it will pass if there are
         more than {FALSE_POSITIVE_CUTOFF} reported misalignments.
     """,
-    conditions=["outlines_dict"],
+    conditions=["outlines"],
     proposal="https://github.com/fonttools/fontbakery/pull/3088",
 )
-def check_outline_alignment_miss(ttFont, outlines_dict, config):
+def check_outline_alignment_miss(ttFont, outlines, config):
     """Are there any misaligned on-curve points?"""
 
     warnings = []
@@ -55,21 +55,19 @@ def check_outline_alignment_miss(ttFont, outlines_dict, config):
             " and version >= 2 is required for those checks.",
         )
 
-    for glyph, outlines in outlines_dict.items():
-        glyphname, display_name = glyph
-        for p in outlines:
-            for node in p.asNodelist():
-                if node.type == "offcurve":
-                    continue
+    for glyph in outlines:
+        glyphname = glyph.name
+        for contour in glyph.contours:
+            for x, y in contour.oncurve_points:
                 for line, yExpected in alignments.items():
                     # skip x-height check for caps
                     if line == "x-height" and (
                         len(glyphname) > 1 or glyphname[0].isupper()
                     ):
                         continue
-                    if close_but_not_on(yExpected, node.y, ALIGNMENT_MISS_EPSILON):
+                    if close_but_not_on(yExpected, y, ALIGNMENT_MISS_EPSILON):
                         warnings.append(
-                            f"{display_name}: X={node.x},Y={node.y}"
+                            f"{glyph.display_name}: X={x},Y={y}"
                             f" (should be at {line} {yExpected}?)"
                         )
         if len(warnings) > FALSE_POSITIVE_CUTOFF:
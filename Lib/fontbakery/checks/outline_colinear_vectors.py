@@ -1,4 +1,5 @@
 from fontbakery.prelude import check, Message, PASS, WARN
+from fontbakery.outlines import format_segment
 from fontbakery.utils import bullet_list
 from fontbakery.checks.outline_settings import (
     COLINEAR_EPSILON,
@@ -15,28 +16,28 @@ from fontbakery.checks.outline_settings import (
         This check is not run for variable fonts, as they may legitimately have
         colinear vectors.
     """,
-    conditions=["outlines_dict", "not is_variable_font"],
+    conditions=["outlines", "not is_variable_font"],
     proposal="https://github.com/fonttools/fontbakery/pull/3088",
 )
-def check_outline_colinear_vectors(ttFont, outlines_dict, config):
+def check_outline_colinear_vectors(ttFont, outlines, config):
     """Do any segments have colinear vectors?"""
     warnings = []
 
-    for glyph, outlines in outlines_dict.items():
-        glyphname, display_name = glyph
-        for p in outlines:
-            segments = p.asSegments()
-            if not segments:
-                continue
+    for glyph in outlines:
+        for contour in glyph.contours:
+            segments = contour.segments
+            lines = contour.lines
+            angles = contour.start_angles
             for i in range(0, len(segments)):
-                prev = segments[i - 1]
-                this = segments[i]
-                if len(prev) == 2 and len(this) == 2:
-                    if (
-                        abs(prev.tangentAtTime(0).angle - this.tangentAtTime(0).angle)
-                        < COLINEAR_EPSILON
-                    ):
-                        warnings.append(f"{display_name}: {prev} -> {this}")
+                if (
+                    lines[i - 1]
+                    and lines[i]
+                    and abs(angles[i - 1] - angles[i]) < COLINEAR_EPSILON
+                ):
+                    warnings.append(
+                        f"{glyph.display_name}: {format_segment(segments[i - 1])}"
+                        f" -> {format_segment(segments[i])}"
+                    )
         if len(warnings) > FALSE_POSITIVE_CUTOFF:
             yield PASS, (
                 "So many colinear vectors were found that this was probably by design."
@@ -1,5 +1,3 @@
-from collections import defaultdict
-
 from fontbakery.prelude import check, Message, WARN
 from fontbakery.utils import bullet_list
 
@@ -12,46 +10,46 @@ from fontbakery.utils import bullet_list
         Getting the path direction wrong can lead to rendering issues in some
         software.
     """,
-    conditions=["outlines_dict", "is_ttf"],
+    conditions=["outlines", "is_ttf"],
     proposal="https://github.com/fonttools/fontbakery/issues/2056",
 )
-def check_outline_direction(ttFont, outlines_dict, config):
+def check_outline_direction(ttFont, outlines, config):
     """Check the direction of the outermost contour in each glyph"""
     warnings = []
 
     def bounds_contains(bb1, bb2):
+        # Bounds are (xMin, yMin, xMax, yMax) tuples
         return (
-            bb1.left <= bb2.left
-            and bb1.right >= bb2.right
-            and bb1.top >= bb2.top
-            and bb1.bottom <= bb2.bottom
+            bb1[0] <= bb2[0]
+            and bb1[2] >= bb2[2]
+            and bb1[3] >= bb2[3]
+            and bb1[1] <= bb2[1]
         )
 
-    for glyph, outlines in outlines_dict.items():
-        glyphname, display_name = glyph
+    for glyph in outlines:
         # Find outlines which are not contained within another outline
-        outline_bounds = [path.bounds() for path in outlines]
-        is_within = defaultdict(list)
+        outline_bounds = [contour.bounds for contour in glyph.contours]
+        is_within = set()
         for i, my_bounds in enumerate(outline_bounds):
-            if my_bounds.bl is None:
+            if my_bounds is None:
                 warnings.append(
-                    f"{display_name} has a path with no bounds (probably a single point)"
+                    f"{glyph.display_name} has a path with no bounds"
+                    " (probably a single point)"
                 )
                 continue
-            for j in range(0, len(outline_bounds)):
+            for j, their_bounds in enumerate(outline_bounds):
                 if i == j:
                     continue
-                their_bounds = outline_bounds[j]
-                if their_bounds.bl is None:
+                if their_bounds is None:
                     continue  # Already warned
                 if bounds_contains(my_bounds, their_bounds):
-                    is_within[j].append(i)
+                    is_within.add(j)
         # The outermost paths are those which are not within anything
-        for i, path in enumerate(outlines):
-            if is_within[i]:
-                continue
-            if path.direction == 1:
-                warnings.append(f"{display_name} has a counter-clockwise outer contour")
+        for i, contour in enumerate(glyph.contours):
+            if i not in is_within and contour.is_counter_clockwise:
+                warnings.append(
+                    f"{glyph.display_name} has a counter-clockwise outer contour"
+                )
 
     if warnings:
         formatted_list = bullet_list(config, sorted(warnings), bullet="*")
@@ -1,6 +1,7 @@
 import math
 
 from fontbakery.prelude import check, Message, PASS, WARN
+from fontbakery.outlines import format_segment
 from fontbakery.utils import bullet_list
 from fontbakery.checks.outline_settings import JAG_ANGLE
 
@@ -13,36 +14,36 @@ from fontbakery.checks.outline_settings import JAG_ANGLE
         in cases such as extreme ink traps, so should be regarded as advisory and
         backed up by manual inspection.
     """,
-    conditions=["outlines_dict", "not is_variable_font"],
+    conditions=["outlines", "not is_variable_font"],
     proposal="https://github.com/fonttools/fontbakery/issues/3064",
 )
-def check_outline_jaggy_segments(ttFont, outlines_dict, config):
+def check_outline_jaggy_segments(ttFont, outlines, config):
     """Do outlines contain any jaggy segments?"""
     warnings = []
 
-    for glyph, outlines in outlines_dict.items():
-        glyphname, display_name = glyph
-        for p in outlines:
-            segments = p.asSegments()
-            if not segments:
-                continue
+    for glyph in outlines:
+        for contour in glyph.contours:
+            segments = contour.segments
+            end_tangents = contour.end_tangents
+            start_tangents = contour.start_tangents
             for i in range(0, len(segments)):
-                prev = segments[i - 1]
-                this = segments[i]
-                in_vector = prev.tangentAtTime(1) * -1
-                out_vector = this.tangentAtTime(0)
-                if not (in_vector.magnitude * out_vector.magnitude):
-                    continue
-                angle = (in_vector @ out_vector) / (
-                    in_vector.magnitude * out_vector.magnitude
+                in_x, in_y = end_tangents[i - 1]
+                in_x, in_y = in_x * -1, in_y * -1
+                out_x, out_y = start_tangents[i]
+                magnitudes = math.sqrt(in_x * in_x + in_y * in_y) * math.sqrt(
+                    out_x * out_x + out_y * out_y
                 )
+                if not magnitudes:
+                    continue
+                angle = (in_x * out_x + in_y * out_y) / magnitudes
                 if not (-1 <= angle <= 1):
                     continue
                 jag_angle = math.acos(angle)
                 if abs(jag_angle) > JAG_ANGLE or jag_angle == 0:
                     continue
                 warnings.append(
-                    f"{display_name}: {prev}/{this} = {math.degrees(jag_angle)}"
+                    f"{glyph.display_name}: {format_segment(segments[i - 1])}"
+                    f"/{format_segment(segments[i])} = {math.degrees(jag_angle)}"
                 )
 
     if warnings:
@@ -1,6 +1,5 @@
-import math
-
 from fontbakery.prelude import check, Message, PASS, WARN
+from fontbakery.outlines import format_segment
 from fontbakery.utils import bullet_list
 
 
@@ -14,28 +13,23 @@ from fontbakery.utils import bullet_list
         This check is disabled for italic styles, which often contain nearly-upright
         lines.
     """,
-    conditions=["outlines_dict", "not is_variable_font", "not is_italic"],
+    conditions=["outlines", "not is_variable_font", "not is_italic"],
     proposal="https://github.com/fonttools/fontbakery/pull/3088",
 )
-def check_outline_semi_vertical(ttFont, outlines_dict, config):
+def check_outline_semi_vertical(ttFont, outlines, config):
     """Do outlines contain any semi-vertical or semi-horizontal lines?"""
     from fontbakery.utils import close_but_not_on
 
     warnings = []
 
-    for glyph, outlines in outlines_dict.items():
-        glyphname, display_name = glyph
-        for p in outlines:
-            segments = p.asSegments()
-            if not segments:
-                continue
-            for s in segments:
-                if len(s) != 2:
+    for glyph in outlines:
+        for contour in glyph.contours:
+            for s, angle in zip(contour.segments, contour.line_angles):
+                if angle is None:
                     continue
-                angle = math.degrees((s.end - s.start).angle)
                 for yExpected in [-180, -90, 0, 90, 180]:
                     if close_but_not_on(angle, yExpected, 0.5):
-                        warnings.append(f"{display_name}: {s}")
+                        warnings.append(f"{glyph.display_name}: {format_segment(s)}")
 
     if warnings:
         formatted_list = bullet_list(config, sorted(warnings), bullet="*")
@@ -1,6 +1,7 @@
 import math
 
 from fontbakery.prelude import check, Message, PASS, WARN
+from fontbakery.outlines import format_segment
 from fontbakery.utils import bullet_list
 from fontbakery.checks.outline_settings import (
     FALSE_POSITIVE_CUTOFF,
@@ -20,30 +21,34 @@ from fontbakery.checks.outline_settings import (
         of false positives, it will pass if there are more than
         {FALSE_POSITIVE_CUTOFF} reported short segments.
     """,
-    conditions=["outlines_dict", "not is_variable_font"],
+    conditions=["outlines", "not is_variable_font"],
     proposal="https://github.com/fonttools/fontbakery/pull/3088",
 )
-def check_outline_short_segments(ttFont, outlines_dict, config):
+def check_outline_short_segments(ttFont, outlines, config):
     """Are any segments inordinately short?"""
     warnings = []
 
-    for glyph, outlines in outlines_dict.items():
-        glyphname, display_name = glyph
-        for p in outlines:
-            outline_length = p.length
-            segments = p.asSegments()
-            if not segments:
+    for glyph in outlines:
+        for contour in glyph.contours:
+            if not contour.segments:
                 continue
-            prev_was_line = len(segments[-1]) == 2
-            for seg in p.asSegments():
-                if math.isclose(seg.length, 0):  # That's definitely wrong
-                    warnings.append(f"{display_name} contains a short segment {seg}")
-                elif (
-                    seg.length < SHORT_PATH_ABSOLUTE_EPSILON
-                    or seg.length < SHORT_PATH_EPSILON * outline_length
-                ) and (prev_was_line or len(seg) > 2):
-                    warnings.append(f"{display_name} contains a short segment {seg}")
-                prev_was_line = len(seg) == 2
+            outline_length = contour.length
+            prev_was_line = contour.lines[-1]
+            for seg, length, is_line in zip(
+                contour.segments, contour.lengths, contour.lines
+            ):
+                if math.isclose(length, 0) or (  # That's definitely wrong
+                    (
+                        length < SHORT_PATH_ABSOLUTE_EPSILON
+                        or length < SHORT_PATH_EPSILON * outline_length
+                    )
+                    and (prev_was_line or not is_line)
+                ):
+                    warnings.append(
+                        f"{glyph.display_name} contains a short segment"
+                        f" {format_segment(seg)}"
+                    )
+                prev_was_line = is_line
         if len(warnings) > FALSE_POSITIVE_CUTOFF:
             yield PASS, (
                 "So many short segments were found that this was probably by design."
@@ -1,4 +1,5 @@
 from fontbakery.prelude import check, Message, PASS, WARN
+from fontbakery.outlines import format_segment
 from fontbakery.utils import bullet_list
 
 
@@ -12,21 +13,22 @@ from fontbakery.utils import bullet_list
         When two segments share the same coordinates, they are considered
         overlapping.
     """,
-    conditions=["outlines_dict", "is_ttf"],
+    conditions=["outlines", "is_ttf"],
     proposal="https://github.com/google/fonts/issues/7594#issuecomment-2401909084",
 )
-def check_overlapping_path_segments(ttFont, outlines_dict, config):
+def check_overlapping_path_segments(ttFont, outlines, config):
     """Check there are no overlapping path segments"""
     failed = []
-    for glyph, outlines in outlines_dict.items():
+    for glyph in outlines:
         seen = set()
-        for p in outlines:
-            for seg in p.asSegments():
-                normal = ((seg.start.x, seg.start.y), (seg.end.x, seg.end.y))
-                flipped = ((seg.end.x, seg.end.y), (seg.start.x, seg.start.y))
+        for contour in glyph.contours:
+            for seg in contour.segments:
+                normal = (seg[0], seg[-1])
+                flipped = (seg[-1], seg[0])
                 if normal in seen or flipped in seen:
                     failed.append(
-                        f"{glyph[1]}: {seg} has the same coordinates as a previous segment."
+                        f"{glyph.display_name}: {format_segment(seg)}"
+                        " has the same coordinates as a previous segment."
                     )
                 seen.add(normal)
     if failed:
@@ -25,11 +25,12 @@ from fontbakery.checks.shaping.utils import (
     """,
     proposal="https://github.com/fonttools/fontbakery/pull/3223",
 )
-def check_shaping_collides(config, ttFont):
+def check_shaping_collides(config, ttFont, shaper):
     """Check that no collisions are found while shaping"""
     yield from run_a_set_of_shaping_tests(
         config,
         ttFont,
+        shaper,
         run_collides_glyph_test,
         lambda test, configuration: "collidoscope" in test
         or "collidoscope" in configuration,
@@ -22,11 +22,12 @@ from fontbakery.checks.shaping.utils import (
     """,
     proposal="https://github.com/fonttools/fontbakery/pull/3223",
 )
-def check_shaping_forbidden(config, ttFont):
+def check_shaping_forbidden(config, ttFont, shaper):
     """Check that no forbidden glyphs are found while shaping"""
     yield from run_a_set_of_shaping_tests(
         config,
         ttFont,
+        shaper,
         run_forbidden_glyph_test,
         lambda test, configuration: "forbidden_glyphs" in configuration,
         forbidden_glyph_test_results,
@@ -67,11 +67,12 @@ def generate_shaping_regression_report(vharfbuzz, shaping_file, failed_shaping_t
     """,
     proposal="https://github.com/fonttools/fontbakery/pull/3223",
 )
-def check_shaping_regression(config, ttFont):
+def check_shaping_regression(config, ttFont, shaper):
     """Check that texts shape as per expectation"""
     yield from run_a_set_of_shaping_tests(
         config,
         ttFont,
+        shaper,
         run_shaping_regression,
         lambda test, configuration: "expectation" in test,
         generate_shaping_regression_report,
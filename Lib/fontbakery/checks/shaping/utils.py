@@ -107,16 +107,15 @@ def get_shaping_parameters(test, configuration):
 # This is a very generic "do something with shaping" test runner.
 # It'll be given concrete meaning later.
 def run_a_set_of_shaping_tests(
-    config, ttFont, run_a_test, test_filter, generate_report, preparation=None
+    config,
+    ttFont,
+    vharfbuzz,
+    run_a_test,
+    test_filter,
+    generate_report,
+    preparation=None,
 ):
-    try:
-        from vharfbuzz import Vharfbuzz
-
-        filename = Path(ttFont.reader.file.name)
-        vharfbuzz = Vharfbuzz(filename)
-    except ImportError:
-        exit_with_install_instructions("shaping")
-
+    filename = Path(ttFont.reader.file.name)
     shaping_file_found = False
     ran_a_test = False
     extra_data = None
@@ -1,10 +1,9 @@
 import itertools
 
-from beziers.path import BezierPath
 from fontTools import unicodedata
-from vharfbuzz import Vharfbuzz
 
 from fontbakery.prelude import check, Message, PASS, WARN, SKIP
+from fontbakery.utils import glyph_bezier_paths, ReadOnlyGlyphSet
 
 
 @check(
@@ -27,7 +26,7 @@ from fontbakery.prelude import check, Message, PASS, WARN, SKIP
     ],  # use Shaperglot, which uses youseedee, which downloads Unicode files
     proposal="https://github.com/fonttools/fontbakery/issues/4059",
 )
-def check_soft_dotted(ttFont):
+def check_soft_dotted(ttFont, shaper):
     """Ensure soft_dotted characters lose their dot when combined with marks that
     replace the dot."""
 
@@ -69,8 +68,9 @@ def check_soft_dotted(ttFont):
 
     # Collect outlines to skip fonts where i and dotlessi are the same,
     # or i and I are the same.
+    glyphset = ReadOnlyGlyphSet(ttFont)
     outlines_dict = {
-        codepoint: BezierPath.fromFonttoolsGlyph(ttFont, glyphname)
+        codepoint: glyph_bezier_paths(glyphset, glyphname)
         for codepoint, glyphname in cmap.items()
         if codepoint in [ord("i"), ord("I"), ord("ı")]
     }
@@ -88,8 +88,6 @@ def check_soft_dotted(ttFont):
         return
 
     # Use harfbuzz to check if soft dotted glyphs are substituted
-    filename = ttFont.reader.file.name
-    vharfbuzz = Vharfbuzz(filename)
     fail_unchanged_strings = []
     warn_unchanged_strings = []
     for sequence in sorted(
@@ -112,8 +110,8 @@ def check_soft_dotted(ttFont):
         if text not in ortho_soft_dotted_strings and len(warn_unchanged_strings) >= 20:
             continue
 
-        buf = vharfbuzz.shape(text)
-        output = vharfbuzz.serialize_buf(buf, glyphsonly=True)
+        buf = shaper.shape(text)
+        output = shaper.serialize_buf(buf, glyphsonly=True)
         if output == unchanged:
             if text in ortho_soft_dotted_strings:
                 fail_unchanged_strings.append(text)
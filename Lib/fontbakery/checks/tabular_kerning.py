@@ -1,3 +1,4 @@
+from fontbakery.kerning import PairKerningIndex
 from fontbakery.prelude import check, Message, FAIL, SKIP
 from fontbakery.utils import mark_glyphs
 
@@ -22,10 +23,8 @@ from fontbakery.utils import mark_glyphs
     """,
     proposal="https://github.com/fonttools/fontbakery/issues/4440",
 )
-def check_tabular_kerning(ttFont):
+def check_tabular_kerning(ttFont, shaper):
     """Check tabular widths don't have kerning."""
-    from vharfbuzz import Vharfbuzz
-    import uharfbuzz as hb
     import unicodedata
 
     EXCLUDE = [
@@ -46,21 +45,10 @@ def check_tabular_kerning(ttFont):
         ".notdef",
         "NULL",
     ]
-    GID_OFFSET = 0xF0000
 
-    vhb = Vharfbuzz(ttFont.reader.file.name)
     best_cmap = ttFont.getBestCmap()
     unicode_for_glyphs = {v: k for k, v in best_cmap.items()}
 
-    def nominal_glyph_func(font, code_point, data):
-        if code_point > GID_OFFSET:
-            return code_point - GID_OFFSET
-        return 0
-
-    funcs = hb.FontFuncs.create()
-    funcs.set_nominal_glyph_func(nominal_glyph_func)
-    vhb.hbfont.funcs = funcs
-
     def glyph_width(ttFont, glyph_name):
         return ttFont["hmtx"].metrics[glyph_name][0]
 
@@ -130,29 +118,20 @@ def check_tabular_kerning(ttFont):
         if excluded:
             return 0
 
-        glyph_list = [
-            chr(GID_OFFSET + glyph_name_to_gid(ttFont, glyph_name))
-            for glyph_name in glyph_list
-        ]
+        gids = [glyph_name_to_gid(ttFont, glyph_name) for glyph_name in glyph_list]
 
         # Either glyph is .notdef
-        if chr(GID_OFFSET) in glyph_list:
+        if 0 in gids:
             return 0
 
-        text = "".join(glyph_list)
-        width1 = buf_to_width(vhb.shape(text, {"features": {"kern": True}}))
-        width2 = buf_to_width(vhb.shape(text, {"features": {"kern": False}}))
+        width1 = buf_to_width(shaper.shape_glyphs(gids, {"features": {"kern": True}}))
+        width2 = buf_to_width(shaper.shape_glyphs(gids, {"features": {"kern": False}}))
         return width1 - width2
 
     def get_str_buffer(glyph_list):
-        glyph_list = [
-            chr(GID_OFFSET + glyph_name_to_gid(ttFont, glyph_name))
-            for glyph_name in glyph_list
-        ]
-        text = "".join(glyph_list)
-        buffer = vhb.shape(text)
-        string = vhb.serialize_buf(buffer)
-        return string
+        gids = [glyph_name_to_gid(ttFont, glyph_name) for glyph_name in glyph_list]
+        buffer = shaper.shape_glyphs(gids)
+        return shaper.glyph_shaper.serialize_buf(buffer)
 
     def digraph_kerning(ttFont, glyph_list, expected_kerning):
         return (
@@ -174,8 +153,8 @@ def check_tabular_kerning(ttFont):
     # Fonts with tnum feautre
     if has_feature(ttFont, "tnum"):
         tabular_glyphs = list(get_substitutions(ttFont, "tnum").values())
-        buf = vhb.shape("0123456789", {"features": {"tnum": True}})
-        tabular_numerals = vhb.serialize_buf(buf, glyphsonly=True).split("|")
+        buf = shaper.shape("0123456789", {"features": {"tnum": True}})
+        tabular_numerals = shaper.serialize_buf(buf, glyphsonly=True).split("|")
 
     # Without tnum feature
     else:
@@ -213,13 +192,23 @@ def check_tabular_kerning(ttFont):
 
     # Actually check for kerning
     if has_feature(ttFont, "kern"):
+        kerning_index = PairKerningIndex(ttFont, "kern")
         for sets in (
             (all_glyphs, tabular_numerals),
             (tabular_numerals, tabular_glyphs),
         ):
+            if kerning_index.complete:
+                # Only shape the pairs that the GPOS kerning says are kerned.
+                kerned_pairs = {
+                    (a, b)
+                    for lefts, rights in (sets, sets[::-1])
+                    for a, b, _ in kerning_index.kerned_pairs(lefts, rights)
+                }
             combinations = unique_combinations(sets[0], sets[1])
             for x, y in combinations:
                 for a, b in ((x, y), (y, x)):
+                    if kerning_index.complete and (a, b) not in kerned_pairs:
+                        continue
                     kerning = get_kerning([a, b])
                     if kerning != 0:
                         # Check if either a or b are digraphs that themselves
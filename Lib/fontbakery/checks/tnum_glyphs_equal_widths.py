@@ -8,14 +8,14 @@ def parse_unicode_escape(s):
     return ast.literal_eval(f'"{s}"')
 
 
-def verify_widths(ttFont, hbFont, check_text):
+def verify_widths(ttFont, shaper, check_text, variations=None):
     """Shape text and verify all shaped glyphs are the same width"""
     import uharfbuzz as hb
 
-    buffer = hb.Buffer()
-    buffer.add_str(check_text)
-    buffer.guess_segment_properties()
-    hb.shape(hbFont, buffer, features={"tnum": True})
+    parameters = {"features": {"tnum": True}}
+    if variations:
+        parameters["variations"] = variations
+    buffer = shaper.shape(check_text, parameters)
 
     assert buffer.content_type == hb.BufferContentType.GLYPHS
 
@@ -56,14 +56,8 @@ def format_glyphs_by_width(glyphs_by_width):
     """,
     proposal="https://github.com/fonttools/fontbakery/pull/4657",
 )
-def check_tnum_glyphs_equal_widths(ttFont):
+def check_tnum_glyphs_equal_widths(ttFont, shaper):
     """Widths of tabular number glyphs."""
-    import uharfbuzz as hb
-
-    filename = ttFont.reader.file.name
-    hbBlob = hb.Blob.from_file_path(filename)
-    hbFace = hb.Face(hbBlob)
-    hbFont = hb.Font(hbFace)
 
     check_text = "0123456789"
     if TEST_STR is not None:  # type: ignore # noqa:F821 pylint:disable=E0602
@@ -93,10 +87,11 @@ def check_tnum_glyphs_equal_widths(ttFont):
         # for each named instance in fvar
         for fvar_instance in fvar_table.instances:
             instance_coord_dict = fvar_instance.coordinates
-            hbFont.set_variations(instance_coord_dict)
 
             # Shape set of characters and verify glyphs have same width
-            glyphs_with_widths = verify_widths(ttFont, hbFont, check_text)
+            glyphs_with_widths = verify_widths(
+                ttFont, shaper, check_text, instance_coord_dict
+            )
             if len(glyphs_with_widths) > 1:
                 yield FAIL, (
                     f"tnum glyphs in instance {instance_coord_dict} "
@@ -110,7 +105,7 @@ def check_tnum_glyphs_equal_widths(ttFont):
 
     else:
         # Shape set of characters and verify glyphs have same width
-        glyphs_with_widths = verify_widths(ttFont, hbFont, check_text)
+        glyphs_with_widths = verify_widths(ttFont, shaper, check_text)
         if len(glyphs_with_widths) > 1:
             yield FAIL, (
                 f"tnum glyphs appear not to align:\n{format_glyphs_by_width(glyphs_with_widths)}"
@@ -1,8 +1,94 @@
+import logging
 import os
+import tempfile
+import threading
+import traceback
 
+from fontTools import version as fonttools_version
+from fontTools.misc.loggingTools import DEFAULT_FORMATS, LevelFormatter
+from fontTools.ttLib import TTFont, TTLibError
+
+from fontbakery.cache import tool_cache
 from fontbakery.prelude import check, FAIL, INFO
 from fontbakery.testable import TTCFont
 
+# The size of TTX dumps beyond which they are written to a temporary file.
+XML_IN_MEMORY_SIZE = 64 * 1024 * 1024
+
+
+class _ThreadLogHandler(logging.Handler):
+    """Collects the fontTools log messages of the current thread, as ttx
+    would print them."""
+
+    def __init__(self):
+        super().__init__(logging.WARNING)
+        self.setFormatter(LevelFormatter(DEFAULT_FORMATS))
+        self.thread = threading.get_ident()
+        self.messages = []
+
+    def filter(self, record):
+        return record.thread == self.thread
+
+    def emit(self, record):
+        self.messages.append(self.format(record))
+
+
+def _error_message(error):
+    """The message ttx prints when it fails with the given exception."""
+    if isinstance(error, TTLibError):
+        return f"ERROR: {error}"
+    return "ERROR: Unhandled exception has occurred\n" + "".join(
+        traceback.format_exception(type(error), error, error.__traceback__)
+    )
+
+
+def _ttx_roundtrip(font_file, font_number):
+    """Convert a font to TTX and back, as `ttx` on the command line would,
+    and return the messages it printed.
+
+    This runs in-process: the XML is kept in memory (or in a temporary file
+    once it grows large) and fontTools' log messages are captured."""
+    logger = logging.getLogger("fontTools")
+    export_log = _ThreadLogHandler()
+    import_log = _ThreadLogHandler()
+    import_returncode = 0
+    with tempfile.SpooledTemporaryFile(max_size=XML_IN_MEMORY_SIZE) as xml:
+        logger.addHandler(export_log)
+        try:
+            ttFont = TTFont(
+                font_file,
+                0,
+                ignoreDecompileErrors=True,
+                fontNumber=-1 if font_number is None else font_number,
+            )
+            ttFont.saveXML(xml)
+            ttFont.close()
+        except Exception as error:
+            export_log.messages.append(_error_message(error))
+        finally:
+            logger.removeHandler(export_log)
+
+        xml.seek(0)
+        logger.addHandler(import_log)
+        try:
+            ttFont = TTFont()
+            ttFont.importXML(xml)
+            with open(os.devnull, "wb") as output:
+                ttFont.save(output)
+        except Exception as error:
+            import_log.messages.append(_error_message(error))
+            import_returncode = 1
+        finally:
+            logger.removeHandler(import_log)
+
+    return {
+        "export_stdout": "",
+        "export_stderr": "\n".join(export_log.messages),
+        "import_returncode": import_returncode,
+        "import_stdout": "",
+        "import_stderr": "\n".join(import_log.messages),
+    }
+
 
 @check(
     id="ttx_roundtrip",
@@ -18,29 +104,18 @@ from fontbakery.testable import TTCFont
 )
 def check_ttx_roundtrip(font):
     """Checking with fontTools.ttx"""
-    from fontTools import ttx
-    import subprocess
-    import sys
-    import tempfile
-
-    font_file = font.file
-    if isinstance(font, TTCFont):
-        ttFont = ttx.TTFont(font.file, fontNumber=font.index)
-        ttf_fd, font_file = tempfile.mkstemp()
-        os.close(ttf_fd)
-        ttFont.save(font_file)
-
-    xml_fd, xml_file = tempfile.mkstemp()
-    os.close(xml_fd)
-
-    export_process = subprocess.Popen(
-        # TTX still emits warnings & errors even when -q (quiet) is passed
-        [sys.executable, "-m", "fontTools.ttx", "-qo", xml_file, font.file],
-        stdout=subprocess.PIPE,
-        stderr=subprocess.PIPE,
-        universal_newlines=True,
+    # The round trip only runs once on fonts with the same contents.
+    roundtrip = tool_cache().call(
+        _ttx_roundtrip,
+        [font.file],
+        ["in-process", fonttools_version],
+        font.index if isinstance(font, TTCFont) else None,
     )
-    (export_stdout, export_stderr) = export_process.communicate()
+    export_stdout = roundtrip["export_stdout"]
+    export_stderr = roundtrip["export_stderr"]
+    import_stdout = roundtrip["import_stdout"]
+    import_stderr = roundtrip["import_stderr"]
+
     export_error_msgs = []
     for line in export_stdout.splitlines() + export_stderr.splitlines():
         if line not in export_error_msgs:
@@ -57,16 +132,7 @@ def check_ttx_roundtrip(font):
         for msg in export_error_msgs:
             yield FAIL, msg.strip()
 
-    import_process = subprocess.Popen(
-        # TTX still emits warnings & errors even when -q (quiet) is passed
-        [sys.executable, "-m", "fontTools.ttx", "-qo", os.devnull, xml_file],
-        stdout=subprocess.PIPE,
-        stderr=subprocess.PIPE,
-        universal_newlines=True,
-    )
-    (import_stdout, import_stderr) = import_process.communicate()
-
-    if import_process.returncode != 0:
+    if roundtrip["import_returncode"] != 0:
         yield FAIL, (
             "TTX had some problem parsing the generated XML file."
             " This most likely mean there's some problem in the font."
@@ -92,9 +158,3 @@ def check_ttx_roundtrip(font):
         )
         for msg in import_error_msgs:
             yield FAIL, msg.strip()
-
-    # and then we need to cleanup our mess...
-    if os.path.exists(xml_file):
-        os.remove(xml_file)
-    if font_file != font.file and os.path.exists(font_file):
-        os.remove(font_file)
@@ -1,4 +1,3 @@
-from fontTools.pens.boundsPen import BoundsPen
 from fontbakery.prelude import check, Message, PASS, FAIL, WARN, SKIP
 
 
@@ -19,39 +18,28 @@ from fontbakery.prelude import check, Message, PASS, FAIL, WARN, SKIP
     """,
     proposal="https://github.com/fonttools/fontbakery/issues/3170",
 )
-def check_typoascender_exceeds_Agrave(ttFont):
+def check_typoascender_exceeds_Agrave(ttFont, font):
     """Checking that the typoAscender exceeds the yMax of the /Agrave."""
 
-    # This check modifies the font file with `.draw(pen)`
-    # so here we'll work with a copy of the object so that we
-    # do not affect other checks:
-    from copy import deepcopy
-
-    ttFont_copy = deepcopy(ttFont)
-
-    if "OS/2" not in ttFont_copy:
+    if "OS/2" not in ttFont:
         yield FAIL, Message("lacks-OS/2", "Font file lacks OS/2 table")
         return
 
-    glyphset = ttFont_copy.getGlyphSet()
+    glyph_metrics = font.glyph_metrics
 
-    if "Agrave" not in glyphset and "uni00C0" not in glyphset:
+    if "Agrave" not in glyph_metrics and "uni00C0" not in glyph_metrics:
         yield SKIP, Message(
             "lacks-Agrave",
             "Font file lacks the /Agrave, so it can’t be compared with typoAscender",
         )
         return
 
-    pen = BoundsPen(glyphset)
-
-    try:
-        glyphset["Agrave"].draw(pen)
-    except KeyError:
-        glyphset["uni00C0"].draw(pen)
-
-    yMax = pen.bounds[-1]
+    if "Agrave" in glyph_metrics:
+        yMax = glyph_metrics.bounds("Agrave")[-1]
+    else:
+        yMax = glyph_metrics.bounds("uni00C0")[-1]
 
-    typoAscender = ttFont_copy["OS/2"].sTypoAscender
+    typoAscender = ttFont["OS/2"].sTypoAscender
 
     if typoAscender < yMax:
         yield WARN, Message(
@@ -1,3 +1,4 @@
+from fontbakery.cache import tool_cache, tool_version
 from fontbakery.prelude import check, ERROR, FAIL, PASS, Message
 
 
@@ -16,20 +17,25 @@ def check_ufolint(ufo):
     # IMPORTANT: This check cannot use the 'ufo_font' condition because it makes it
     # skip malformed UFOs (e.g. if metainfo.plist file is missing).
 
-    import subprocess
-
     ufolint_cmd = ["ufolint", ufo.file]
 
     try:
-        subprocess.check_output(ufolint_cmd, stderr=subprocess.STDOUT)
-    except subprocess.CalledProcessError as e:
+        process = tool_cache().run(
+            ufolint_cmd,
+            [ufo.file],
+            tool_version("ufolint", "ufolint"),
+            merge_output=True,
+        )
+    except OSError:
+        yield ERROR, Message("ufolint-unavailable", "ufolint is not available!")
+        return
+
+    if process.returncode:
         yield FAIL, Message(
             "ufolint-fail",
             ("ufolint failed the UFO source. Output follows :" "\n\n{}\n").format(
-                e.output.decode()
+                process.stdout.decode()
             ),
         )
-    except OSError:
-        yield ERROR, Message("ufolint-unavailable", "ufolint is not available!")
     else:
         yield PASS, "ufolint passed the UFO source."
@@ -1,7 +1,5 @@
-from copy import deepcopy
-
 from fontbakery.prelude import check, Message, WARN, PASS
-from fontbakery.utils import bullet_list
+from fontbakery.utils import bullet_list, ExtensionLookup
 
 
 @check(
@@ -21,11 +19,6 @@ from fontbakery.utils import bullet_list
 def unreachable_glyphs(ttFont, config):
     """Check font contains no unreachable glyphs"""
 
-    # remove_lookup_outputs() mutates the TTF; deep copy to avoid this, and so
-    # avoid issues with concurrent tests that also use ttFont.
-    # See https://github.com/fonttools/fontbakery/issues/4834
-    ttFont = deepcopy(ttFont)
-
     def remove_lookup_outputs(all_glyphs, lookup):
         if lookup.LookupType == 1:  # Single:
             # Replace one glyph with one glyph
@@ -61,9 +54,7 @@ def unreachable_glyphs(ttFont, config):
         if lookup.LookupType == 7:  # Extension Substitution:
             # Extension mechanism for other substitutions
             for xt in lookup.SubTable:
-                xt.SubTable = [xt.ExtSubTable]
-                xt.LookupType = xt.ExtSubTable.LookupType
-                remove_lookup_outputs(all_glyphs, xt)
+                remove_lookup_outputs(all_glyphs, ExtensionLookup(lookup, xt))
 
         if lookup.LookupType == 8:  # Reverse chaining context single:
             # Applied in reverse order,
@@ -1,7 +1,8 @@
 from collections import defaultdict
 
+from fontbakery.kerning import KerningModel
 from fontbakery.prelude import check, Message, FAIL, SKIP
-from fontbakery.utils import all_kerning, bullet_list
+from fontbakery.utils import bullet_list
 
 
 @check(
@@ -62,23 +63,29 @@ def check_varfont_duplexed_axis_reflow(font, ttFont, config):
                     effective_regions.add(ix)
 
         if effective_regions:
-            kerning = all_kerning(ttFont)
-            for left, right, v1, v2 in kerning:
-                if v1 and hasattr(v1, "XAdvDevice") and v1.XAdvDevice:
-                    variation = [v1.XAdvDevice.StartSize, v1.XAdvDevice.EndSize]
-                    regions = varstore.VarData[variation[0]].VarRegionIndex
-                    if any(region in effective_regions for region in regions):
-                        deltas = varstore.VarData[variation[0]].Item[variation[1]]
-                        effective_deltas = [
-                            deltas[ix]
-                            for ix, region in enumerate(regions)
-                            if region in effective_regions
-                        ]
-                        if any(x for x in effective_deltas):
-                            yield FAIL, Message(
-                                "duplexed-kern-causes-reflow",
-                                f"Kerning rules cause variation in"
-                                f" horizontal advance on a duplexed axis"
-                                f" (e.g. {left}/{right})",
-                            )
-                            break
+
+            def varies_on_duplexed_axis(value1, _value2):
+                if not (value1 and getattr(value1, "XAdvDevice", None)):
+                    return False
+                variation = [value1.XAdvDevice.StartSize, value1.XAdvDevice.EndSize]
+                regions = varstore.VarData[variation[0]].VarRegionIndex
+                if not any(region in effective_regions for region in regions):
+                    return False
+                deltas = varstore.VarData[variation[0]].Item[variation[1]]
+                return any(
+                    deltas[ix]
+                    for ix, region in enumerate(regions)
+                    if region in effective_regions
+                )
+
+            # Class kerning is not expanded into glyph pairs: a single
+            # offending rule is enough, and any of its pairs is an example.
+            rule = next(KerningModel(ttFont).rules(varies_on_duplexed_axis), None)
+            if rule:
+                left, right = rule.lefts[0], rule.rights[0]
+                yield FAIL, Message(
+                    "duplexed-kern-causes-reflow",
+                    f"Kerning rules cause variation in"
+                    f" horizontal advance on a duplexed axis"
+                    f" (e.g. {left}/{right})",
+                )
@@ -12,8 +12,15 @@ from fontbakery.constants import (
     UnicodeEncodingID,
     WindowsLanguageID,
 )
+from fontbakery.reference_data import glyphsets as gf_glyphsets
 from fontbakery.utils import exit_with_install_instructions
-from fontbakery.checks.vendorspecific.googlefonts.utils import parse_html
+from fontbakery.checks.vendorspecific.googlefonts.utils import (
+    copyright_link,
+    html_links,
+    is_email_link,
+    parse_html,
+    production_metadata_json,
+)
 
 # @condition
 # def glyphsFile(glyphs_file):
@@ -102,32 +109,31 @@ def canonical_stylename(font):
         return s
 
 
-@condition(Font)
+@condition(Font, shared_by="family_directory")
 def article(font):
     """Read article/ARTICLE.en_us.html file from a font directory."""
-    descfile = os.path.join(os.path.dirname(font.file), "article", "ARTICLE.en_us.html")
+    descfile = os.path.join(font.family_directory, "article", "ARTICLE.en_us.html")
     if os.path.exists(descfile):
         return open(descfile, "r", encoding="utf-8").read()
     else:
         return None
 
 
-@condition(Font)
+@condition(Font, shared_by="family_directory")
 def article_html(font):
     return parse_html(font.article)
 
 
-@condition(Font)
+@condition(Font, shared_by="family_directory")
 def descfile(font):
     """Get the path of the DESCRIPTION file of a given font project."""
     if font:
-        directory = os.path.dirname(font.file)
-        descfilepath = os.path.join(directory, "DESCRIPTION.en_us.html")
+        descfilepath = os.path.join(font.family_directory, "DESCRIPTION.en_us.html")
         if os.path.exists(descfilepath):
             return descfilepath
 
 
-@condition(Font)
+@condition(Font, shared_by="family_directory")
 def description(font):
     """Get the contents of the DESCRIPTION file of a font project."""
     if not font.descfile:
@@ -137,7 +143,7 @@ def description(font):
     return io.open(font.descfile, "r", encoding="utf-8").read()
 
 
-@condition(Font)
+@condition(Font, shared_by="family_directory")
 def description_html(font):
     return parse_html(font.description)
 
@@ -166,7 +172,24 @@ def description_and_article_html(font):
     return result
 
 
-@condition(Font)
+@condition(Font, shared_by="family_directory")
+def description_link_statuses(font):
+    """The links of the description and article, but email addresses, with
+    the futures of their statuses (see fontbakery.cache.LinkChecker).
+
+    The links start being checked as soon as this is computed, ahead of the
+    checks needing it, so that meanwhile other checks can run."""
+    from fontbakery.cache import link_checker
+
+    return {
+        link: link_checker().submit(link)
+        for doc in font.description_and_article_html.values()
+        for link in html_links(doc)
+        if not is_email_link(link)
+    }
+
+
+@condition(Font, shared_by="family_directory")
 def metadata_file(font, metadata_pb=None):
     if metadata_pb:
         if isinstance(metadata_pb, list):
@@ -180,7 +203,7 @@ def metadata_file(font, metadata_pb=None):
             return pb_file
 
 
-@condition(Font)
+@condition(Font, shared_by="family_directory")
 def family_metadata_text_content(font):
     if not font.metadata_file:
         return
@@ -188,7 +211,7 @@ def family_metadata_text_content(font):
     return open(font.metadata_file, "r", encoding="utf-8").read()
 
 
-@condition(Font)
+@condition(Font, shared_by="family_directory")
 def family_metadata(font):
     if not font.metadata_file:
         return
@@ -208,6 +231,18 @@ def family_metadata(font):
         return None
 
 
+@condition(Font, shared_by="family_directory")
+def metadata_link_statuses(font):
+    """The links in the copyright notices of METADATA.pb, with the futures
+    of their statuses, like description_link_statuses."""
+    from fontbakery.cache import link_checker
+
+    if not font.family_metadata:
+        return {}
+    links = [copyright_link(f.copyright) for f in font.family_metadata.fonts]
+    return {link: link_checker().submit(link) for link in links if link}
+
+
 @condition(Font)
 def is_ofl(font):
     return font.license_filename and "OFL" in font.license_filename
@@ -249,7 +284,14 @@ def best_familyname(font):
 
 @condition(Font)
 def listed_on_gfonts_api(font):
-    if not font.context.network or not font.google_familyname:
+    # The Google Fonts data is downloaded or, offline, taken from the copies
+    # kept in the download cache by earlier runs. The network condition is
+    # read either way, so that the results are never cached (see
+    # CheckRunner._result_cache_key).
+    remote_data = font.context.network or font.context.config.get("offline")
+    if not remote_data or not font.google_familyname:
+        return
+    if font.context.production_metadata is None:
         return
     for item in font.context.production_metadata["familyMetadataList"]:
         if item["family"] == font.google_familyname:
@@ -326,29 +368,32 @@ def remote_styles(font):
     """Get a dictionary of TTFont objects of all font files of
     a given family as currently hosted at Google Fonts.
     """
-    from fontbakery.utils import download_file
+    from fontbakery.cache import NotCached, http_cache
     import json
-    import requests
 
-    if not font.context.network or not font.listed_on_gfonts_api:
+    remote_data = font.context.network or font.context.config.get("offline")
+    if not remote_data or not font.listed_on_gfonts_api:
         return None
 
     # download_family_from_Google_Fonts
     dl_url = "https://fonts.google.com/download/list?family={}"
     family_name = font.google_familyname
     url = dl_url.format(family_name.replace(" ", "%20"))
-    data = json.loads(requests.get(url, timeout=10).text[5:])
-    remote_fonts = []
-    for item in data["manifest"]["fileRefs"]:
-        filename = item["filename"]
-        dl_url = item["url"]
-        if "static" in filename:
-            continue
-        if not filename.endswith(("otf", "ttf")):
-            continue
-        file_obj = download_file(dl_url)
-        if file_obj:
-            remote_fonts.append(TTFont(file_obj))
+    offline = bool(font.context.config.get("offline"))
+    try:
+        data = json.loads(http_cache().get(url, timeout=10, offline=offline)[5:])
+        font_urls = [
+            item["url"]
+            for item in data["manifest"]["fileRefs"]
+            if "static" not in item["filename"]
+            and item["filename"].endswith(("otf", "ttf"))
+        ]
+        # All the files of the family are downloaded at once.
+        font_files = http_cache().prefetch(font_urls, timeout=10, offline=offline)
+    except NotCached:
+        # Offline, without a copy of the family from an earlier run.
+        return None
+    remote_fonts = [TTFont(font_file) for font_file in font_files]
 
     rstyles = {}
     for remote_font in remote_fonts:
@@ -477,17 +522,27 @@ def gfonts_repo_structure(self):
 
 @condition(CheckRunContext)
 def production_metadata(context):
-    """Get the Google Fonts production metadata"""
-    if not context.network:
+    """Get the Google Fonts production metadata, once for all the families
+    of a --batch run."""
+    from fontbakery.cache import NotCached
+
+    if not context.network and not context.config.get("offline"):
         return
 
-    import requests
+    def download():
+        return production_metadata_json(
+            context.config.get("timeout"), bool(context.config.get("offline"))
+        )
 
-    meta_url = "https://fonts.google.com/metadata/fonts"
-    return requests.get(meta_url, timeout=context.config.get("timeout")).json()
+    try:
+        if context.run_values is None:
+            return download()
+        return context.run_values.get("production_metadata", download)
+    except NotCached:
+        return None
 
 
-@condition(Font)
+@condition(Font, shared_by="family_directory")
 def upstream_yaml(font):
     fp = os.path.join(font.family_directory, "upstream.yaml")
     if not os.path.isfile(fp):
@@ -500,12 +555,17 @@ def is_noto(font):
     return font.font_familyname.startswith("Noto ")
 
 
-# Note that this is not a condition!
-def expected_font_names(ttFont, ttFonts):
+def build_expected_font_names(ttFont, ttFonts):
+    """A font with copies of the name, fvar, STAT, OS/2, post and head tables
+    of ttFont, rebuilt the way the Google Fonts tooling (axisregistry) would
+    build them for it, given the other fonts of its family.
+
+    This is costly, so checks should use the ``expected_font_names``
+    condition instead, which only builds them once per font."""
     from axisregistry import build_name_table, build_fvar_instances, build_stat
     from copy import deepcopy
 
-    siblings = [f for f in ttFonts if f != ttFont]
+    siblings = [f for f in ttFonts if f is not ttFont]
     font_cp = TTFont()
     for table in ["fvar", "name", "STAT", "OS/2", "post", "head"]:
         if table in ttFont:
@@ -517,6 +577,20 @@ def expected_font_names(ttFont, ttFonts):
     return font_cp
 
 
+@condition(Font)
+def expected_font_names(font):
+    """The tables that the Google Fonts tooling would build for the font,
+    see build_expected_font_names. Shared by all the naming checks."""
+    return build_expected_font_names(font.ttFont, font.context.ttFonts)
+
+
+@condition(Font)
+def glyphsets_fulfilled(font):
+    """How much of each Google Fonts glyph set the font covers, like glyphsets'
+    get_glyphsets_fulfilled (see fontbakery.reference_data.Glyphsets)."""
+    return gf_glyphsets().fulfilled(font.font_codepoints)
+
+
 @condition(Font)
 def is_claiming_to_be_cjk_font(font):
     """Test font object to confirm that it meets our definition of a CJK font file.
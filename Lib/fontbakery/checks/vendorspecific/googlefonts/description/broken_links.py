@@ -1,4 +1,8 @@
 from fontbakery.prelude import check, Message, FAIL, WARN
+from fontbakery.checks.vendorspecific.googlefonts.utils import (
+    html_links,
+    is_email_link,
+)
 
 
 @check(
@@ -14,41 +18,28 @@ from fontbakery.prelude import check, Message, FAIL, WARN
         "https://github.com/fonttools/fontbakery/issues/4829",  # legacy check
     ],
 )
-def check_description_broken_links(description_and_article_html, font):
+def check_description_broken_links(
+    description_and_article_html, description_link_statuses
+):
     """Does DESCRIPTION file contain broken links?"""
-    import requests
-
     for source, doc in description_and_article_html.items():
         broken_links = []
-        unique_links = []
-        for a_href in doc.iterfind(".//a[@href]"):
-            link = a_href.get("href")
-
-            # avoid requesting the same URL more then once
-            if link in unique_links:
-                continue
-
-            if link.startswith("mailto:") and "@" in link and "." in link.split("@")[1]:
+        for link in html_links(doc):
+            if is_email_link(link):
                 yield FAIL, Message("email", f"Found an email address: {link}")
                 continue
 
-            unique_links.append(link)
-            try:
-                response = requests.head(link, allow_redirects=True, timeout=10)
-                code = response.status_code
-                # Status 429: "Too Many Requests" is acceptable
-                # because it means the website is probably ok and
-                # we're just perhaps being too agressive in probing the server!
-                if code not in [requests.codes.ok, requests.codes.too_many_requests]:
-                    broken_links.append(f"{link} (status code: {code})")
-            except requests.exceptions.Timeout:
+            status = description_link_statuses[link].result()
+            if status.error == "timeout":
                 yield WARN, Message(
                     "timeout",
                     f"Timedout while attempting to access: '{link}'."
                     f" Please verify if that's a broken link.",
                 )
-            except requests.exceptions.RequestException:
+            elif status.error:
                 broken_links.append(link)
+            elif not status.ok:
+                broken_links.append(f"{link} (status code: {status.status_code})")
 
         if broken_links:
             broken_links_list = "\n\t".join(broken_links)
@@ -1,4 +1,3 @@
-from fontbakery.checks.vendorspecific.googlefonts.conditions import expected_font_names
 from fontbakery.prelude import check, Message, FAIL, WARN
 from fontbakery.constants import (
     NameID,
@@ -18,8 +17,9 @@ from fontbakery.utils import markdown_table
     """,
     proposal="https://github.com/fonttools/fontbakery/pull/3800",
 )
-def check_font_names(ttFont, ttFonts):
+def check_font_names(font):
     """Check font names are correct"""
+    ttFont = font.ttFont
     if "fvar" in ttFont and "MORF" in [a.axisTag for a in ttFont["fvar"].axes]:
         yield WARN, Message(
             "morf-axis",
@@ -29,7 +29,6 @@ def check_font_names(ttFont, ttFonts):
             "on major platforms. You can use Agu Display as a reference.",
         )
         return
-    expected_names = expected_font_names(ttFont, ttFonts)
 
     def style_names(nametable):
         res = {}
@@ -47,7 +46,7 @@ def check_font_names(ttFont, ttFonts):
         return res
 
     font_names = style_names(ttFont["name"])
-    expected_names = style_names(expected_names["name"])
+    expected_names = style_names(font.expected_font_names["name"])
 
     name_ids = {
         NameID.FONT_FAMILY_NAME: "Family Name",
@@ -1,4 +1,3 @@
-from fontbakery.checks.vendorspecific.googlefonts.conditions import expected_font_names
 from fontbakery.prelude import FAIL, WARN, Message, check
 from fontbakery.utils import markdown_table
 
@@ -15,9 +14,8 @@ from fontbakery.utils import markdown_table
     """,
     proposal="https://github.com/fonttools/fontbakery/pull/3800",
 )
-def check_fvar_instances(ttFont, ttFonts):
+def check_fvar_instances(ttFont, expected_font_names):
     """Check variable font instances"""
-    expected_names = expected_font_names(ttFont, ttFonts)
 
     def get_instances(ttFont):
         name = ttFont["name"]
@@ -31,7 +29,7 @@ def check_fvar_instances(ttFont, ttFonts):
         return res
 
     font_instances = get_instances(ttFont)
-    expected_instances = get_instances(expected_names)
+    expected_instances = get_instances(expected_font_names)
     table = []
     for name in set(font_instances.keys()) | set(expected_instances.keys()):
         row = {"Name": name}
@@ -14,17 +14,14 @@ from fontbakery.utils import (
     """,
     proposal="https://github.com/fonttools/fontbakery/pull/2488",
 )
-def check_glyph_coverage(ttFont, family_metadata, config):
+def check_glyph_coverage(ttFont, family_metadata, glyphsets_fulfilled, config):
     """Check Google Fonts glyph coverage."""
     import unicodedata2
-    from glyphsets import get_glyphsets_fulfilled
 
     if is_icon_font(ttFont, config):
         yield SKIP, "This is an icon font or a symbol font."
         return
 
-    glyphsets_fulfilled = get_glyphsets_fulfilled(ttFont)
-
     # If we have a primary_script set, we only need care about Kernel
     if family_metadata and family_metadata.primary_script:
         required_glyphset = "GF_Latin_Kernel"
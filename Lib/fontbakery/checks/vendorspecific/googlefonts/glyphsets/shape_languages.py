@@ -1,10 +1,69 @@
-from glyphsets import languages_per_glyphset, get_glyphsets_fulfilled
-from shaperglot import Checker
-from shaperglot import Languages
+from collections import OrderedDict
+import hashlib
+import threading
 
 from fontbakery.prelude import check, Message, FAIL, WARN
+from fontbakery.profiling import waiting_for
+from fontbakery.reference_data import glyphsets as gf_glyphsets
+from fontbakery.reference_data import shaperglot_languages
 from fontbakery.utils import markdown_table
 
+# A lock, and the warning and failure messages of shaperglot for each
+# language, by the digest of the font tables which they depend on (see
+# _shaping_digest). Only the most recently used ones are kept.
+_language_results = OrderedDict()
+_max_cached_digests = 100
+_lock = threading.Lock()
+
+
+def _shaping_digest(path):
+    """A digest of the tables which shaping text with a font depends on.
+
+    Fonts which only differ in their outlines and metrics, as the weights of
+    a family often do, shape every language the same way."""
+    from fontTools.ttLib.sfnt import SFNTReader
+
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        reader = SFNTReader(f)
+        for tag in ("cmap", "GDEF", "GSUB", "GPOS"):
+            data = reader[tag] if tag in reader else b""
+            digest.update(f"{tag}:{len(data)}:".encode("ascii") + data)
+    return digest.hexdigest()
+
+
+def shape_languages(path, language_codes):
+    """The warning and failure messages of shaperglot for each of the given
+    languages, shaped with the font file.
+
+    The languages that were already shaped with the same tables, in this
+    process, are not shaped again. The others are shaped in one batch, while
+    other threads wanting them for the same tables wait for it."""
+    from shaperglot import Checker
+
+    key = _shaping_digest(path)
+    with _lock:
+        if key in _language_results:
+            _language_results.move_to_end(key)
+        else:
+            _language_results[key] = (threading.Lock(), {})
+            if len(_language_results) > _max_cached_digests:
+                _language_results.popitem(last=False)
+        lock, results = _language_results[key]
+
+    with waiting_for(lock):
+        missing = [code for code in language_codes if code not in results]
+        if missing:
+            checker = Checker(path)
+            languages = shaperglot_languages()
+            for code in missing:
+                reporter = checker.check(languages[code])
+                results[code] = (
+                    [w.message for w in reporter.warns],
+                    [f.message for f in reporter.fails],
+                )
+        return {code: results[code] for code in language_codes}
+
 
 @check(
     id="googlefonts/glyphsets/shape_languages",
@@ -18,7 +77,7 @@ from fontbakery.utils import markdown_table
     ],  # use Shaperglot, which uses youseedee, which downloads Unicode files
     proposal=["https://github.com/googlefonts/fontbakery/issues/4147"],
 )
-def check_glyphsets_shape_languages(ttFont, config):
+def check_glyphsets_shape_languages(ttFont, glyphsets_fulfilled, config):
     """Shapes languages in all GF glyphsets."""
 
     def table_of_results(level, results):
@@ -35,30 +94,30 @@ def check_glyphsets_shape_languages(ttFont, config):
             )
         return markdown_table(results_table)
 
-    shaperglot_checker = Checker(ttFont.reader.file.name)
-    shaperglot_languages = Languages()
+    languages = shaperglot_languages()
     any_glyphset_supported = False
 
-    warns = {}
-    fails = {}
-    glyphsets_fulfilled = get_glyphsets_fulfilled(ttFont)
+    language_codes = []
     for glyphset in glyphsets_fulfilled:
         if glyphsets_fulfilled[glyphset]["percentage"] > 0.8:
             any_glyphset_supported = True
-            for language_code in languages_per_glyphset(glyphset):
-                reporter = shaperglot_checker.check(shaperglot_languages[language_code])
-                name = shaperglot_languages[language_code]["name"]
-                language_string = f"{language_code} ({name})"
-
-                for w in reporter.warns:
-                    if w.message not in warns.keys():
-                        warns[w.message] = []
-                    warns[w.message].append(language_string)
-
-                for f in reporter.fails:
-                    if f.message not in fails.keys():
-                        fails[f.message] = []
-                    fails[f.message].append(language_string)
+            language_codes.extend(gf_glyphsets().languages(glyphset))
+
+    warns = {}
+    fails = {}
+    results = shape_languages(
+        ttFont.reader.file.name, list(dict.fromkeys(language_codes))
+    )
+    for language_code in language_codes:
+        name = languages[language_code]["name"]
+        language_string = f"{language_code} ({name})"
+        warn_messages, fail_messages = results[language_code]
+
+        for message in warn_messages:
+            warns.setdefault(message, []).append(language_string)
+
+        for message in fail_messages:
+            fails.setdefault(message, []).append(language_string)
 
     if fails:
         yield FAIL, Message(
@@ -1,8 +1,5 @@
 from fontbakery.prelude import check, Message, FAIL, WARN
-from fontbakery.utils import (
-    can_shape,
-    exit_with_install_instructions,
-)
+from fontbakery.reference_data import languages as gf_languages
 
 
 @check(
@@ -18,14 +15,9 @@ from fontbakery.utils import (
         "https://github.com/fonttools/fontbakery/issues/3605",
     ],
 )
-def check_metadata_can_render_samples(ttFont, family_metadata):
+def check_metadata_can_render_samples(shaper, family_metadata):
     """Check samples can be rendered."""
-    try:
-        from gflanguages import LoadLanguages
-    except ImportError:
-        exit_with_install_instructions("googlefonts")
-
-    languages = LoadLanguages()
+    languages = gf_languages()
     for lang in family_metadata.languages:
         if lang not in languages:
             yield WARN, Message(
@@ -52,7 +44,7 @@ def check_metadata_can_render_samples(ttFont, family_metadata):
             # For more info, see https://github.com/fonttools/fontbakery/issues/3990
             sample_text = sample_text.replace("\n", "").replace("\u200b", "")
 
-            if not can_shape(ttFont, sample_text):
+            if not shaper.can_shape(sample_text):
                 yield FAIL, Message(
                     "sample-text",
                     f'Font can\'t render "{lang}" sample text:\n"{sample_text}"\n',
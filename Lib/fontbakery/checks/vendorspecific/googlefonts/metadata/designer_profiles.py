@@ -1,5 +1,6 @@
 import requests
 
+from fontbakery.cache import http_cache, link_checker
 from fontbakery.prelude import check, Message, FAIL, WARN
 from fontbakery.checks.vendorspecific.googlefonts.utils import (
     get_DesignerInfoProto_Message,
@@ -72,7 +73,10 @@ def check_metadata_designer_profiles(family_metadata, config):
             continue
 
         url = DESIGNER_INFO_RAW_URL.format(normalized_name) + "info.pb"
-        response = requests.get(url, timeout=config.get("timeout"))
+        try:
+            info_pb = http_cache().get(url, timeout=config.get("timeout"))
+        except requests.HTTPError:
+            info_pb = None
 
         # https://github.com/fonttools/fontbakery/pull/3892#issuecomment-1248758859
         # For debugging purposes:
@@ -80,7 +84,7 @@ def check_metadata_designer_profiles(family_metadata, config):
         #      Message("config",
         #              f"Config is '{config}'")
 
-        if response.status_code != requests.codes.OK:
+        if info_pb is None:
             yield WARN, Message(
                 "profile-not-found",
                 f"It seems that {designer} is still not listed on"
@@ -90,7 +94,7 @@ def check_metadata_designer_profiles(family_metadata, config):
             )
             continue
 
-        info = get_DesignerInfoProto_Message(response.content)
+        info = get_DesignerInfoProto_Message(info_pb)
         if info.designer != designer.strip():
             yield FAIL, Message(
                 "mismatch",
@@ -117,8 +121,7 @@ def check_metadata_designer_profiles(family_metadata, config):
             avatar_url = (
                 DESIGNER_INFO_RAW_URL.format(normalized_name) + info.avatar.file_name
             )
-            response = requests.get(avatar_url, timeout=config.get("timeout"))
-            if response.status_code != requests.codes.OK:
+            if not link_checker().status(avatar_url, config.get("timeout")).ok:
                 yield FAIL, Message(
                     "bad-avatar-filename",
                     "The avatar filename provided seems to be incorrect:"
@@ -1,6 +1,5 @@
-from collections import defaultdict
-
 from fontbakery.prelude import FAIL, WARN, Message, check
+from fontbakery.reference_data import subsets as gf_subsets
 from fontbakery.utils import exit_with_install_instructions
 
 
@@ -26,7 +25,7 @@ def check_metadata_unreachable_subsetting(font, config):
     """Check for codepoints not covered by METADATA subsets."""
     try:
         import unicodedata2
-        from gfsubsets import CodepointsInSubset, ListSubsets, SubsetsInFont
+        from gfsubsets import SubsetsInFont
     except ImportError:
         exit_with_install_instructions("googlefonts")
 
@@ -48,22 +47,15 @@ def check_metadata_unreachable_subsetting(font, config):
 
     font_codepoints = font.font_codepoints
     for subset in subsets:
-        font_codepoints = font_codepoints - set(CodepointsInSubset(subset))
+        font_codepoints = font_codepoints - gf_subsets().codepoints(subset)
 
     if not font_codepoints:
         # it is all fine!
         return
 
     unreachable = []
-    subsets_for_cps = defaultdict(set)
-    # This is faster than calling SubsetsForCodepoint for each codepoint
-    for subset in ListSubsets():
-        cps = CodepointsInSubset(subset, unique_glyphs=True)
-        for cp in cps or []:
-            subsets_for_cps[cp].add(subset)
-
     for codepoint in sorted(font_codepoints):
-        subsets_for_cp = subsets_for_cps[codepoint]
+        subsets_for_cp = gf_subsets().subsets_of(codepoint)
 
         if len(subsets_for_cp) == 0:
             message = "not included in any glyphset definition"
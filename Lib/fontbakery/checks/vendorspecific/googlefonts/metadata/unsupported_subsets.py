@@ -1,5 +1,5 @@
 from fontbakery.prelude import FAIL, Message, check
-from fontbakery.utils import exit_with_install_instructions
+from fontbakery.reference_data import subsets as gf_subsets
 
 
 @check(
@@ -17,16 +17,12 @@ from fontbakery.utils import exit_with_install_instructions
 )
 def check_metadata_unsupported_subsets(family_metadata, ttFont, font_codepoints):
     """Check for METADATA subsets with zero support."""
-    try:
-        from gfsubsets import CodepointsInSubset, ListSubsets
-    except ImportError:
-        exit_with_install_instructions("googlefonts")
-
+    subsets = gf_subsets()
     for subset in family_metadata.subsets:
         if subset == "menu":
             continue
 
-        if subset not in ListSubsets():
+        if subset not in subsets:
             yield FAIL, Message(
                 "unknown-subset",
                 f"Please remove the unrecognized subset '{subset}'"
@@ -34,9 +30,9 @@ def check_metadata_unsupported_subsets(family_metadata, ttFont, font_codepoints)
             )
             continue
 
-        subset_codepoints = CodepointsInSubset(subset, unique_glyphs=True)
+        subset_codepoints = subsets.codepoints(subset, unique_glyphs=True)
         # All subsets now have these magic codepoints
-        subset_codepoints -= set([0, 13, 32, 160])
+        subset_codepoints = subset_codepoints - {0, 13, 32, 160}
 
         if len(subset_codepoints.intersection(font_codepoints)) == 0:
             yield FAIL, Message(
@@ -5,7 +5,6 @@ from fontbakery.constants import (
     WindowsLanguageID,
 )
 from fontbakery.prelude import check, Message, FAIL
-from fontbakery.utils import can_shape
 
 
 @check(
@@ -16,7 +15,7 @@ from fontbakery.utils import can_shape
     """,
     proposal="https://github.com/fonttools/fontbakery/issues/3159",
 )
-def check_render_own_name(ttFont):
+def check_render_own_name(ttFont, shaper):
     """Ensure font can render its own name."""
     menu_name = (
         ttFont["name"]
@@ -28,7 +27,7 @@ def check_render_own_name(ttFont):
         )
         .toUnicode()
     )
-    if not can_shape(ttFont, menu_name):
+    if not shaper.can_shape(menu_name):
         yield FAIL, Message(
             "render-own-name",
             f".notdef glyphs were found when attempting to render {menu_name}",
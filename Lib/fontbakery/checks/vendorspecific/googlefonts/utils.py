@@ -1,68 +1,19 @@
-import re
-from functools import lru_cache
+from fontbakery.reference_data import axis_registry, vendor_ids
+from fontbakery.utils import exit_with_install_instructions
 
-from fontbakery.utils import exit_with_install_instructions, get_resource_file_contents
+# The checks' names for the datasets of fontbakery.reference_data
+GFAxisRegistry = axis_registry
+registered_vendor_ids = vendor_ids
 
 
-@lru_cache(maxsize=1)
-def GFAxisRegistry():
-    from axisregistry import AxisRegistry
+def production_metadata_json(timeout, offline=False):
+    """The Google Fonts production metadata. Between runs, it is kept in
+    the download cache and only downloaded again when it changed."""
+    import json
+    from fontbakery.cache import http_cache
 
-    return AxisRegistry()
-
-
-@lru_cache(maxsize=1)
-def registered_vendor_ids():
-    """Get a list of vendor IDs from Microsoft's website."""
-
-    try:
-        from bs4 import BeautifulSoup, NavigableString
-    except ImportError:
-        exit_with_install_instructions("googlefonts")
-
-    registered_vendor_ids = {}
-    content = get_resource_file_contents("data/fontbakery-microsoft-vendorlist.cache")
-    # Strip all <A> HTML tags from the raw HTML. The current page contains a
-    # closing </A> for which no opening <A> is present, which causes
-    # beautifulsoup to silently stop processing that section from the error
-    # onwards. We're not using the href's anyway.
-    content = re.sub("<a[^>]*>", "", content, flags=re.IGNORECASE)
-    content = re.sub("</a>", "", content, flags=re.IGNORECASE)
-    soup = BeautifulSoup(content, "html.parser")
-
-    IDs = [chr(c + ord("a")) for c in range(ord("z") - ord("a") + 1)]
-    IDs.append("0-9-")
-
-    for section_id in IDs:
-        section = soup.find("h2", {"id": section_id})
-        if not section:
-            continue
-
-        table = section.find_next_sibling("table")
-        if not table or isinstance(table, NavigableString):
-            continue
-
-        # print ("table: '{}'".format(table))
-        for row in table.findAll("tr"):
-            # print("ROW: '{}'".format(row))
-            cells = row.findAll("td")
-            if not cells:
-                continue
-
-            labels = list(cells[1].stripped_strings)
-
-            # pad the code to make sure it is a 4 char string,
-            # otherwise eg "CF  " will not be matched to "CF"
-            code = cells[0].string.strip()
-            code = code + (4 - len(code)) * " "
-            registered_vendor_ids[code] = labels[0]
-
-            # Do the same with NULL-padding:
-            code = cells[0].string.strip()
-            code = code + (4 - len(code)) * chr(0)
-            registered_vendor_ids[code] = labels[0]
-
-    return registered_vendor_ids
+    meta_url = "https://fonts.google.com/metadata/fonts"
+    return json.loads(http_cache().get(meta_url, timeout=timeout, offline=offline))
 
 
 def get_Protobuf_Message(klass, path):
@@ -98,6 +49,27 @@ def get_DesignerInfoProto_Message(text_data):
     return message
 
 
+def copyright_link(copyright_notice):
+    """The URL in a copyright notice, if any."""
+    if "mailto:" in copyright_notice or "http" not in copyright_notice:
+        return None
+    link = "http" + copyright_notice.split("http")[1]
+    for endchar in [" ", ")"]:
+        if endchar in link:
+            link = link.split(endchar)[0]
+    return link
+
+
+def is_email_link(href):
+    return href.startswith("mailto:") and "@" in href and "." in href.split("@")[1]
+
+
+def html_links(doc):
+    """The targets of the links of an HTML document, in order, without
+    repetitions."""
+    return list(dict.fromkeys(a.get("href") for a in doc.iterfind(".//a[@href]")))
+
+
 def parse_html(html):
     try:
         from lxml import etree
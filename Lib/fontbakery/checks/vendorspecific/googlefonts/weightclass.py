@@ -1,4 +1,3 @@
-from fontbakery.checks.vendorspecific.googlefonts.conditions import expected_font_names
 from fontbakery.prelude import check, Message, FAIL
 
 
@@ -22,13 +21,12 @@ from fontbakery.prelude import check, Message, FAIL
     """,
     proposal="https://github.com/fonttools/fontbakery/issues/4829",  # legacy check
 )
-def check_weightclass(font, ttFonts):
+def check_weightclass(font):
     """
     Check the OS/2 usWeightClass is appropriate for the font's best SubFamily name.
     """
     value = font.ttFont["OS/2"].usWeightClass
-    expected_names = expected_font_names(font.ttFont, ttFonts)
-    expected_value = expected_names["OS/2"].usWeightClass
+    expected_value = font.expected_font_names["OS/2"].usWeightClass
     style_name = font.ttFont["name"].getBestSubFamilyName()
     has_expected_value = value == expected_value
     fail_message = (
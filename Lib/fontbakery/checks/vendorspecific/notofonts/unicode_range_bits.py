@@ -1,10 +1,10 @@
 from fontbakery.prelude import check, WARN, Message
 from fontbakery.constants import UNICODERANGE_DATA
 from fontbakery.utils import (
-    chars_in_range,
-    compute_unicoderange_bits,
+    get_preferred_cmap,
     unicoderange,
     unicoderange_bit_name,
+    unicoderange_chars,
 )
 
 
@@ -22,13 +22,16 @@ from fontbakery.utils import (
 def check_unicode_range_bits(ttFont):
     """Ensure UnicodeRange bits are properly set."""
 
-    expected_unicoderange = compute_unicoderange_bits(ttFont)
+    chars = unicoderange_chars(get_preferred_cmap(ttFont))
+    expected_unicoderange = 0
+    for bit in chars:
+        expected_unicoderange |= 1 << bit
     difference = unicoderange(ttFont) ^ expected_unicoderange
     if difference:
         for bit in range(128):
             if difference & (1 << bit):
                 range_name = unicoderange_bit_name(bit)
-                num_chars = len(chars_in_range(ttFont, bit))
+                num_chars = len(chars.get(bit, []))
                 range_size = sum(
                     entry[3] - entry[2] + 1 for entry in UNICODERANGE_DATA[bit]
                 )
@@ -4,10 +4,7 @@ from fontbakery.prelude import (
     PASS,
     FAIL,
 )
-from fontbakery.utils import (
-    get_glyph_name,
-    glyph_has_ink,
-)
+from fontbakery.utils import get_glyph_name
 
 
 @check(
@@ -20,7 +17,7 @@ from fontbakery.utils import (
        """,
     proposal="https://github.com/fonttools/fontbakery/issues/4829",  # legacy check
 )
-def check_whitespace_ink(ttFont):
+def check_whitespace_ink(ttFont, glyph_metrics):
     """Whitespace glyphs have ink?"""
     # This checks that certain glyphs are empty.
     # Some, but not all, are Unicode whitespace.
@@ -67,7 +64,7 @@ def check_whitespace_ink(ttFont):
     passed = True
     for codepoint in sorted(NON_DRAWING):
         g = get_glyph_name(ttFont, codepoint)
-        if g is not None and glyph_has_ink(ttFont, g):
+        if g is not None and glyph_metrics.has_ink(g):
             passed = False
             yield FAIL, Message(
                 "has-ink",
@@ -3,12 +3,17 @@
 # $ fontbakery check-profile fontbakery.profiles.googlefonts -h
 import argparse
 from collections import OrderedDict
+import json
 import os
+import socket
 import sys
 import signal
 
+from rich.console import Console
+
 from fontbakery import __version__
-from fontbakery.checkrunner import CheckRunner
+from fontbakery.cache import CostHistory, ResultCache
+from fontbakery.checkrunner import CheckRunner, EXECUTORS, run_concurrently
 from fontbakery.status import (
     DEBUG,
     ERROR,
@@ -21,14 +26,20 @@ from fontbakery.status import (
 )
 from fontbakery.configuration import Configuration
 from fontbakery.errors import ValueValidationError
+from fontbakery.profiling import Profiler
 from fontbakery.fonts_profile import (
     profile_factory,
     get_module,
     setup_context,
+    setup_family_contexts,
     ITERARGS,
 )
-from fontbakery.reporters.terminal import TerminalReporter
-from fontbakery.reporters.serialize import JSONReporter
+from fontbakery.reporters.terminal import (
+    SummaryReporter,
+    TerminalReporter,
+    render_slowest,
+)
+from fontbakery.reporters.serialize import JSONReporter, NDJSONReporter
 from fontbakery.reporters.badge import BadgeReporter
 from fontbakery.reporters.ghmarkdown import GHMarkdownReporter
 from fontbakery.reporters.html import HTMLReporter
@@ -104,6 +115,26 @@ def ArgumentParser():
             )
         add_profile_arguments(subparser)
 
+    serve_parser = subparsers.add_parser(
+        "serve",
+        help="Keep the profiles loaded and run the checks requested with --server.",
+        formatter_class=argparse.RawTextHelpFormatter,
+    )
+    serve_parser.add_argument(
+        "--socket",
+        help="Listen on this Unix socket. (default: fontbakery.sock in\n"
+        "$XDG_RUNTIME_DIR, or else in a directory of your own in the\n"
+        "temporary directory)",
+    )
+    serve_parser.add_argument(
+        "profiles",
+        nargs="*",
+        metavar="PROFILE",
+        help="Profiles to load up front, e.g. googlefonts.\n"
+        "Other profiles are loaded the first time they are asked for.",
+    )
+    subcommands.append("serve")
+
     argument_parser.subcommands = subcommands
     return argument_parser
 
@@ -310,6 +341,15 @@ def add_profile_arguments(argument_parser):
         help="Skip network checks",
     )
 
+    network_group.add_argument(
+        "--offline",
+        default=False,
+        action="store_true",
+        help="Don't use the network: take Google Fonts data and reference fonts"
+        " from the copies downloaded by earlier runs, and skip the checks"
+        " which need live network access.",
+    )
+
     report_group = argument_parser.add_argument_group(
         "Reports", "Options which control report generation"
     )
@@ -323,6 +363,16 @@ def add_profile_arguments(argument_parser):
         help="Write a json formatted report to JSON_FILE.",
     )
 
+    report_group.add_argument(
+        "--ndjson",
+        default=False,
+        action=AddReporterAction,
+        cls=NDJSONReporter,
+        metavar="NDJSON_FILE",
+        help="Stream check results to NDJSON_FILE as they come in,"
+        " one JSON object per line.",
+    )
+
     report_group.add_argument(
         "--badges",
         default=False,
@@ -350,6 +400,36 @@ def add_profile_arguments(argument_parser):
         help="Write a HTML report to HTML_FILE.",
     )
 
+    profiling_group = argument_parser.add_argument_group(
+        "Profiling", "Options to find out where the time of a run goes"
+    )
+
+    profiling_group.add_argument(
+        "--trace",
+        metavar="TRACE_FILE",
+        help="Write when each check and condition ran, and the wall time, CPU time\n"
+        "and time waiting for locks they took, to TRACE_FILE in the Chrome\n"
+        "trace event format (see chrome://tracing or https://ui.perfetto.dev).",
+    )
+
+    profiling_group.add_argument(
+        "--slowest",
+        default=0,
+        type=int,
+        metavar="N",
+        help="Print the N slowest checks and conditions at the end of the run.\n"
+        "The time of a check includes the conditions it computed itself.",
+    )
+
+    profiling_group.add_argument(
+        "--trace-memory",
+        default=False,
+        action="store_true",
+        help="Also measure the peak memory allocation of each check and condition.\n"
+        "This slows runs down a lot, and the numbers are only meaningful when\n"
+        "running a single job (-J 1).",
+    )
+
     def positive_int(value):
         int_value = int(value)
         if int_value < 0:
@@ -381,6 +461,45 @@ def add_profile_arguments(argument_parser):
         " as number of worker processes\n"
         "in multi-processing. This is equivalent to : `--jobs %(const)s`",
     )
+    argument_parser.add_argument(
+        "--executor",
+        default="threads",
+        choices=EXECUTORS,
+        help="How the worker pool runs the checks when using more than one job.\n"
+        "'threads' shares all fonts between the workers, but pure-Python checks\n"
+        "are limited to a single core. 'processes' sends all checks of a given\n"
+        "font to the same worker process, so that each font is only loaded once\n"
+        "per process. (default: %(default)s)",
+    )
+    argument_parser.add_argument(
+        "--cache",
+        action="store_true",
+        help="Reuse the results of previous runs for checks whose inputs\n"
+        "(font files, configuration, check source code and fontbakery version)\n"
+        "have not changed. Checks which use the network are always run.\n"
+        "Also keep how long each check took, to start the slowest ones first.\n"
+        "The cache lives in $FONTBAKERY_CACHE_DIR, or ~/.cache/fontbakery.",
+    )
+    argument_parser.add_argument(
+        "--batch",
+        action="store_true",
+        help="Check a whole collection of families. The fonts in each of the\n"
+        "directories given (and in their subdirectories) are checked as a\n"
+        "family of their own, and all families are checked on a single pool of\n"
+        "--jobs worker threads. A summary is printed for each family, and\n"
+        "reports are written per family: their file names must contain\n"
+        '"{family}", e.g. --json "reports/{family}.json".',
+    )
+    argument_parser.add_argument(
+        "--server",
+        nargs="?",
+        const=True,
+        metavar="SOCKET",
+        help="Have a server started with 'fontbakery serve' run the checks,\n"
+        "instead of loading the profile in this process. Only --ndjson\n"
+        "reports can be written in this mode. (default socket: the one\n"
+        "'fontbakery serve' listens on by default)",
+    )
     argument_parser.add_argument(
         "-e",
         "--error-code-on",
@@ -423,6 +542,10 @@ def main():
     elif args.command is None:
         argument_parser.print_usage()
         sys.exit(2)
+    elif args.command == "serve":
+        server = import_server()
+        server.serve(args.socket, args.profiles)
+        return 0
 
     theme = get_theme(args)
 
@@ -431,48 +554,43 @@ def main():
             "check-", ""
         ).replace("-", "_")
 
-    profile = profile_factory(get_module(args.profile))
+    if args.server and not args.list_checks:
+        return run_on_server(args)
+
+    configuration = get_configuration(args)
 
     if args.list_checks:
+        profile = profile_factory(get_module(args.profile))
         # the most verbose loglevel wins
         loglevel = min(args.loglevels) if args.loglevels else DEFAULT_LOG_LEVEL
         list_checks(profile, theme, verbose=loglevel > DEFAULT_LOG_LEVEL)
 
-    if args.configfile:
-        configuration = Configuration.from_config_file(args.configfile)
-    else:
-        configuration = Configuration()
-
-    # Since version 0.8.10, we established a convention of never using a dash/hyphen
-    # on check IDs. The existing ones were replaced by underscores.
-    # All new checks will use underscores when needed.
-    # Here we accept dashes to ensure backwards compatibility with the older
-    # check IDs that may still be referenced on scripts of our users.
-    explicit_checks = None
-    exclude_checks = None
-    if args.checkid:
-        explicit_checks = [c.replace("-", "_") for c in list(args.checkid)]
-    if args.exclude_checkid:
-        exclude_checks = [x.replace("-", "_") for x in list(args.exclude_checkid)]
-
-    # Command line args overrides config, but only if given
-    configuration.maybe_override(
-        Configuration(
-            custom_order=args.order,
-            explicit_checks=explicit_checks,
-            exclude_checks=exclude_checks,
-            full_lists=args.full_lists,
-            skip_network=args.skip_network,
-        )
+    # Only the checks selected with -c (if any) are imported.
+    profile = profile_factory(
+        get_module(args.profile), configuration["explicit_checks"]
     )
 
+    if args.batch:
+        return check_collection(args, profile, configuration, theme)
+
     is_async = args.multiprocessing != 0
 
     context = setup_context(args.files)
-    context.is_multithreaded = is_async
+    # Worker processes each have their own copy of the fonts,
+    # so there's no need to guard them against concurrent access.
+    context.is_multithreaded = is_async and args.executor == "threads"
+    profiler = get_profiler(args)
+    cost_history = CostHistory() if args.cache else None
     try:
         runner = CheckRunner(
-            profile, jobs=args.multiprocessing, context=context, config=configuration
+            profile,
+            jobs=args.multiprocessing,
+            context=context,
+            config=configuration,
+            executor=args.executor,
+            result_cache=ResultCache() if args.cache else None,
+            profiler=profiler,
+            cost_history=cost_history,
         )
     except ValueValidationError as e:
         print(e)
@@ -495,6 +613,8 @@ def main():
         theme=theme,
         print_progress=not args.no_progress,
         quiet=args.quiet,
+        profiler=profiler,
+        slowest=args.slowest,
     )
     reporters = [tr]
 
@@ -518,6 +638,11 @@ def main():
 
     for reporter in reporters:
         reporter.write()
+    if cost_history is not None:
+        cost_history.save()
+
+    if args.trace:
+        profiler.write_trace(args.trace)
 
     # Fail and error let the command fail
     return (
@@ -528,6 +653,236 @@ def main():
     )
 
 
+def get_configuration(args):
+    if args.configfile:
+        configuration = Configuration.from_config_file(args.configfile)
+    else:
+        configuration = Configuration()
+
+    # Since version 0.8.10, we established a convention of never using a dash/hyphen
+    # on check IDs. The existing ones were replaced by underscores.
+    # All new checks will use underscores when needed.
+    # Here we accept dashes to ensure backwards compatibility with the older
+    # check IDs that may still be referenced on scripts of our users.
+    explicit_checks = None
+    exclude_checks = None
+    if args.checkid:
+        explicit_checks = [c.replace("-", "_") for c in list(args.checkid)]
+    if args.exclude_checkid:
+        exclude_checks = [x.replace("-", "_") for x in list(args.exclude_checkid)]
+
+    # Command line args overrides config, but only if given
+    configuration.maybe_override(
+        Configuration(
+            custom_order=args.order,
+            explicit_checks=explicit_checks,
+            exclude_checks=exclude_checks,
+            full_lists=args.full_lists,
+            skip_network=args.skip_network,
+            offline=args.offline or None,
+        )
+    )
+    return configuration
+
+
+def family_names(directories):
+    """Short names for the directories of families, for their reports:
+    their paths from the closest directory which contains all of them."""
+    if len(directories) == 1:
+        return {d: os.path.basename(os.path.abspath(d)) for d in directories}
+    root = os.path.commonpath([os.path.abspath(d) for d in directories])
+    return {d: os.path.relpath(os.path.abspath(d), root) for d in directories}
+
+
+def get_profiler(args):
+    """A profiler for the run, if it is to be profiled."""
+    if args.trace or args.slowest or args.trace_memory:
+        return Profiler(trace_memory=args.trace_memory)
+    return None
+
+
+def check_collection(args, profile, configuration, theme):
+    """Check each family found in the given files and directories, with a
+    summary and a set of reports per family."""
+    if args.executor == "processes":
+        # The families share a single pool of threads (see run_concurrently).
+        sys.exit("--batch can not be combined with --executor processes.")
+
+    try:
+        contexts = setup_family_contexts(args.files)
+    except ValueValidationError as e:
+        print(e)
+        sys.exit(1)
+
+    output_reporters = getattr(args, "reporters", [])
+    if len(contexts) > 1 and any(
+        "{family}" not in output_file for _, output_file in output_reporters
+    ):
+        sys.exit(
+            'The reports of a --batch run must contain "{family}" in their'
+            " file names, so that each family gets reports of its own."
+        )
+
+    jobs = args.multiprocessing
+    loglevels = args.loglevels or [
+        status
+        for status in log_levels.values()
+        if status.weight >= DEFAULT_LOG_LEVEL.weight
+    ]
+    result_cache = ResultCache() if args.cache else None
+    profiler = get_profiler(args)
+    cost_history = CostHistory() if args.cache else None
+    names = family_names(list(contexts))
+    runs = []
+    summaries = []
+    for directory, context in contexts.items():
+        context.is_multithreaded = jobs > 1
+        try:
+            runner = CheckRunner(
+                profile,
+                context,
+                configuration,
+                jobs=jobs,
+                result_cache=result_cache,
+                profiler=profiler,
+                cost_history=cost_history,
+            )
+        except ValueValidationError as e:
+            print(e)
+            sys.exit(1)
+        summary = SummaryReporter(
+            runner=runner,
+            loglevels=loglevels,
+            title=names[directory],
+            theme=theme,
+            quiet=args.quiet,
+        )
+        reporters = [summary]
+        for reporter_class, output_file in output_reporters:
+            output_file = output_file.replace("{family}", names[directory])
+            if os.path.dirname(output_file):
+                os.makedirs(os.path.dirname(output_file), exist_ok=True)
+            reporters.append(
+                reporter_class(
+                    is_async=jobs > 1,
+                    runner=runner,
+                    loglevels=loglevels,
+                    succinct=args.succinct,
+                    collect_results_by=args.gather_by,
+                    output_file=output_file,
+                    quiet=args.quiet,
+                )
+            )
+        runs.append((runner, reporters))
+        summaries.append(summary)
+
+    run_concurrently(runs, jobs)
+    if cost_history is not None:
+        cost_history.save()
+
+    if profiler is not None and args.slowest:
+        console = Console(theme=theme, highlight=False)
+        for table in render_slowest(profiler, args.slowest):
+            console.print(table)
+    if args.trace:
+        profiler.write_trace(args.trace)
+
+    # Fail and error let the command fail
+    worst = [s.worst_check_status for s in summaries if s.worst_check_status]
+    return 1 if worst and max(worst).weight >= args.error_code_on.weight else 0
+
+
+def import_server():
+    """The fontbakery.server module, which is only imported when needed, as
+    it can not be imported on platforms without Unix sockets."""
+    if not hasattr(socket, "AF_UNIX"):
+        sys.exit(
+            "'fontbakery serve' and --server need Unix sockets,"
+            " which are not available on this platform."
+        )
+    from fontbakery import server
+
+    return server
+
+
+def run_on_server(args):
+    """Have a 'fontbakery serve' process run the checks, print the results
+    like the terminal reporter's succinct mode, and write the --ndjson reports."""
+    server = import_server()
+    if args.batch:
+        sys.exit("--batch can not be combined with --server.")
+    if args.trace or args.slowest or args.trace_memory:
+        sys.exit("Runs on a server can not be profiled.")
+    if any(cls is not NDJSONReporter for cls, _ in getattr(args, "reporters", [])):
+        sys.exit("Only --ndjson reports can be written when using --server.")
+
+    profile = args.profile
+    if os.path.exists(profile):
+        profile = os.path.abspath(profile)
+    loglevel = min(args.loglevels) if args.loglevels else DEFAULT_LOG_LEVEL
+    records = server.submit(
+        profile,
+        args.files,
+        get_configuration(args),
+        jobs=args.multiprocessing,
+        cache=args.cache,
+        socket_path=None if args.server is True else args.server,
+    )
+
+    reports = [
+        open(output_file, "w", encoding="utf-8")  # pylint: disable=consider-using-with
+        for _, output_file in getattr(args, "reporters", [])
+    ]
+    worst_check_status = None
+    summarized = False
+    try:
+        for record in records:
+            if record["type"] == "error":
+                print(f"ERROR: {record['message']}", file=sys.stderr)
+                return 1
+
+            for report in reports:
+                report.write(json.dumps(record, sort_keys=True) + "\n")
+
+            if record["type"] == "summary":
+                summarized = True
+                if not args.quiet:
+                    print(
+                        " | ".join(
+                            f"{name}: {record['result'].get(name, 0)}"
+                            for name in log_levels
+                        )
+                    )
+                continue
+
+            status = log_levels[record["result"]]
+            if not record["experimental"] and (
+                worst_check_status is None or worst_check_status < status
+            ):
+                worst_check_status = status
+            if status >= loglevel and not args.quiet:
+                where = f" @ {record['filename']}" if "filename" in record else ""
+                print(f"{status.name}: {record['check_id']}{where}")
+    except OSError as error:
+        print(f"ERROR: Could not reach the server: {error}", file=sys.stderr)
+        return 1
+    finally:
+        for report in reports:
+            report.close()
+
+    if not summarized:
+        print("ERROR: The server stopped before the end of the run.", file=sys.stderr)
+        return 1
+
+    # Fail and error let the command fail
+    return (
+        1
+        if worst_check_status is not None
+        and worst_check_status.weight >= args.error_code_on.weight
+        else 0
+    )
+
+
 def list_checks(profile, theme, verbose=False):
     if verbose:
         for section in profile.sections:
@@ -1,6 +1,8 @@
 """
 FontBakery CheckRunner is the driver of a fontbakery suite of checks.
 """
+from collections import defaultdict
+from functools import cached_property
 import glob
 import importlib
 import inspect
@@ -11,10 +13,20 @@ import warnings
 
 from fontTools.ttLib.sfnt import readTTCHeader
 
+from fontbakery import __version__
 import fontbakery.checks
+from fontbakery.cache import JSONCache, cache_dir, digest
 from fontbakery.callable import FontBakeryCheck
-from fontbakery.testable import CheckRunContext, FILE_TYPES, TTCFont
+from fontbakery.testable import (
+    CheckRunContext,
+    FILE_TYPES,
+    MetadataPB,
+    Readme,
+    SharedValues,
+    TTCFont,
+)
 from fontbakery.errors import ValueValidationError
+from fontbakery.legacy_checkids import renaming_map as old_to_new
 from fontbakery.profile import Profile, Section
 
 
@@ -55,6 +67,52 @@ def setup_context(files):
     return context
 
 
+def _is_testable_file(path):
+    return path.endswith(tuple(ext for cls in FILE_TYPES for ext in cls.extensions))
+
+
+def setup_family_contexts(paths):
+    """Split the files found under the given directories (and the given
+    files and patterns) into families, with one context per family.
+
+    The files of a family are those in the same directory, as in the
+    Google Fonts repository. Directories without any font or font source
+    (e.g. only a README.md) are not considered families.
+
+    Returns a dict of directory => context, sorted by directory. The
+    contexts share their `run_values`, e.g. the Google Fonts metadata.
+    """
+    files_by_directory = defaultdict(list)
+    for path in paths:
+        if not os.path.isdir(path) or _is_testable_file(path):
+            for file in [path] if os.path.exists(path) else glob.glob(path):
+                files_by_directory[os.path.dirname(file)].append(file)
+            continue
+        for directory, subdirectories, filenames in os.walk(path):
+            # Font sources which are directories (e.g. .ufo) are files here.
+            packages = [d for d in subdirectories if _is_testable_file(d)]
+            subdirectories[:] = sorted(set(subdirectories) - set(packages))
+            files_by_directory[directory].extend(
+                os.path.join(directory, filename)
+                for filename in sorted(filenames + packages)
+            )
+
+    contexts = {}
+    run_values = SharedValues()
+    for directory, files in sorted(files_by_directory.items()):
+        try:
+            context = setup_context(files)
+        except ValueValidationError:
+            continue
+        if all(isinstance(t, (Readme, MetadataPB)) for t in context.testables):
+            continue
+        context.run_values = run_values
+        contexts[directory] = context
+    if not contexts:
+        raise ValueValidationError("No applicable files found")
+    return contexts
+
+
 checks_by_id = {}
 conditions_by_name = {}
 checks_loaded = False
@@ -94,6 +152,9 @@ def load_checks_from_module(module):
 
 
 def load_all_checks(package=fontbakery.checks):
+    """Import all the modules of the package and register their checks.
+    Returns the names of the modules, in the order they were imported."""
+    module_names = []
     for _, import_path, _ in pkgutil.walk_packages(
         path=package.__path__, prefix=package.__name__ + "."
     ):
@@ -102,7 +163,102 @@ def load_all_checks(package=fontbakery.checks):
         except ImportError as e:
             warnings.warn("Failed to load %s: %s" % (import_path, e))
             continue
+        module_names.append(import_path)
         load_checks_from_module(module)
+    return module_names
+
+
+def _checks_fingerprint():
+    """A digest of the names, sizes and modification times of the modules
+    of fontbakery.checks, which changes whenever a check is edited."""
+    root = os.path.dirname(fontbakery.checks.__file__)
+    entries = []
+    for directory, subdirectories, filenames in os.walk(root):
+        subdirectories.sort()
+        for filename in sorted(filenames):
+            if filename.endswith(".py"):
+                stat = os.stat(os.path.join(directory, filename))
+                path = os.path.relpath(os.path.join(directory, filename), root)
+                entries.append((path, stat.st_mtime_ns, stat.st_size))
+    return digest(__version__, entries)
+
+
+def _build_check_index(module_names):
+    """The module defining each check, and the modules defining conditions,
+    in import order. Conditions are attached to the testables by importing
+    the module which defines them, and conditions use each other in ways
+    which can't reliably be found without running them, so all of these
+    modules are imported whenever any check is."""
+    condition_modules = set()
+    for cls in FILE_TYPES + [CheckRunContext]:
+        for attribute in vars(cls).values():
+            if isinstance(attribute, cached_property):
+                condition_modules.add(attribute.func.__module__)
+    return {
+        "checks": {
+            check_id: check.__module__
+            for check_id, check in checks_by_id.items()
+            if check.__module__ in module_names
+        },
+        "condition_modules": [m for m in module_names if m in condition_modules],
+    }
+
+
+def check_index():
+    """The check index of fontbakery.checks, which tells which modules to
+    import for a given set of checks.
+
+    It is kept in the cache directory (see fontbakery.cache), keyed by the
+    fontbakery version and the state of the check modules. When there is no
+    index for them yet, all checks are imported to build it.
+    """
+    global checks_loaded  # pylint: disable=global-statement
+    key = _checks_fingerprint()
+    try:
+        cache = JSONCache(cache_dir("check-index"))
+    except OSError:
+        cache = None
+    index = cache.get(key) if cache else None
+    if index is None:
+        index = _build_check_index(load_all_checks())
+        checks_loaded = True
+        if cache:
+            try:
+                cache.put(key, index)
+            except OSError:
+                pass
+    return index
+
+
+def load_checks(check_ids):
+    """Make sure that the given checks of fontbakery.checks are registered,
+    importing only the modules which define them (and the conditions)."""
+    if checks_loaded or all(check_id in checks_by_id for check_id in check_ids):
+        return
+    index = check_index()
+    if checks_loaded:
+        return
+
+    check_modules = {index["checks"][c] for c in check_ids if c in index["checks"]}
+    for import_path in index["condition_modules"] + sorted(check_modules):
+        try:
+            module = importlib.import_module(import_path)
+        except ImportError as e:
+            warnings.warn("Failed to load %s: %s" % (import_path, e))
+            continue
+        load_checks_from_module(module)
+
+
+def is_selected(check_id, explicit_checks):
+    """Whether a check is selected by the check ids (or parts of check ids)
+    given with -c, including the legacy ids of the check."""
+    if not explicit_checks:
+        return True
+    legacy_ids = [old for old, new in old_to_new.items() if new == check_id]
+    return any(
+        explicit in check_id or any(explicit in legacy for legacy in legacy_ids)
+        for explicit in explicit_checks
+    )
 
 
 def add_checks_to_nascent_profile(sections, section, checks, excluded=None):
@@ -121,12 +277,10 @@ def add_checks_to_nascent_profile(sections, section, checks, excluded=None):
             sections[section].checks.append(check_object)
 
 
-def profile_factory(module):
-    # XXX replace with a singleton one day
-    global checks_loaded  # pylint: disable=global-statement
-    if not checks_loaded:
-        load_all_checks()
-        checks_loaded = True
+def profile_factory(module, explicit_checks=None):
+    """Build the profile defined by the PROFILE of a module. If explicit
+    checks are given (as with -c), the profile only has the checks which
+    they select, and only the modules of those checks are imported."""
     profile_data = getattr(module, "PROFILE")
     sections = {}
 
@@ -137,7 +291,7 @@ def profile_factory(module):
     if "include_profiles" in profile_data:
         for profilename in profile_data["include_profiles"]:
             module = importlib.import_module(f"fontbakery.profiles.{profilename}")
-            included_profile = profile_factory(module)
+            included_profile = profile_factory(module, explicit_checks)
             for section in included_profile.sections:
                 add_checks_to_nascent_profile(
                     sections,
@@ -147,7 +301,18 @@ def profile_factory(module):
                     + profile_data.get("pending_review", []),
                 )
 
+    load_checks(
+        [
+            check_id
+            for checks in profile_data["sections"].values()
+            for check_id in checks
+            if is_selected(check_id, explicit_checks)
+        ]
+    )
     for section, checks in profile_data["sections"].items():
+        checks = [c for c in checks if is_selected(c, explicit_checks)]
+        if explicit_checks and not checks:
+            continue
         add_checks_to_nascent_profile(
             sections,
             section,
@@ -0,0 +1,279 @@
+"""Per-glyph metrics of a font: ink, bounds, area and contour and point counts.
+
+Several checks need the same few facts about the glyphs of a font, and used
+to work them out on their own, drawing the same glyphs with a fresh pen or
+walking the same composites again each time. ``FontGlyphMetrics`` is a
+table with one row per glyph which works each of them out once, the first
+time a check asks for it. Composite glyphs are resolved through the rows of
+their components, so a component is only ever looked at once.
+
+The values are those that ``BoundsPen`` (tight bounds) and ``AreaPen``
+(signed area, positive for counter-clockwise contours) give when drawing
+the glyph, and ``has_ink`` and ``contour_count`` are those of
+``fontbakery.utils.glyph_has_ink`` and ``glyph_contour_count``.
+"""
+
+from functools import cached_property
+from typing import NamedTuple, Optional, Tuple
+
+from fontTools.misc.arrayTools import unionRect
+from fontTools.pens.boundsPen import BoundsPen
+
+from fontbakery.profiling import waiting_for
+from fontbakery.utils import ReadOnlyGlyphSet, font_lock
+
+Bounds = Tuple[float, float, float, float]
+
+
+class GlyphMetrics(NamedTuple):
+    has_ink: bool
+    # (xMin, yMin, xMax, yMax), or None for glyphs which draw nothing
+    bounds: Optional[Bounds]
+    area: float
+    contour_count: int
+    point_count: int
+
+
+class _GlyphCounts(NamedTuple):
+    has_ink: bool
+    contour_count: int
+    point_count: int
+
+
+class _MetricsPen(BoundsPen):
+    """A BoundsPen which also adds up the area of what it draws, the way
+    AreaPen does, and counts its contours and points. Open contours, whose
+    area AreaPen can not tell, don't add to the area."""
+
+    def __init__(self, glyphSet):
+        super().__init__(glyphSet)
+        self.area = 0
+        self.contour_count = 0
+        self.point_count = 0
+        self._contour_area = 0
+        self._p0 = self._contour_start = None
+
+    def _add_line(self, p1):
+        x0, y0 = self._p0
+        x1, y1 = p1
+        self._contour_area -= (x1 - x0) * (y1 + y0) * 0.5
+        self._p0 = p1
+
+    def _moveTo(self, pt):
+        super()._moveTo(pt)
+        self._p0 = self._contour_start = pt
+        self._contour_area = 0
+        self.contour_count += 1
+        self.point_count += 1
+
+    def _lineTo(self, pt):
+        super()._lineTo(pt)
+        self._add_line(pt)
+        self.point_count += 1
+
+    def _qCurveToOne(self, bcp, pt):
+        super()._qCurveToOne(bcp, pt)
+        x0, y0 = self._p0
+        x1, y1 = bcp[0] - x0, bcp[1] - y0
+        x2, y2 = pt[0] - x0, pt[1] - y0
+        self._contour_area -= (x2 * y1 - x1 * y2) / 3
+        self._add_line(pt)
+        self.point_count += 2
+
+    def _curveToOne(self, bcp1, bcp2, pt):
+        super()._curveToOne(bcp1, bcp2, pt)
+        x0, y0 = self._p0
+        x1, y1 = bcp1[0] - x0, bcp1[1] - y0
+        x2, y2 = bcp2[0] - x0, bcp2[1] - y0
+        x3, y3 = pt[0] - x0, pt[1] - y0
+        self._contour_area -= (
+            x1 * (-y2 - y3) + x2 * (y1 - 2 * y3) + x3 * (y1 + 2 * y2)
+        ) * 0.15
+        self._add_line(pt)
+        self.point_count += 3
+
+    def _closePath(self):
+        self._add_line(self._contour_start)
+        self.area += self._contour_area
+
+    def _endPath(self):
+        if self._p0 == self._contour_start:
+            self.area += self._contour_area
+
+
+def _translated(bounds: Optional[Bounds], dx, dy) -> Optional[Bounds]:
+    if bounds is None:
+        return None
+    x_min, y_min, x_max, y_max = bounds
+    return (x_min + dx, y_min + dy, x_max + dx, y_max + dy)
+
+
+def _is_translation(component):
+    """Whether a component is only moved, and not scaled, rotated or
+    positioned by matching points."""
+    return not hasattr(component, "transform") and not hasattr(component, "firstPt")
+
+
+class FontGlyphMetrics:
+    """The metrics of the glyphs of a font, in its default location,
+    computed on first use and kept for the next checks that need them."""
+
+    def __init__(self, ttFont):
+        if not any(table in ttFont for table in ("glyf", "CFF ", "CFF2")):
+            raise Exception("Could not find 'glyf', 'CFF ', or 'CFF2' table.")
+        self.ttFont = ttFont
+        self._lock = font_lock(ttFont)
+        self._is_truetype = "glyf" in ttFont
+        self._counts = {}
+        self._geometry = {}
+        self._glyf_geometries = {}
+
+    @cached_property
+    def glyphset(self):
+        """Only needed for drawing, so only made when a glyph is drawn."""
+        return ReadOnlyGlyphSet(self.ttFont)
+
+    @cached_property
+    def _glyph_names(self):
+        with waiting_for(self._lock):
+            return set(self.ttFont.getGlyphOrder())
+
+    def __contains__(self, glyph_name):
+        return glyph_name in self._glyph_names
+
+    def __iter__(self):
+        return iter(self.ttFont.getGlyphOrder())
+
+    def __len__(self):
+        return len(self._glyph_names)
+
+    def __getitem__(self, glyph_name) -> GlyphMetrics:
+        """All the metrics of a glyph. Raises KeyError for unknown glyphs."""
+        counts = self._glyph_counts(glyph_name)
+        bounds, area = self._glyph_geometry(glyph_name)
+        return GlyphMetrics(
+            counts.has_ink, bounds, area, counts.contour_count, counts.point_count
+        )
+
+    def has_ink(self, glyph_name) -> bool:
+        """Whether the glyph draws anything: for TrueType outlines, at least
+        one contour with three points or more."""
+        return self._glyph_counts(glyph_name).has_ink
+
+    def contour_count(self, glyph_name) -> int:
+        """The number of contours, including those of all the components
+        of composite glyphs (but those of ttfautohint's marker glyph)."""
+        return self._glyph_counts(glyph_name).contour_count
+
+    def point_count(self, glyph_name) -> int:
+        return self._glyph_counts(glyph_name).point_count
+
+    def bounds(self, glyph_name) -> Optional[Bounds]:
+        return self._glyph_geometry(glyph_name)[0]
+
+    def area(self, glyph_name) -> float:
+        return self._glyph_geometry(glyph_name)[1]
+
+    def _glyf_glyph(self, glyph_name):
+        with waiting_for(self._lock):
+            glyf = self.ttFont["glyf"]
+            glyph = glyf[glyph_name]
+            if glyph.isComposite() or glyph.numberOfContours == 0:
+                return glyph, None
+            coordinates, _, _ = glyph.getCoordinates(glyf)
+            return glyph, len(coordinates)
+
+    def _glyph_counts(self, glyph_name) -> _GlyphCounts:
+        counts = self._counts.get(glyph_name)
+        if counts is not None:
+            return counts
+
+        if not self._is_truetype:
+            return self._draw(glyph_name)[0]
+
+        glyph, point_count = self._glyf_glyph(glyph_name)
+        if glyph.isComposite():
+            components = [
+                (component.glyphName, self._glyph_counts(component.glyphName))
+                for component in glyph.components
+            ]
+            counts = _GlyphCounts(
+                any(c.has_ink for _, c in components),
+                sum(
+                    c.contour_count for name, c in components if name != ".ttfautohint"
+                ),
+                sum(c.point_count for _, c in components),
+            )
+        elif point_count is None:
+            counts = _GlyphCounts(False, 0, 0)
+        else:
+            # You need at least 3 points to draw.
+            counts = _GlyphCounts(point_count > 2, glyph.numberOfContours, point_count)
+
+        self._counts[glyph_name] = counts
+        return counts
+
+    def _draw(self, glyph_name):
+        """Draw a CFF glyph, keeping all its metrics."""
+        pen = _MetricsPen(self.glyphset)
+        self.glyphset[glyph_name].draw(pen)
+        counts = self._counts[glyph_name] = _GlyphCounts(
+            pen.bounds is not None, pen.contour_count, pen.point_count
+        )
+        geometry = self._geometry[glyph_name] = (pen.bounds, pen.area)
+        return counts, geometry
+
+    def _glyph_geometry(self, glyph_name):
+        geometry = self._geometry.get(glyph_name)
+        if geometry is not None:
+            return geometry
+
+        if not self._is_truetype:
+            return self._draw(glyph_name)[1]
+
+        bounds, area = self._glyf_geometry(glyph_name)
+        # Like the glyph set, draw simple glyphs where their left side
+        # bearing says (but not when they are components).
+        with waiting_for(self._lock):
+            glyph = self.ttFont["glyf"][glyph_name]
+            if not glyph.isComposite() and hasattr(glyph, "xMin"):
+                offset = self.ttFont["hmtx"][glyph_name][1] - glyph.xMin
+                bounds = _translated(bounds, offset, 0)
+
+        geometry = self._geometry[glyph_name] = (bounds, area)
+        return geometry
+
+    def _glyf_geometry(self, glyph_name):
+        """The bounds and area of a TrueType glyph, in the coordinates of the
+        glyf table. Only these are used for composites."""
+        geometry = self._glyf_geometries.get(glyph_name)
+        if geometry is not None:
+            return geometry
+
+        glyph, _ = self._glyf_glyph(glyph_name)
+        if glyph.isComposite() and all(map(_is_translation, glyph.components)):
+            bounds = None
+            area = 0
+            for component in glyph.components:
+                component_bounds, component_area = self._glyf_geometry(
+                    component.glyphName
+                )
+                component_bounds = _translated(
+                    component_bounds, component.x, component.y
+                )
+                if bounds is None:
+                    bounds = component_bounds
+                elif component_bounds is not None:
+                    bounds = unionRect(bounds, component_bounds)
+                area += component_area
+        else:
+            pen = _MetricsPen(self.glyphset)
+            if glyph.isComposite():
+                self.glyphset[glyph_name].draw(pen)
+            else:
+                with waiting_for(self._lock):
+                    glyph.draw(pen, self.ttFont["glyf"])
+            bounds, area = pen.bounds, pen.area
+
+        geometry = self._glyf_geometries[glyph_name] = (bounds, area)
+        return geometry
@@ -0,0 +1,209 @@
+"""Direct access to the pair kerning of a font's GPOS table, without shaping."""
+
+from typing import Any, NamedTuple, Tuple
+
+
+def _x_advance(value_record):
+    if value_record is None:
+        return 0
+    return getattr(value_record, "XAdvance", 0) or 0
+
+
+class _PairPosSubtable:
+    """The advance adjustments of a single PairPos subtable."""
+
+    def __init__(self, subtable):
+        self.format = subtable.Format
+        if self.format == 1:
+            self.pairs = {
+                left: {
+                    record.SecondGlyph: _x_advance(record.Value1)
+                    + _x_advance(record.Value2)
+                    for record in pair_set.PairValueRecord
+                }
+                for left, pair_set in zip(subtable.Coverage.glyphs, subtable.PairSet)
+            }
+        else:
+            self.class1 = subtable.ClassDef1.classDefs if subtable.ClassDef1 else {}
+            self.class2 = subtable.ClassDef2.classDefs if subtable.ClassDef2 else {}
+            self.values = [
+                [
+                    _x_advance(class2_record.Value1) + _x_advance(class2_record.Value2)
+                    for class2_record in class1_record.Class2Record
+                ]
+                for class1_record in subtable.Class1Record
+            ]
+
+    def value(self, left, right):
+        """The adjustment for the pair, or None if this subtable does not
+        apply to it (so that the next subtable of the lookup gets a chance)."""
+        if self.format == 1:
+            return self.pairs[left].get(right)
+
+        row = self.class1.get(left, 0)
+        column = self.class2.get(right, 0)
+        if row >= len(self.values) or column >= len(self.values[row]):
+            return None
+        return self.values[row][column]
+
+
+class PairKerningIndex:
+    """The kerning of a font, as given by the pair adjustment (PairPos)
+    lookups of one of its GPOS features.
+
+    Lookups are evaluated as a shaping engine would, with the first
+    subtable of each lookup that applies to a pair providing its value, and
+    the values of all lookups adding up. The kerning of a pair of glyphs is
+    the total change of their advance widths, in font units.
+
+    Only pair adjustment lookups are indexed: when the feature also uses
+    other kinds of lookups (contextual kerning, for instance), ``complete``
+    is False and the index may miss some of the kerning a shaper would
+    apply.
+    """
+
+    def __init__(self, ttFont, feature_tag="kern"):
+        self.complete = True
+        self._lookups = []
+        self._kerned_lefts = set()
+
+        if "GPOS" not in ttFont:
+            return
+        gpos = ttFont["GPOS"].table
+        if not gpos.FeatureList or not gpos.LookupList:
+            return
+
+        lookup_indices = sorted(
+            {
+                index
+                for record in gpos.FeatureList.FeatureRecord
+                if record.FeatureTag == feature_tag
+                for index in record.Feature.LookupListIndex
+            }
+        )
+        for lookup_index in lookup_indices:
+            lookup = gpos.LookupList.Lookup[lookup_index]
+            subtables_by_left = {}
+            for subtable in lookup.SubTable:
+                if lookup.LookupType == 9:
+                    subtable = subtable.ExtSubTable
+                if subtable.LookupType != 2:
+                    self.complete = False
+                    continue
+                indexed = _PairPosSubtable(subtable)
+                for glyph in subtable.Coverage.glyphs:
+                    subtables_by_left.setdefault(glyph, []).append(indexed)
+            if subtables_by_left:
+                self._lookups.append(subtables_by_left)
+
+        self._kerned_lefts = set().union(*self._lookups)
+
+    def kerning(self, left, right):
+        """The kerning between two glyphs, given by name."""
+        total = 0
+        for subtables_by_left in self._lookups:
+            for subtable in subtables_by_left.get(left, ()):
+                value = subtable.value(left, right)
+                if value is not None:
+                    total += value
+                    break
+        return total
+
+    def kerned_pairs(self, lefts, rights):
+        """Yield (left, right, kerning) for all pairs of glyphs from the two
+        iterables which have non-zero kerning."""
+        rights = list(rights)
+        for left in lefts:
+            if left not in self._kerned_lefts:
+                continue
+            for right in rights:
+                kerning = self.kerning(left, right)
+                if kerning:
+                    yield left, right, kerning
+
+
+class KerningRule(NamedTuple):
+    """A pair adjustment rule: every glyph of ``lefts`` followed by any
+    glyph of ``rights`` gets the two value records."""
+
+    lefts: Tuple[str, ...]
+    rights: Tuple[str, ...]
+    value1: Any
+    value2: Any
+
+    def pairs(self):
+        """Yield the (left, right) glyph pairs the rule applies to."""
+        for left in self.lefts:
+            for right in self.rights:
+                yield left, right
+
+
+def _glyph_classes(glyphs, class_def):
+    """Group the glyphs by class, keeping their order."""
+    class_defs = class_def.classDefs if class_def else {}
+    classes = {}
+    for glyph in glyphs:
+        classes.setdefault(class_defs.get(glyph, 0), []).append(glyph)
+    return {klass: tuple(members) for klass, members in classes.items()}
+
+
+class KerningModel:
+    """The pair adjustment rules of all the GPOS lookups of a font.
+
+    Class kerning is kept as pairs of glyph classes rather than expanded into
+    all the pairs of glyphs they make up, which can run into tens of
+    millions for fonts with large classes. Rules are produced lazily, so
+    the whole model never needs to be held in memory either.
+    """
+
+    def __init__(self, ttFont):
+        self.ttFont = ttFont
+
+    def subtables(self):
+        """Yield the PairPos subtables of the font, from Extension lookups too."""
+        if "GPOS" not in self.ttFont or not self.ttFont["GPOS"].table.LookupList:
+            return
+        for lookup in self.ttFont["GPOS"].table.LookupList.Lookup:
+            for subtable in lookup.SubTable:
+                if subtable.LookupType == 9:
+                    subtable = subtable.ExtSubTable
+                if subtable.LookupType == 2:
+                    yield subtable
+
+    def rules(self, predicate=None):
+        """Yield the kerning rules of the font, optionally only those for
+        which ``predicate(value1, value2)`` is true."""
+        glyph_order = None
+        for subtable in self.subtables():
+            if subtable.Format == 1:
+                for left, pair_set in zip(subtable.Coverage.glyphs, subtable.PairSet):
+                    for record in pair_set.PairValueRecord:
+                        value1 = getattr(record, "Value1", None)
+                        value2 = getattr(record, "Value2", None)
+                        if predicate is None or predicate(value1, value2):
+                            yield KerningRule(
+                                (left,), (record.SecondGlyph,), value1, value2
+                            )
+                continue
+
+            if glyph_order is None:
+                glyph_order = self.ttFont.getGlyphOrder()
+            class1 = _glyph_classes(subtable.Coverage.glyphs, subtable.ClassDef1)
+            class2 = _glyph_classes(glyph_order, subtable.ClassDef2)
+            for ix1, class1_record in enumerate(subtable.Class1Record):
+                if ix1 not in class1:
+                    continue
+                for ix2, class2_record in enumerate(class1_record.Class2Record):
+                    if ix2 not in class2:
+                        continue
+                    value1 = getattr(class2_record, "Value1", None)
+                    value2 = getattr(class2_record, "Value2", None)
+                    if predicate is None or predicate(value1, value2):
+                        yield KerningRule(class1[ix1], class2[ix2], value1, value2)
+
+    def pairs(self, predicate=None):
+        """Yield (left, right, value1, value2) for every pair of glyphs
+        the (optionally filtered) rules apply to."""
+        for rule in self.rules(predicate):
+            for left, right in rule.pairs():
+                yield left, right, rule.value1, rule.value2
@@ -0,0 +1,255 @@
+"""The outlines of all the glyphs of a font, with the geometry of their segments.
+
+The outline checks all look at the same few properties of the same
+segments: their end points, tangents, angles and lengths. ``FontOutlines``
+draws every glyph once, keeping each segment as a plain tuple of points,
+and each property is then worked out once per contour, the first time a
+check asks for it, instead of once per check on freshly built objects.
+
+Tangents and lengths are computed with the same formulas as the
+``beziers`` package, and segments are formatted the same way, so that
+check results are the same as when the checks used ``beziers`` paths.
+"""
+
+from functools import cached_property
+import math
+from typing import List, NamedTuple, Tuple
+
+from beziers.utils.legendregauss import Cvalues, Tvalues
+from fontTools.misc.bezierTools import calcCubicBounds, calcQuadraticBounds
+from fontTools.pens.basePen import BasePen
+
+Point = Tuple[float, float]
+# Two points for a line, three for a quadratic and four for a cubic curve.
+Segment = Tuple[Point, ...]
+
+
+def format_point(point: Point):
+    return "<%s,%s>" % point
+
+
+def format_segment(segment: Segment):
+    """The segment as ``beziers`` displays it, e.g. ``L<<0.0,0.0>--<5.0,0.0>>``."""
+    if len(segment) == 2:
+        return "L<%s--%s>" % (format_point(segment[0]), format_point(segment[1]))
+    return "B<%s>" % "-".join(format_point(point) for point in segment)
+
+
+def _unit_vector(x, y):
+    magnitude = math.sqrt(x * x + y * y)
+    if magnitude == 0.0:
+        magnitude = 1.0
+    return (x / magnitude, y / magnitude)
+
+
+def _derivative_at(segment: Segment, t):
+    """The derivative of a curve at time t."""
+    if len(segment) == 3:
+        (x0, y0), (x1, y1), (x2, y2) = segment
+        ax, ay = (x1 - x0) * 2, (y1 - y0) * 2
+        bx, by = (x2 - x1) * 2, (y2 - y1) * 2
+        return (ax * (1 - t) + bx * t, ay * (1 - t) + by * t)
+
+    (x0, y0), (x1, y1), (x2, y2), (x3, y3) = segment
+    ax, ay = (x1 - x0) * 3, (y1 - y0) * 3
+    bx, by = (x2 - x1) * 3, (y2 - y1) * 3
+    cx, cy = (x3 - x2) * 3, (y3 - y2) * 3
+    return (
+        (1 - t) * (1 - t) * ax + 2 * (1 - t) * t * bx + t * t * cx,
+        (1 - t) * (1 - t) * ay + 2 * (1 - t) * t * by + t * t * cy,
+    )
+
+
+def _tangent_at(segment: Segment, t):
+    """The unit tangent vector of a segment at time t."""
+    if len(segment) == 2:
+        (x0, y0), (x1, y1) = segment
+        angle = math.atan2(y1 - y0, x1 - x0)
+        return _unit_vector(math.cos(angle), math.sin(angle))
+    return _unit_vector(*_derivative_at(segment, t))
+
+
+def _line_angle(segment: Segment):
+    (x0, y0), (x1, y1) = segment
+    return math.degrees(math.atan2(y1 - y0, x1 - x0))
+
+
+def _length(segment: Segment):
+    if len(segment) == 2:
+        (x0, y0), (x1, y1) = segment
+        return math.sqrt((x0 - x1) * (x0 - x1) + (y0 - y1) * (y0 - y1))
+
+    # Gauss-Legendre quadrature of the length of the derivative.
+    total = 0
+    for weight, root in zip(Cvalues, Tvalues):
+        x, y = _derivative_at(segment, 0.5 * root + 0.5)
+        total += weight * math.sqrt(x * x + y * y)
+    return total * 0.5
+
+
+def _signed_area(segment: Segment):
+    """The signed area between a segment and the origin (Green's theorem)."""
+    if len(segment) == 2:
+        (x0, y0), (x1, y1) = segment
+        return (x0 * y1 - x1 * y0) / 2
+    if len(segment) == 3:
+        (x0, y0), (x1, y1), (x2, y2) = segment
+        return (
+            2 * (x0 * y1 - x1 * y0) + 2 * (x1 * y2 - x2 * y1) + (x0 * y2 - x2 * y0)
+        ) / 6
+    (x0, y0), (x1, y1), (x2, y2), (x3, y3) = segment
+    return (
+        6 * (x0 * y1 - x1 * y0)
+        + 3 * (x0 * y2 - x2 * y0)
+        + (x0 * y3 - x3 * y0)
+        + 3 * (x1 * y2 - x2 * y1)
+        + 3 * (x1 * y3 - x3 * y1)
+        + 6 * (x2 * y3 - x3 * y2)
+    ) / 20
+
+
+class Contour:
+    """A closed contour, as its segments and its on-curve points."""
+
+    def __init__(self, segments: List[Segment], oncurve_points: List[Point]):
+        self.segments = segments
+        self.oncurve_points = oncurve_points
+
+    @cached_property
+    def lines(self) -> List[bool]:
+        """Whether each segment is a straight line."""
+        return [len(segment) == 2 for segment in self.segments]
+
+    @cached_property
+    def lengths(self) -> List[float]:
+        return [_length(segment) for segment in self.segments]
+
+    @cached_property
+    def length(self) -> float:
+        return sum(self.lengths)
+
+    @cached_property
+    def start_tangents(self) -> List[Point]:
+        """The unit tangent vector at the start of each segment."""
+        return [_tangent_at(segment, 0) for segment in self.segments]
+
+    @cached_property
+    def end_tangents(self) -> List[Point]:
+        """The unit tangent vector at the end of each segment."""
+        return [_tangent_at(segment, 1) for segment in self.segments]
+
+    @cached_property
+    def start_angles(self) -> List[float]:
+        """The angle in radians of the tangent at the start of each segment."""
+        return [math.atan2(y, x) for x, y in self.start_tangents]
+
+    @cached_property
+    def line_angles(self) -> List[float]:
+        """The angle in degrees of each line from its start to its end point,
+        or None for curves."""
+        return [
+            _line_angle(segment) if is_line else None
+            for segment, is_line in zip(self.segments, self.lines)
+        ]
+
+    @cached_property
+    def bounds(self):
+        """The (xMin, yMin, xMax, yMax) bounding box of the contour, or None
+        if it has no segments."""
+        if not self.segments:
+            return None
+        boxes = []
+        for segment in self.segments:
+            if len(segment) == 2:
+                (x0, y0), (x1, y1) = segment
+                boxes.append((min(x0, x1), min(y0, y1), max(x0, x1), max(y0, y1)))
+            elif len(segment) == 3:
+                boxes.append(calcQuadraticBounds(*segment))
+            else:
+                boxes.append(calcCubicBounds(*segment))
+        return (
+            min(box[0] for box in boxes),
+            min(box[1] for box in boxes),
+            max(box[2] for box in boxes),
+            max(box[3] for box in boxes),
+        )
+
+    @cached_property
+    def signed_area(self) -> float:
+        """The area enclosed by the contour: positive if it runs
+        counter-clockwise, negative if it runs clockwise."""
+        return sum(_signed_area(segment) for segment in self.segments)
+
+    @property
+    def is_counter_clockwise(self) -> bool:
+        return math.copysign(1, self.signed_area) == 1
+
+
+class GlyphOutline(NamedTuple):
+    name: str
+    display_name: str
+    contours: List[Contour]
+
+
+class _ContourPen(BasePen):
+    """Collects the closed contours of a glyph. Open contours are ignored."""
+
+    def __init__(self, glyphSet):
+        super().__init__(glyphSet)
+        self.contours = []
+        self._segments = []
+        self._oncurve = []
+
+    def _moveTo(self, pt):
+        start = (float(pt[0]), float(pt[1]))
+        self._segments = []
+        self._oncurve = [start]
+
+    def _add(self, *points):
+        end = (float(points[-1][0]), float(points[-1][1]))
+        segment = (self._oncurve[-1],)
+        segment += tuple((float(x), float(y)) for x, y in points[:-1]) + (end,)
+        self._segments.append(segment)
+        self._oncurve.append(end)
+
+    def _lineTo(self, pt):
+        self._add(pt)
+
+    def _qCurveToOne(self, pt1, pt2):
+        self._add(pt1, pt2)
+
+    def _curveToOne(self, pt1, pt2, pt3):
+        self._add(pt1, pt2, pt3)
+
+    def _closePath(self):
+        first, last = self._oncurve[0], self._oncurve[-1]
+        if not (
+            -1e-9 < last[0] - first[0] < 1e-9 and -1e-9 < last[1] - first[1] < 1e-9
+        ):
+            self._segments.append((last, first))
+        self.contours.append(Contour(self._segments, self._oncurve))
+
+
+class FontOutlines:
+    """The outlines of all the glyphs of a font, in glyph order."""
+
+    def __init__(self, ttFont):
+        from fontbakery.utils import ReadOnlyGlyphSet
+
+        glyphset = ReadOnlyGlyphSet(ttFont)
+        reversed_cmap = {v: k for k, v in ttFont.getBestCmap().items()}
+
+        self.glyphs = []
+        for glyphname in ttFont.getGlyphOrder():
+            display_name = glyphname
+            if glyphname in reversed_cmap:
+                display_name = f"{glyphname} (U+{reversed_cmap[glyphname]:04X})"
+            pen = _ContourPen(glyphset)
+            glyphset[glyphname].draw(pen)
+            self.glyphs.append(GlyphOutline(glyphname, display_name, pen.contours))
+
+    def __iter__(self):
+        return iter(self.glyphs)
+
+    def __len__(self):
+        return len(self.glyphs)
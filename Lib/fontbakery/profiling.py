@@ -0,0 +1,181 @@
+"""Where the time (and memory) of a run goes.
+
+A ``Profiler`` given to a ``CheckRunner`` measures every check run and every
+condition computation: wall time, CPU time of the thread doing it, time spent
+waiting for locks shared between threads and, optionally, its peak memory
+allocation. Conditions computed while running a check (or another
+condition) are measured on their own, and also count towards the check.
+
+The measurements can be written as a Chrome trace (to be opened in
+``chrome://tracing`` or https://ui.perfetto.dev), and summarized as the
+slowest checks and conditions.
+"""
+
+from contextlib import contextmanager
+from dataclasses import dataclass
+import functools
+import json
+import os
+import threading
+import time
+import tracemalloc
+from typing import List, Optional
+
+_local = threading.local()
+
+
+@dataclass
+class Measurement:
+    kind: str  # "check" or "condition"
+    name: str
+    subject: str  # The file it ran on, if any
+    start: float
+    wall: float = 0.0
+    cpu: float = 0.0
+    lock_wait: float = 0.0
+    peak_memory: Optional[int] = None
+    process: int = 0
+    thread: int = 0
+
+
+def _stack():
+    stack = getattr(_local, "stack", None)
+    if stack is None:
+        stack = _local.stack = []
+    return stack
+
+
+class Profiler:
+    """Collects measurements from the threads (and worker processes) of one
+    or more check runs."""
+
+    def __init__(self, trace_memory=False):
+        self.trace_memory = trace_memory
+        self.measurements: List[Measurement] = []
+        # The display names of the objects which conditions are computed
+        # on, by object id. Registered by the check runners.
+        self.subjects = {}
+        self._origin = time.perf_counter()
+        self._lock = threading.Lock()
+        if trace_memory and not tracemalloc.is_tracing():
+            tracemalloc.start()
+
+    @contextmanager
+    def measure(self, kind, name, subject=""):
+        stack = _stack()
+        measurement = Measurement(
+            kind,
+            name,
+            subject,
+            start=time.perf_counter(),
+            process=os.getpid(),
+            thread=threading.get_ident(),
+        )
+        if self.trace_memory:
+            current, peak = tracemalloc.get_traced_memory()
+            if stack:
+                # Resetting the peak below would lose the one of the
+                # enclosing measurement so far.
+                outer, outer_base = stack[-1]
+                outer.peak_memory = max(outer.peak_memory or 0, peak - outer_base)
+            tracemalloc.reset_peak()
+        stack.append((measurement, current if self.trace_memory else 0))
+        cpu = time.thread_time()
+        try:
+            yield measurement
+        finally:
+            measurement.cpu = time.thread_time() - cpu
+            measurement.wall = time.perf_counter() - measurement.start
+            _, base = stack.pop()
+            if self.trace_memory:
+                peak = tracemalloc.get_traced_memory()[1] - base
+                measurement.peak_memory = max(measurement.peak_memory or 0, peak)
+            with self._lock:
+                self.measurements.append(measurement)
+
+    def slowest(self, count, kind="check"):
+        """The `count` measurements of the given kind with the most wall time."""
+        measurements = [m for m in self.measurements if m.kind == kind]
+        return sorted(measurements, key=lambda m: m.wall, reverse=True)[:count]
+
+    def trace_events(self):
+        """The measurements as Chrome trace "complete" events."""
+        events = []
+        for m in sorted(self.measurements, key=lambda m: m.start):
+            args = {
+                "file": m.subject,
+                "cpu_ms": round(m.cpu * 1000, 3),
+                "lock_wait_ms": round(m.lock_wait * 1000, 3),
+            }
+            if m.peak_memory is not None:
+                args["peak_memory_kb"] = round(m.peak_memory / 1024, 1)
+            events.append(
+                {
+                    "name": m.name,
+                    "cat": m.kind,
+                    "ph": "X",
+                    "ts": round((m.start - self._origin) * 1e6, 1),
+                    "dur": round(m.wall * 1e6, 1),
+                    "pid": m.process,
+                    "tid": m.thread,
+                    "args": args,
+                }
+            )
+        return events
+
+    def write_trace(self, filename):
+        with open(filename, "w", encoding="utf-8") as f:
+            json.dump({"traceEvents": self.trace_events(), "displayTimeUnit": "ms"}, f)
+
+
+def current_measurement():
+    """What is being measured in this thread, if anything."""
+    stack = getattr(_local, "stack", None)
+    return stack[-1][0] if stack else None
+
+
+@contextmanager
+def waiting_for(lock):
+    """Hold a lock, adding the time spent waiting for it to the lock wait
+    time of what is being measured in this thread."""
+    measurement = current_measurement()
+    if measurement is None:
+        with lock:
+            yield
+        return
+    start = time.perf_counter()
+    with lock:
+        measurement.lock_wait += time.perf_counter() - start
+        yield
+
+
+def active_profiler():
+    """The profiler of the run this thread is working for, if any."""
+    return getattr(_local, "profiler", None)
+
+
+@contextmanager
+def profiling(profiler):
+    """Have conditions computed in this thread measured by the profiler."""
+    previous = getattr(_local, "profiler", None)
+    _local.profiler = profiler
+    try:
+        yield
+    finally:
+        _local.profiler = previous
+
+
+def measured_condition(func):
+    """Wrap the function of a condition so that its computations are
+    measured when they happen during a profiled run."""
+
+    @functools.wraps(func)
+    def wrapper(provider):
+        profiler = active_profiler()
+        if profiler is None:
+            return func(provider)
+        subject = profiler.subjects.get(id(provider), "")
+        with profiler.measure("condition", func.__name__, subject):
+            return func(provider)
+
+    return wrapper
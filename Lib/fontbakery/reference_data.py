@@ -0,0 +1,310 @@
+"""The reference data of the Google Fonts checks, loaded once per process.
+
+Several checks look things up in databases shipped with the Google Fonts
+libraries: the axis registry, the languages of gflanguages and shaperglot,
+the subsets of gfsubsets and the glyph sets of glyphsets, as well as the
+list of vendor IDs registered with Microsoft. Each of these datasets is
+loaded here the first time a check asks for it (by whichever thread asks
+first, while other threads asking for it wait) and is then kept for the
+rest of the process, together with the indexes the checks need, such as the
+subsets of each codepoint. Checks get them from the functions of this
+module, which return the very same objects every time: don't modify them.
+
+The worker processes of the "processes" executor are forked from the
+process running the checks, and share the datasets it has loaded before
+forking, copy-on-write. So the check runner loads the datasets that the
+modules of the selected checks import from here (see ``datasets_used_by``)
+before forking, rather than having each worker load them again.
+"""
+
+from collections import defaultdict
+import functools
+import re
+import threading
+
+from fontbakery.cache import JSONCache, cache_dir, digest
+from fontbakery.utils import exit_with_install_instructions, get_resource_file_contents
+
+# The function loading each dataset, by name
+_datasets = {}
+
+
+def dataset(func):
+    """Make a function loading a dataset only load it once, on first use."""
+    lock = threading.Lock()
+    loaded = []
+
+    @functools.wraps(func)
+    def load():
+        if not loaded:
+            with lock:
+                if not loaded:
+                    loaded.append(func())
+        return loaded[0]
+
+    _datasets[func.__name__] = load
+    return load
+
+
+def preload(*names):
+    """Load the given datasets now, or all of them if none is given."""
+    for name in names or list(_datasets):
+        _datasets[name]()
+
+
+def datasets_used_by(modules):
+    """The names of the datasets that the given modules have imported from
+    this module (directly, or under another name)."""
+    loaders = {load: name for name, load in _datasets.items()}
+    return {
+        loaders[value]
+        for module in modules
+        for value in vars(module).values()
+        if callable(value) and value in loaders
+    }
+
+
+@dataset
+def axis_registry():
+    """The Google Fonts axis registry."""
+    from axisregistry import AxisRegistry
+
+    return AxisRegistry()
+
+
+def _parse_vendor_ids(content):
+    try:
+        from bs4 import BeautifulSoup, NavigableString
+    except ImportError:
+        exit_with_install_instructions("googlefonts")
+
+    registered_vendor_ids = {}
+    # Strip all <A> HTML tags from the raw HTML. The current page contains a
+    # closing </A> for which no opening <A> is present, which causes
+    # beautifulsoup to silently stop processing that section from the error
+    # onwards. We're not using the href's anyway.
+    content = re.sub("<a[^>]*>", "", content, flags=re.IGNORECASE)
+    content = re.sub("</a>", "", content, flags=re.IGNORECASE)
+    soup = BeautifulSoup(content, "html.parser")
+
+    IDs = [chr(c + ord("a")) for c in range(ord("z") - ord("a") + 1)]
+    IDs.append("0-9-")
+
+    for section_id in IDs:
+        section = soup.find("h2", {"id": section_id})
+        if not section:
+            continue
+
+        table = section.find_next_sibling("table")
+        if not table or isinstance(table, NavigableString):
+            continue
+
+        for row in table.find_all("tr"):
+            cells = row.find_all("td")
+            if not cells:
+                continue
+
+            labels = list(cells[1].stripped_strings)
+
+            # pad the code to make sure it is a 4 char string,
+            # otherwise eg "CF  " will not be matched to "CF"
+            code = cells[0].string.strip()
+            code = code + (4 - len(code)) * " "
+            registered_vendor_ids[code] = labels[0]
+
+            # Do the same with NULL-padding:
+            code = cells[0].string.strip()
+            code = code + (4 - len(code)) * chr(0)
+            registered_vendor_ids[code] = labels[0]
+
+    return registered_vendor_ids
+
+
+@dataset
+def vendor_ids():
+    """The vendor IDs registered with Microsoft, with the names of their
+    vendors. The IDs are padded to four characters, both with spaces and
+    with NUL characters.
+
+    They are read from a copy of Microsoft's vendor list which comes with
+    FontBakery. Parsing it is slow, so once parsed, they are kept in the
+    cache directory (see fontbakery.cache) until that copy changes."""
+    content = get_resource_file_contents("data/fontbakery-microsoft-vendorlist.cache")
+    key = digest("vendor-ids", content)
+    try:
+        cache = JSONCache(cache_dir("reference-data"))
+    except OSError:
+        cache = None
+    ids = cache.get(key) if cache else None
+    if ids is None:
+        ids = _parse_vendor_ids(content)
+        if cache:
+            try:
+                cache.put(key, ids)
+            except OSError:
+                pass
+    return ids
+
+
+@dataset
+def languages():
+    """The languages of gflanguages, by language code."""
+    try:
+        from gflanguages import LoadLanguages
+    except ImportError:
+        exit_with_install_instructions("googlefonts")
+
+    return LoadLanguages()
+
+
+@dataset
+def shaperglot_languages():
+    """The languages that shaperglot can check fonts for."""
+    try:
+        from shaperglot import Languages
+    except ImportError:
+        exit_with_install_instructions("googlefonts")
+
+    return Languages()
+
+
+class Subsets:
+    """The subsets which the Google Fonts API serves fonts in, as defined by
+    gfsubsets, and the codepoints of each of them."""
+
+    def __init__(self, unique_codepoints):
+        # The codepoints of each subset which are in no other subset
+        self.unique_codepoints = unique_codepoints
+        by_codepoint = defaultdict(set)
+        for subset, codepoints in unique_codepoints.items():
+            for codepoint in codepoints:
+                by_codepoint[codepoint].add(subset)
+        self._by_codepoint = {
+            codepoint: frozenset(subsets) for codepoint, subsets in by_codepoint.items()
+        }
+
+    @property
+    def names(self):
+        return list(self.unique_codepoints)
+
+    def __contains__(self, subset):
+        return subset in self.unique_codepoints
+
+    def codepoints(self, subset, unique_glyphs=False):
+        """The codepoints of a subset, like gfsubsets' CodepointsInSubset:
+        with those of the subsets it extends unless `unique_glyphs`."""
+        codepoints = self.unique_codepoints.get(subset, frozenset())
+        if unique_glyphs:
+            return codepoints
+        # y-ext includes y, except latin-ext which already has latin.
+        if subset != "latin-ext" and subset.endswith("-ext"):
+            codepoints |= self.unique_codepoints.get(subset[:-4], frozenset())
+        # almost all subsets include latin.
+        if subset not in ("khmer", "latin"):
+            codepoints |= self.unique_codepoints["latin"]
+        return codepoints
+
+    def subsets_of(self, codepoint):
+        """The subsets a codepoint is one of the unique codepoints of."""
+        return self._by_codepoint.get(codepoint, frozenset())
+
+
+@dataset
+def subsets():
+    """The Google Fonts subsets."""
+    try:
+        from gfsubsets import CodepointsInSubset, ListSubsets
+    except ImportError:
+        exit_with_install_instructions("googlefonts")
+
+    # gfsubsets hands out (and adds to) the sets it keeps, so copy them.
+    return Subsets(
+        {
+            subset: frozenset(CodepointsInSubset(subset, unique_glyphs=True) or ())
+            for subset in ListSubsets()
+        }
+    )
+
+
+class Glyphsets:
+    """The Google Fonts glyph sets, as defined by glyphsets: the codepoints
+    of each of them, and the languages they are meant to support."""
+
+    def __init__(self, codepoints):
+        # The sorted codepoints of each glyph set
+        self.codepoints = codepoints
+        self.codepoint_sets = {
+            glyphset: frozenset(glyphset_codepoints)
+            for glyphset, glyphset_codepoints in codepoints.items()
+        }
+        self._lock = threading.Lock()
+        self._unique = {}
+        self._languages = {}
+
+    @property
+    def names(self):
+        return list(self.codepoints)
+
+    def unique_codepoints(self, glyphset, compare_against):
+        """The codepoints of a glyph set which are not in another one, like
+        glyphsets' get_unicodes_unique_in_glyphset."""
+        key = (glyphset, compare_against)
+        if key not in self._unique:
+            self._unique[key] = self.codepoint_sets.get(
+                glyphset, frozenset()
+            ) - self.codepoint_sets.get(compare_against, frozenset())
+        return self._unique[key]
+
+    def fulfilled(self, codepoints):
+        """How much of each glyph set the given codepoints cover, like
+        glyphsets' get_glyphsets_fulfilled: the codepoints of the glyph set
+        which are ("has") and are not ("missing") among them and, for all but
+        the Latin core and kernel, the share of the codepoints which are not
+        in those (of the largest of the two sets) that are. Glyph sets are
+        listed by decreasing share."""
+        result = {}
+        for glyphset, glyphset_codepoints in self.codepoints.items():
+            has = [c for c in glyphset_codepoints if c in codepoints]
+            missing = [c for c in glyphset_codepoints if c not in codepoints]
+            if has and not missing:
+                percentage = 1
+            elif glyphset in ("GF_Latin_Kernel", "GF_Latin_Core"):
+                percentage = len(has) / len(glyphset_codepoints) if has else 0
+            else:
+                core = self.unique_codepoints(glyphset, "GF_Latin_Core")
+                kernel = self.unique_codepoints(glyphset, "GF_Latin_Kernel")
+                unique = core if core > kernel else kernel
+                percentage = len(unique & codepoints) / len(unique) if unique else 0
+            result[glyphset] = {
+                "has": has,
+                "missing": missing,
+                "percentage": percentage,
+            }
+        return dict(
+            sorted(result.items(), key=lambda item: item[1]["percentage"], reverse=True)
+        )
+
+    def languages(self, glyphset):
+        """The codes of the languages of a glyph set."""
+        with self._lock:
+            if glyphset not in self._languages:
+                from glyphsets import languages_per_glyphset
+
+                self._languages[glyphset] = tuple(languages_per_glyphset(glyphset))
+            return self._languages[glyphset]
+
+
+@dataset
+def glyphsets():
+    """The Google Fonts glyph sets."""
+    try:
+        from glyphsets import defined_glyphsets, unicodes_per_glyphset
+    except ImportError:
+        exit_with_install_instructions("googlefonts")
+
+    return Glyphsets(
+        {
+            glyphset: tuple(unicodes_per_glyphset(glyphset) or ())
+            for glyphset in defined_glyphsets()
+        }
+    )
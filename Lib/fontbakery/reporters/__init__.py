@@ -27,6 +27,11 @@ class FontbakeryReporter:
     succinct: bool = False
     quiet: bool = False
 
+    # Whether to keep all check results in memory, in self._results.
+    # Reporters which render results as they arrive can do without,
+    # which matters when checking thousands of fonts.
+    keep_results = True
+
     def __post_init__(self):
         self._started = None
         self._ended = None
@@ -69,7 +74,7 @@ class FontbakeryReporter:
     def start(self, order):
         self._order = order
         length = len(self._order)
-        self._counter["(not finished)"] = length - len(self._results)
+        self._counter["(not finished)"] = length - self._tick
         keys = [identity.key for identity in self._order]
         self._indexes = dict(zip(keys, range(length)))
         self._started = True
@@ -107,7 +112,8 @@ class FontbakeryReporter:
         ):
             self._worst_check_status = checkresult.summary_status
 
-        self._results.append(checkresult)
+        if self.keep_results:
+            self._results.append(checkresult)
         self._counter[checkresult.summary_status.name] += 1
         self._counter["(not finished)"] -= 1
         self._sectioncounter[checkresult.identity.section.name][
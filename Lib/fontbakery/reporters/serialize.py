@@ -10,12 +10,16 @@ domains as well.
 Domain specific knowledge should be encoded only in the Profile (Checks,
 Conditions) and MAYBE in *customized* reporters e.g. subclasses.
 """
+import json
+
 from fontbakery.result import CheckResult
 from fontbakery.reporters import FontbakeryReporter
 
 
 class SerializeReporter(FontbakeryReporter):
     format = "unknown"
+    # The serialized results are kept in self._sections instead.
+    keep_results = False
 
     def __post_init__(self):
         super().__post_init__()
@@ -70,6 +74,67 @@ class JSONReporter(SerializeReporter):
     format = "JSON"
 
     def template(self, doc):
-        import json
-
         return json.dumps(doc, sort_keys=True, indent=4)
+
+
+class NDJSONReporter(FontbakeryReporter):
+    """Writes newline-delimited JSON: one line per check result, as soon as
+    it is received, and a summary line at the end of the run.
+
+    Results are not kept in memory, so memory use does not grow with the
+    number of fonts checked, and the report can be read (e.g. with
+    ``tail -f``) while the checks are still running. Each line is an
+    object with a "type" of either "result", with the same data as a check
+    of the JSON report plus its "check_id" and the name of its "section",
+    or "summary", with the overall and per-section result counts.
+
+    The output file can also be a text stream which is already open, such
+    as a socket or sys.stdout. It is then left open at the end of the run.
+    """
+
+    format = "NDJSON"
+    keep_results = False
+    summary = True
+
+    def __post_init__(self):
+        super().__post_init__()
+        self._fh = None
+
+    def _write_record(self, record):
+        self._fh.write(json.dumps(record, sort_keys=True) + "\n")
+        self._fh.flush()
+
+    def start(self, order):
+        super().start(order)
+        if isinstance(self.output_file, str):
+            # pylint: disable-next=consider-using-with
+            self._fh = open(self.output_file, "w", encoding="utf-8")
+        else:
+            self._fh = self.output_file
+
+    def receive_result(self, checkresult: CheckResult):
+        super().receive_result(checkresult)
+        record = checkresult.getData(self.runner)
+        record["type"] = "result"
+        record["check_id"] = checkresult.identity.check.id
+        record["section"] = checkresult.identity.section.name
+        self._write_record(record)
+
+    def end(self):
+        super().end()
+        if self.summary:
+            self._write_record(
+                {
+                    "type": "summary",
+                    "result": self._counter,
+                    "sections": self._sectioncounter,
+                }
+            )
+        if self._fh is not self.output_file:
+            self._fh.close()
+
+    def write(self):
+        if not self.quiet:
+            print(
+                f'A report in {self.format} format has been saved to "{self.output_file}"'
+            )
@@ -13,10 +13,12 @@ from rich.segment import Segment, Segments
 from rich.live import Live
 from rich.markdown import Markdown
 from rich.markup import escape
+from rich.table import Table
 import rich
 
 from fontbakery.constants import LIGHT_THEME, CUPCAKE, MEANING_MESSAGE
 from fontbakery.message import Message
+from fontbakery.profiling import Profiler
 from fontbakery.result import CheckResult
 from fontbakery.reporters import FontbakeryReporter
 
@@ -86,10 +88,38 @@ class ProgressBar:
         yield Segment(f"] {self.percent}%")
 
 
+def render_slowest(profiler, count):
+    """Tables of the slowest checks and conditions of a profiled run."""
+    tables = []
+    for kind in ("check", "condition"):
+        measurements = profiler.slowest(count, kind)
+        if not measurements:
+            continue
+        table = Table(title=f"Slowest {kind}s", title_justify="left")
+        table.add_column("Wall s", justify="right")
+        table.add_column("CPU s", justify="right")
+        table.add_column("Lock wait s", justify="right")
+        if profiler.trace_memory:
+            table.add_column("Peak KiB", justify="right")
+        table.add_column(kind.capitalize(), overflow="fold")
+        table.add_column("File", overflow="fold")
+        for m in measurements:
+            row = [f"{m.wall:.3f}", f"{m.cpu:.3f}", f"{m.lock_wait:.3f}"]
+            if profiler.trace_memory:
+                row.append(f"{(m.peak_memory or 0) / 1024:.0f}")
+            table.add_row(*row, escape(m.name), escape(m.subject))
+        tables.append(table)
+    return tables
+
+
 @dataclass
 class TerminalReporter(FontbakeryReporter):
     print_progress: bool = True
     theme: Optional[dict] = None
+    # The profiler of the run, to print its `slowest` checks and conditions.
+    profiler: Optional[Profiler] = None
+    slowest: int = 0
+    keep_results = False
 
     def __post_init__(self):
         super().__post_init__()
@@ -123,10 +153,8 @@ class TerminalReporter(FontbakeryReporter):
     def _set_progress_event(self, event):
         index = self._get_index(event.identity)
         self.progressbar[index] = event.summary_status
-        total = max(len(self._order), len(self._results))
-        self.progressbar.percent = (
-            int(round(len(self._results) / total * 100)) if total else 0
-        )
+        total = max(len(self._order), self._tick)
+        self.progressbar.percent = int(round(self._tick / total * 100)) if total else 0
         self.progressbar._tick = self._tick
         self._log_context.update(self.progressbar, refresh=True)
 
@@ -150,8 +178,6 @@ class TerminalReporter(FontbakeryReporter):
         )
         if self.print_progress:
             self.progressbar.reset(len(order))
-            for event in self._results:
-                self._set_progress_event(event)
 
     def end(self):
         super().end()
@@ -178,6 +204,11 @@ class TerminalReporter(FontbakeryReporter):
         if self.print_progress:
             self._log_context.__exit__(None, None, None)
 
+        if self.profiler is not None and self.slowest:
+            for table in render_slowest(self.profiler, self.slowest):
+                self._console.print(table)
+                self._console.print("")
+
         if self.succinct:
             self._console.print(self._render_results_counter())
             return
@@ -386,3 +417,28 @@ class TerminalReporter(FontbakeryReporter):
         #         seen.add(name)
         #         result.append(formatting(name.lower(), name, self._counter[name]))
         return separator.join(result)
+
+
+@dataclass
+class SummaryReporter(FontbakeryReporter):
+    """Prints a single line with the result counts at the end of a run,
+    such as the run of each family of a batch."""
+
+    title: str = ""
+    theme: Optional[dict] = None
+    keep_results = False
+
+    def __post_init__(self):
+        super().__post_init__()
+        self.theme = self.theme or LIGHT_THEME
+        self._console = rich.console.Console(theme=self.theme, highlight=False)
+
+    def end(self):
+        super().end()
+        if self.quiet:
+            return
+        counts = "".join(
+            f" [message-{s.name.lower()}]{s.name}[/]: {self._counter[s.name]}"
+            for s in check_statuses
+        )
+        self._console.print(f"{escape(self.title)}:{counts}")
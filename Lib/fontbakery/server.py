@@ -0,0 +1,184 @@
+"""A long-running FontBakery process which checks fonts on request.
+
+Before checking a single font, every FontBakery run imports all the check
+modules and the reference data they use (glyph sets, language and axis
+registries, shaperglot, ...). When checking many families one after the
+other, ``fontbakery serve`` only pays for that once: it listens on a Unix
+socket, keeps the profiles and everything they have loaded warm, and runs
+the checks that clients (such as ``fontbakery check-... --server SOCKET``)
+ask for, streaming the results back as they come in.
+
+The protocol is line-based JSON. A client sends a single request::
+
+    {"profile": "googlefonts", "files": ["/path/to/Family-Regular.ttf"],
+     "configuration": {"explicit_checks": ["name/"]}, "jobs": 0}
+
+and gets back the records that an ``NDJSONReporter`` writes: one per check
+result, then a summary. A request which can not be run gets a single
+``{"type": "error", "message": ...}`` record instead, and so does a run
+which fails halfway, after its records so far. Requests are run one at a
+time, in the order they arrive.
+
+The socket is only open to the user running the server, and clients only
+talk to servers run by the same user. As it relies on Unix sockets, this
+module can not be imported on platforms without them, such as Windows.
+"""
+
+import json
+import os
+import socket
+import socketserver
+import tempfile
+
+from fontbakery.cache import CostHistory, ResultCache
+from fontbakery.checkrunner import CheckRunner
+from fontbakery.configuration import Configuration
+from fontbakery.fonts_profile import get_module, profile_factory, setup_context
+from fontbakery.reporters.serialize import NDJSONReporter
+from fontbakery.status import DEBUG
+
+
+def default_socket():
+    """The socket which servers listen on unless told otherwise."""
+    runtime_dir = os.environ.get("XDG_RUNTIME_DIR")
+    if runtime_dir:
+        return os.path.join(runtime_dir, "fontbakery.sock")
+    # Anyone can create files in the temporary directory, so the socket goes
+    # in a directory of our own (see FontBakeryServer).
+    return os.path.join(
+        tempfile.gettempdir(), f"fontbakery-{os.getuid()}", "fontbakery.sock"
+    )
+
+
+def _check_owner(socket_path):
+    """Make sure that a socket was made by the current user, not by another
+    one pretending to be a FontBakery server."""
+    if os.stat(socket_path).st_uid != os.getuid():
+        raise OSError(f"{socket_path} belongs to another user.")
+
+
+def _profile_module_name(profile):
+    """Profiles can be given by the name of a built-in profile, e.g.
+    "googlefonts", or like for check-profile, as a module or file name."""
+    if "." in profile or os.path.exists(profile):
+        return profile
+    return "fontbakery.profiles." + profile
+
+
+class _RequestHandler(socketserver.StreamRequestHandler):
+    def handle(self):
+        line = self.rfile.readline()
+        if not line:
+            # A client (or a new server) checking whether we are running.
+            return
+
+        with self.connection.makefile("w", encoding="utf-8") as output:
+            try:
+                runner = self.server.runner_for(json.loads(line))
+            except Exception as error:  # pylint: disable=broad-except
+                output.write(
+                    json.dumps({"type": "error", "message": str(error)}) + "\n"
+                )
+                return
+
+            reporter = NDJSONReporter(
+                runner=runner, loglevels=[DEBUG], output_file=output
+            )
+            try:
+                runner.run([reporter])
+            except (BrokenPipeError, ConnectionResetError):
+                # The client has gone away; there is no one left to report to.
+                return
+            except Exception as error:  # pylint: disable=broad-except
+                output.write(
+                    json.dumps({"type": "error", "message": str(error)}) + "\n"
+                )
+                return
+            if runner.cost_history is not None:
+                runner.cost_history.save()
+
+
+class FontBakeryServer(socketserver.UnixStreamServer):
+    """Runs checks for the clients connecting to a Unix socket.
+
+    The given profiles are loaded up front; others are loaded on first use.
+    Either way, they are only loaded once.
+    """
+
+    def __init__(self, socket_path=None, profiles=()):
+        if socket_path is None:
+            socket_path = default_socket()
+        self._profiles = {}
+        self.cost_history = CostHistory()
+        for profile in profiles:
+            self.profile(profile)
+
+        directory = os.path.dirname(socket_path)
+        if directory and not os.path.isdir(directory):
+            os.makedirs(directory, mode=0o700)
+        if os.path.exists(socket_path):
+            _check_owner(socket_path)
+            # Only take over the socket of a server which is not running anymore.
+            with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as probe:
+                try:
+                    probe.connect(socket_path)
+                except OSError:
+                    os.unlink(socket_path)
+                else:
+                    raise OSError(f"A server is already listening on {socket_path}")
+        super().__init__(socket_path, _RequestHandler)
+        # Only we may connect, as a server runs checks with our permissions.
+        os.chmod(socket_path, 0o600)
+
+    def profile(self, name):
+        if name not in self._profiles:
+            module = get_module(_profile_module_name(name))
+            self._profiles[name] = profile_factory(module)
+        return self._profiles[name]
+
+    def runner_for(self, request):
+        jobs = request.get("jobs", 0)
+        context = setup_context(request["files"])
+        context.is_multithreaded = jobs > 1
+        return CheckRunner(
+            self.profile(request["profile"]),
+            context,
+            Configuration(**request.get("configuration", {})),
+            jobs=jobs,
+            result_cache=ResultCache() if request.get("cache") else None,
+            cost_history=self.cost_history if request.get("cache") else None,
+        )
+
+    def server_close(self):
+        super().server_close()
+        if os.path.exists(self.server_address):
+            os.unlink(self.server_address)
+
+
+def serve(socket_path=None, profiles=()):
+    """Run a server until interrupted."""
+    with FontBakeryServer(socket_path, profiles) as server:
+        print(f"FontBakery is listening on {server.server_address}")
+        server.serve_forever()
+
+
+def submit(profile, files, configuration=None, jobs=0, cache=False, socket_path=None):
+    """Have a server check the files, and yield the records of the results
+    as they come in. Relative paths are taken from the current directory.
+    Raises OSError if the socket belongs to another user."""
+    request = {
+        "profile": profile,
+        "files": [os.path.abspath(f) for f in files],
+        "configuration": dict(configuration or {}),
+        "jobs": jobs,
+        "cache": cache,
+    }
+    if socket_path is None:
+        socket_path = default_socket()
+    _check_owner(socket_path)
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as connection:
+        connection.connect(socket_path)
+        connection.sendall(json.dumps(request).encode("utf-8") + b"\n")
+        with connection.makefile("r", encoding="utf-8") as records:
+            for record in records:
+                yield json.loads(record)
@@ -0,0 +1,115 @@
+"""A per-font HarfBuzz shaping service, shared by all the checks run on a font.
+
+Checks get hold of it through the ``shaper`` condition instead of building
+their own ``Vharfbuzz`` or ``hb.Face`` objects, so the font file is read and
+its face set up only once, and identical shaping requests are only done once.
+"""
+
+from collections import OrderedDict
+import threading
+
+import uharfbuzz as hb
+from vharfbuzz import Vharfbuzz
+
+from fontbakery.profiling import waiting_for
+
+# shape_glyphs() encodes glyph N as this codepoint plus N.
+GID_OFFSET = 0xF0000
+
+
+def _freeze(value):
+    """A hashable version of (nested) shaping parameters."""
+    if isinstance(value, dict):
+        return tuple(sorted((key, _freeze(item)) for key, item in value.items()))
+    if isinstance(value, (list, tuple)):
+        return tuple(_freeze(item) for item in value)
+    return value
+
+
+def _nominal_glyph_by_gid(_font, codepoint, _data):
+    if codepoint > GID_OFFSET:
+        return codepoint - GID_OFFSET
+    return 0
+
+
+class Shaper(Vharfbuzz):
+    """A Vharfbuzz object which remembers what it has shaped.
+
+    Results are memoized by text and shaping parameters (features,
+    variations, script, direction, language and shaper), so the buffers
+    returned by ``shape`` are shared between callers and must not be
+    modified. All shaping is done under a lock, as setting the variations
+    on the underlying ``hb.Font`` is not thread-safe.
+    """
+
+    max_cached_results = 10000
+
+    def __init__(self, filename):
+        super().__init__(filename)
+        # Vharfbuzz only sets this while shaping, but buffers may now be
+        # serialized without any actual shaping taking place.
+        self.stage = "GPOS"
+        self._lock = threading.RLock()
+        self._results = OrderedDict()
+        self._face = None
+        self._glyph_shaper = None
+
+    @property
+    def face(self):
+        """The ``hb.Face`` of the font, loaded from disk on first use."""
+        with waiting_for(self._lock):
+            if self._face is None:
+                self._face = hb.Face(hb.Blob.from_file_path(self.filename))
+            return self._face
+
+    @property
+    def hbfont(self):
+        with waiting_for(self._lock):
+            if self._hbfont is None:
+                self._hbfont = hb.Font(self.face)
+            return self._hbfont
+
+    def shape(self, text, parameters=None, onchange=None):
+        with waiting_for(self._lock):
+            if onchange:
+                return super().shape(text, parameters, onchange)
+
+            key = (text, _freeze(parameters or {}))
+            buf = self._results.get(key)
+            if buf is None:
+                buf = self._results[key] = super().shape(text, parameters)
+                if len(self._results) > self.max_cached_results:
+                    self._results.popitem(last=False)
+            else:
+                self._results.move_to_end(key)
+            return buf
+
+    def shape_many(self, texts, parameters=None):
+        """Shape each of the texts with the same parameters."""
+        return [self.shape(text, parameters) for text in texts]
+
+    def can_shape(self, text, parameters=None):
+        """Whether the font renders the text without any .notdef glyphs."""
+        buf = self.shape(text, parameters)
+        return all(info.codepoint != 0 for info in buf.glyph_infos)
+
+    @property
+    def glyph_shaper(self):
+        """A Shaper on the same face, whose cmap maps ``GID_OFFSET + N`` to
+        glyph N, so that glyphs can be shaped regardless of their encoding.
+        See ``shape_glyphs``."""
+        with waiting_for(self._lock):
+            if self._glyph_shaper is None:
+                funcs = hb.FontFuncs.create()
+                funcs.set_nominal_glyph_func(_nominal_glyph_by_gid)
+                glyph_shaper = Shaper(self.filename)
+                glyph_shaper._face = self.face
+                glyph_shaper._hbfont = hb.Font(self.face)
+                glyph_shaper._hbfont.funcs = funcs
+                self._glyph_shaper = glyph_shaper
+            return self._glyph_shaper
+
+    def shape_glyphs(self, glyph_ids, parameters=None):
+        """Shape a sequence of glyphs, given by glyph ID."""
+        text = "".join(chr(GID_OFFSET + gid) for gid in glyph_ids)
+        return self.glyph_shaper.shape(text, parameters)
@@ -30,6 +30,11 @@ class Status:
 
     __instances = {}
 
+    def __getnewargs__(self):
+        # Statuses travel between processes when checks are run on a
+        # process pool; make sure they unpickle into the registered instance.
+        return (self.__name, self.__weight)
+
     def __str__(self):
         return f"<Status {self.__name}>"
 
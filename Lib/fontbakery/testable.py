@@ -2,9 +2,75 @@ import os
 from collections import defaultdict
 from dataclasses import dataclass, field
 from functools import cached_property
+import threading
 from typing import Optional, List
 
 from fontTools.ttLib import TTFont
+from fontTools.misc.textTools import Tag
+
+from fontbakery.profiling import waiting_for
+
+
+class _LockedReader:
+    """Serializes reads of table data from a shared font file."""
+
+    def __init__(self, reader):
+        self._reader = reader
+        self._lock = threading.Lock()
+
+    def __getitem__(self, tag):
+        with waiting_for(self._lock):
+            return self._reader[tag]
+
+    def __contains__(self, tag):
+        return tag in self._reader
+
+    def __delitem__(self, tag):
+        del self._reader[tag]
+
+    def __getattr__(self, name):
+        return getattr(self._reader, name)
+
+
+class ThreadSafeTTFont(TTFont):
+    """A TTFont whose tables can be used from several threads at once.
+
+    Tables are still only read from disk when first used. Each of them is
+    then fully decompiled (including parts which fontTools would otherwise
+    only decompile on access, such as the outlines of glyf glyphs) exactly
+    once, while holding a lock of its own, and only made available to
+    other threads afterwards.
+    """
+
+    def __init__(self, *args, **kwargs):
+        self._decompiled = set()
+        self._table_locks = defaultdict(threading.RLock)
+        self._table_locks_guard = threading.Lock()
+        super().__init__(*args, **kwargs)
+        if self.reader is not None:
+            self.reader = _LockedReader(self.reader)
+
+    def __getitem__(self, tag):
+        tag = Tag(tag)
+        if tag in self._decompiled:
+            return self.tables[tag]
+        with self._table_locks_guard:
+            lock = self._table_locks[tag]
+        with waiting_for(lock):
+            if tag not in self._decompiled:
+                table = super().__getitem__(tag)
+                if hasattr(table, "ensureDecompiled"):
+                    table.ensureDecompiled()
+                self._decompiled.add(tag)
+            return self.tables[tag]
+
+    def __setitem__(self, tag, table):
+        super().__setitem__(tag, table)
+        self._decompiled.add(Tag(tag))
+
+    def __delitem__(self, tag):
+        self._decompiled.discard(Tag(tag))
+        super().__delitem__(tag)
 
 
 @dataclass
@@ -76,15 +142,14 @@ class Font(Testable):
 
     @cached_property
     def ttFont(self):
-        font = TTFont(self.file)
         if (
             hasattr(self, "context")
             and self.context is not None
             and self.context.is_multithreaded
         ):
-            # Preload all tables while we're in this cached_property that uses locking
-            font.ensureDecompiled()
-        return font
+            # Only the tables that the checks use get decompiled.
+            return ThreadSafeTTFont(self.file)
+        return TTFont(self.file)
 
     @cached_property
     def family(self):
@@ -283,11 +348,44 @@ class TTCFont(Font):
 FILE_TYPES = [Readme, Ufo, Designspace, GlyphsFile, MetadataPB, Font]
 
 
+class SharedValues:
+    """Values which are computed once, by the first thread asking for them.
+    Threads asking for a value being computed wait for it."""
+
+    def __init__(self):
+        self._values = {}
+        self._locks = {}
+        self._lock = threading.Lock()
+
+    def get(self, key, compute):
+        """The value for the key, which is computed by calling `compute` if
+        it is not known yet."""
+        with self._lock:
+            lock = self._locks.setdefault(key, threading.Lock())
+        with waiting_for(lock):
+            if key not in self._values:
+                self._values[key] = compute()
+            return self._values[key]
+
+
 @dataclass
 class CheckRunContext:
     testables: List[Testable] = field(default_factory=list)
     config: dict = field(default_factory=dict)
     is_multithreaded: bool = False
+    # Values shared with the contexts of the other families of the same run,
+    # if any (see setup_family_contexts)
+    run_values: Optional[SharedValues] = field(default=None, repr=False, compare=False)
+    # The values of shared conditions, by (condition name, key)
+    _shared_values: SharedValues = field(
+        default_factory=SharedValues, init=False, repr=False, compare=False
+    )
+
+    def shared_value(self, name, key, compute):
+        """The value of the shared condition `name` for the objects with the
+        given key, which is computed by calling `compute` if it is not known
+        yet. Threads asking for a value being computed wait for it."""
+        return self._shared_values.get((name, key), compute)
 
     @cached_property
     def testables_by_type(self):
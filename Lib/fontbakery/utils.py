@@ -15,12 +15,16 @@
 #
 from __future__ import annotations
 
+from bisect import bisect_right
+from collections.abc import Mapping
+from functools import lru_cache
 import os
 import subprocess
 import sys
+import threading
 import traceback
-from copy import deepcopy
 from typing import Optional
+import weakref
 
 from fontTools.pens.basePen import BasePen
 from fontTools.ttLib import TTFont
@@ -32,6 +36,7 @@ from fontbakery.constants import (
     LIGHT_THEME,
     PANOSE_Family_Type,
 )
+from fontbakery.profiling import waiting_for
 
 
 def get_resource_file_contents(sub_file_path: str) -> str:
@@ -292,7 +297,7 @@ def glyph_contour_count(font, name):
     items = [font["glyf"][name]]
 
     while items:
-        g = items.pop(0)
+        g = items.pop()
         if g.isComposite():
             for comp in g.components:
                 if comp.glyphName != ".ttfautohint":
@@ -302,8 +307,11 @@ def glyph_contour_count(font, name):
     return contour_count
 
 
-def get_font_glyph_data(font):
-    """Return information for each glyph in a font"""
+def get_font_glyph_data(font, glyph_metrics=None):
+    """Return information for each glyph in a font.
+
+    The contour counts are taken from ``glyph_metrics`` (the condition of
+    the same name) when given."""
     from fontbakery.constants import PlatformID, WindowsEncodingID
 
     font_data = []
@@ -326,7 +334,10 @@ def get_font_glyph_data(font):
     for glyph_name in font.getGlyphSet().keys():
         if glyph_name in cmap_reversed:
             uni_glyph = cmap_reversed[glyph_name]
-            contours = glyph_contour_count(font, glyph_name)
+            if glyph_metrics is None:
+                contours = glyph_contour_count(font, glyph_name)
+            else:
+                contours = glyph_metrics.contour_count(glyph_name)
             font_data.append(
                 {"unicode": uni_glyph, "name": glyph_name, "contours": {contours}}
             )
@@ -426,29 +437,45 @@ def get_preferred_cmap(ttFont):
         return None
 
 
-def chars_in_range(ttFont, bit):
+@lru_cache(maxsize=1)
+def _unicoderange_index():
+    """The OS/2 Unicode ranges as sorted boundaries, each starting a stretch
+    of codepoints which belong to the same range bits (ranges can overlap:
+    bit 57 covers every codepoint beyond the BMP), for bisecting."""
     from fontbakery.constants import UNICODERANGE_DATA
 
-    cmap = get_preferred_cmap(ttFont)
-    chars = []
-    for c in sorted(cmap):
-        for entry in UNICODERANGE_DATA[bit]:
-            if c >= entry[2] and c <= entry[3]:
-                chars.append(c)
+    entries = [entry for bit_entries in UNICODERANGE_DATA for entry in bit_entries]
+    starts = sorted(
+        {entry[2] for entry in entries} | {entry[3] + 1 for entry in entries}
+    )
+    bits = [
+        tuple(sorted({bit for bit, _, first, last in entries if first <= c <= last}))
+        for c in starts
+    ]
+    return starts, bits
+
+
+def unicoderange_chars(codepoints):
+    """The given codepoints which fall in each ulUnicodeRange bit, as a dict
+    of sorted lists by bit. Bits without any codepoints are left out."""
+    starts, bits = _unicoderange_index()
+    chars = {}
+    for c in sorted(codepoints):
+        stretch = bisect_right(starts, c) - 1
+        if stretch >= 0:
+            for bit in bits[stretch]:
+                chars.setdefault(bit, []).append(c)
     return chars
 
 
-def compute_unicoderange_bits(ttFont):
-    from fontbakery.constants import UNICODERANGE_DATA
+def chars_in_range(ttFont, bit):
+    return unicoderange_chars(get_preferred_cmap(ttFont)).get(bit, [])
 
-    cmap = get_preferred_cmap(ttFont)
+
+def compute_unicoderange_bits(ttFont):
     result = 0
-    for c in sorted(cmap):
-        for bit in range(len(UNICODERANGE_DATA)):
-            for entry in UNICODERANGE_DATA[bit]:
-                bit = entry[0]
-                if c >= entry[2] and c <= entry[3]:
-                    result |= 1 << bit
+    for bit in unicoderange_chars(get_preferred_cmap(ttFont)):
+        result |= 1 << bit
     return result
 
 
@@ -487,47 +514,27 @@ def filenames_ending_in(suffix, root):
 
 
 def all_kerning(ttFont):
-    if "GPOS" not in ttFont:
-        return []
-    rules = []
-
-    def _invertClassDef(a, font):
-        classes = {}
-        for glyph, klass in a.items():
-            if klass not in classes:
-                classes[klass] = []
-            classes[klass].append(glyph)
-        glyphset = set(font.getGlyphOrder())
-        classes[0] = glyphset - set(a.keys())
-        return classes
-
-    kern_subtables = []
-    for lu in ttFont["GPOS"].table.LookupList.Lookup:
-        for subtable in lu.SubTable:
-            if subtable.LookupType == 9:
-                subtable = subtable.ExtSubTable
-            if subtable.LookupType == 2:
-                kern_subtables.append(subtable)
-
-    for subtable in kern_subtables:
-        if subtable.Format == 1:
-            for g, pair in zip(subtable.Coverage.glyphs, subtable.PairSet):
-                for vr in pair.PairValueRecord:
-                    rules.append((g, vr.SecondGlyph, vr.Value1, vr.Value2))
-        else:
-            class1 = _invertClassDef(subtable.ClassDef1.classDefs, ttFont)
-            class2 = _invertClassDef(subtable.ClassDef2.classDefs, ttFont)
-            for ix1, c1 in enumerate(subtable.Class1Record):
-                if ix1 not in class1:
-                    continue
-                for ix2, c2 in enumerate(c1.Class2Record):
-                    if ix2 not in class2:
-                        continue
-                    firstClass = list(set(class1[ix1]) & set(subtable.Coverage.glyphs))
-                    for left in firstClass:
-                        for right in class2[ix2]:
-                            rules.append((left, right, c2.Value1, c2.Value2))
-    return rules
+    """A list of (left, right, value1, value2) for all the glyph pairs
+    kerned by the GPOS table. Prefer fontbakery.kerning.KerningModel, which
+    does not expand class kerning into every pair of glyphs."""
+    from fontbakery.kerning import KerningModel
+
+    return list(KerningModel(ttFont).pairs())
+
+
+class ExtensionLookup:
+    """A view of an Extension subtable which looks like a lookup of the type
+    it wraps, without modifying the underlying font. All other attributes
+    (LookupFlag, etc.) are those of the Extension lookup itself."""
+
+    def __init__(self, lookup, extension):
+        self._lookup = lookup
+        self.LookupType = extension.ExtSubTable.LookupType
+        self.SubTable = [extension.ExtSubTable]
+        self.SubTableCount = 1
+
+    def __getattr__(self, name):
+        return getattr(self._lookup, name)
 
 
 def iterate_lookup_list_with_extensions(ttFont, table, callback, *args):
@@ -537,23 +544,83 @@ def iterate_lookup_list_with_extensions(ttFont, table, callback, *args):
     if table not in ttFont or not ttFont[table].table.LookupList:
         return
 
-    # This function mutates the TTF; deep copy to avoid this, and so avoid
-    # issues with concurrent tests that also use ttFont.
-    # See https://github.com/fonttools/fontbakery/issues/4834
-    ttFont = deepcopy(ttFont)
-
     extension_type = 9 if table == "GPOS" else 7
 
     for lookup in ttFont[table].table.LookupList.Lookup:
         if lookup.LookupType == extension_type:
             for xt in lookup.SubTable:
-                xt.SubTable = [xt.ExtSubTable]
-                xt.LookupType = xt.ExtSubTable.LookupType
-                callback(xt, *args)
+                callback(ExtensionLookup(lookup, xt), *args)
         else:
             callback(lookup, *args)
 
 
+_font_locks = weakref.WeakKeyDictionary()
+_font_locks_guard = threading.Lock()
+
+
+def font_lock(ttFont):
+    """A re-entrant lock dedicated to the given font object, to be held
+    while doing anything that makes fontTools lazily decompile parts of it."""
+    with _font_locks_guard:
+        lock = _font_locks.get(ttFont)
+        if lock is None:
+            lock = _font_locks[ttFont] = threading.RLock()
+        return lock
+
+
+class _LockedGlyph:
+    def __init__(self, glyph, lock):
+        self._glyph = glyph
+        self._lock = lock
+
+    def __getattr__(self, name):
+        return getattr(self._glyph, name)
+
+    def draw(self, pen):
+        with waiting_for(self._lock):
+            self._glyph.draw(pen)
+
+    def drawPoints(self, pen):
+        with waiting_for(self._lock):
+            self._glyph.drawPoints(pen)
+
+
+class ReadOnlyGlyphSet(Mapping):
+    """A glyph set which can safely be drawn from by checks running
+    concurrently on the same font.
+
+    Drawing a glyph makes fontTools expand glyf data and decompile
+    CharStrings in place, which used to force checks to work on a deep
+    copy of the whole font (see issue #4834). Here the glyphs are instead
+    drawn while holding the font's lock, so no copy is needed."""
+
+    def __init__(self, ttFont, **kwargs):
+        self._lock = font_lock(ttFont)
+        with waiting_for(self._lock):
+            self._glyphset = ttFont.getGlyphSet(**kwargs)
+
+    def __getitem__(self, glyph_name):
+        return _LockedGlyph(self._glyphset[glyph_name], self._lock)
+
+    def __contains__(self, glyph_name):
+        return glyph_name in self._glyphset
+
+    def __iter__(self):
+        return iter(self._glyphset.keys())
+
+    def __len__(self):
+        return len(self._glyphset)
+
+
+def glyph_bezier_paths(glyphset, glyph_name):
+    """The outline of a glyph as a list of beziers' BezierPath objects."""
+    from beziers.utils.pens import BezierPathCreatingPen
+
+    pen = BezierPathCreatingPen(glyphset)
+    glyphset[glyph_name].draw(pen)
+    return pen.paths
+
+
 def axis(ttFont, tag):
     """Return the axis with the given tag."""
     for axis in ttFont["fvar"].axes:
@@ -22,11 +22,12 @@ rm -f $COLLECTION_FOLDER/*/*/*fontbakery.json
 for f in $APACHE_FOLDERS $OFL_FOLDERS $UFL_FOLDERS
 do
   echo "$f" >> $RESULTS_FOLDER/all_fonts.txt
-  echo "Processing '$f'..."
-  LICENSE_DIR=$(basename "$(dirname $f)")
-  REPORT=$RESULTS_FOLDER/$LICENSE_DIR/$(basename $f).json
-  mkdir -p $(dirname $REPORT)
-  fontbakery check-googlefonts --json $REPORT "$f/*.ttf"
 done
 
+# A single run checks all families, each one as a family of its own,
+# and writes a report per family, e.g. check_results/ofl/abel.json
+fontbakery check-googlefonts --batch -j \
+  --json "$RESULTS_FOLDER/{family}.json" \
+  $COLLECTION_FOLDER/apache $COLLECTION_FOLDER/ofl $COLLECTION_FOLDER/ufl
+
 cat $RESULTS_FOLDER/issues.txt
@@ -29,6 +29,17 @@ def remove_import_raiser(module_name):
             sys.meta_path.remove(item)
 
 
+@pytest.fixture(autouse=True, scope="session")
+def cache_directory(tmp_path_factory):
+    """Keep what the tests download, and the statuses of the (often mocked)
+    links they check, out of the user's cache."""
+    with pytest.MonkeyPatch.context() as monkeypatch:
+        monkeypatch.setenv(
+            "FONTBAKERY_CACHE_DIR", str(tmp_path_factory.mktemp("cache"))
+        )
+        yield
+
+
 # FIXME: FSanches: I suspect I've overcomplicated this just because I do not yet
 #                  fully understand how pytest.mark.parametrize handles the values.
 
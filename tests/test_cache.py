@@ -0,0 +1,284 @@
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+import sys
+import threading
+import time
+
+import pytest
+import requests
+
+from fontbakery.cache import HTTPCache, LinkChecker, NotCached, ToolCache
+
+# Appends to a log, so that we can tell how many times it ran, and copies its
+# input to its output directory.
+TOOL = """
+import shutil, sys
+with open(sys.argv[1], "a") as log:
+    log.write("ran\\n")
+shutil.copy(sys.argv[2], sys.argv[3])
+print("warning: not a font", file=sys.stderr)
+sys.exit(3)
+"""
+
+
+def run_tool(cache, log, font):
+    return cache.run(
+        [sys.executable, "-c", TOOL, str(log), str(font), "{output_dir}/copy"],
+        [str(font)],
+        ["tool", 1],
+        output_dir=True,
+    )
+
+
+def test_tool_cache(tmp_path):
+    cache = ToolCache(str(tmp_path / "cache"))
+    log = tmp_path / "log"
+    font = tmp_path / "Font.ttf"
+    font.write_bytes(b"\xff\x00font")
+
+    first = run_tool(cache, log, font)
+    assert first.returncode == 3
+    assert first.stderr.strip() == b"warning: not a font"
+    assert first.files == {"copy": b"\xff\x00font"}
+
+    # The same file is not checked again...
+    assert run_tool(cache, log, font) == first
+    assert log.read_text().count("ran") == 1
+
+    # ...but the same contents under another name are, as tools name the
+    # files they check in their output.
+    other = tmp_path / "Other.ttf"
+    other.write_bytes(font.read_bytes())
+    assert run_tool(cache, log, other) == first
+    assert log.read_text().count("ran") == 2
+
+    font.write_bytes(b"changed")
+    assert run_tool(cache, log, font).files == {"copy": b"changed"}
+    assert log.read_text().count("ran") == 3
+
+
+def test_tool_cache_without_a_cache_directory(tmp_path, monkeypatch):
+    (tmp_path / "file").write_text("")
+    monkeypatch.setenv("FONTBAKERY_CACHE_DIR", str(tmp_path / "file" / "cache"))
+    cache = ToolCache()
+    log = tmp_path / "log"
+    font = tmp_path / "Font.ttf"
+    font.write_bytes(b"font")
+
+    # The tool just runs every time.
+    assert run_tool(cache, log, font).files == {"copy": b"font"}
+    assert run_tool(cache, log, font).files == {"copy": b"font"}
+    assert log.read_text().count("ran") == 2
+
+
+def test_tool_cache_evicts_least_recently_used(tmp_path):
+    cache = ToolCache(str(tmp_path / "cache"), max_size=3000)
+    log = tmp_path / "log"
+    fonts = []
+    for name in "abc":
+        font = tmp_path / name
+        font.write_bytes(name.encode() * 1000)
+        fonts.append(font)
+        run_tool(cache, log, font)
+
+    # Only the last two runs fit, each taking the size of its copy and
+    # the size of the result document.
+    run_tool(cache, log, fonts[2])
+    run_tool(cache, log, fonts[1])
+    assert log.read_text().count("ran") == 3
+    run_tool(cache, log, fonts[0])
+    assert log.read_text().count("ran") == 4
+
+
+class _Files(BaseHTTPRequestHandler):
+    """Serves self.server.files, with ETags, and logs the requests."""
+
+    def do_GET(self):
+        if self.path in self.server.errors:
+            self.server.log.append((self.path, self.headers.get("If-None-Match")))
+            self.send_error(self.server.errors[self.path])
+            return
+        body = self.server.files.get(self.path)
+        if body is None:
+            self.send_error(404)
+            return
+        etag = f'"{hash(body)}"'
+        self.server.log.append((self.path, self.headers.get("If-None-Match")))
+        if self.headers.get("If-None-Match") == etag:
+            self.send_response(304)
+            self.end_headers()
+            return
+        self.send_response(200)
+        self.send_header("ETag", etag)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_HEAD(self):
+        self.server.log.append((self.path, None))
+        if self.path in self.server.files:
+            self.send_response(200)
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+        else:
+            self.send_error(404)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def server():
+    httpd = ThreadingHTTPServer(("127.0.0.1", 0), _Files)
+    httpd.files = {}
+    httpd.errors = {}
+    httpd.log = []
+    httpd.url = f"http://127.0.0.1:{httpd.server_address[1]}"
+    thread = threading.Thread(target=httpd.serve_forever, daemon=True)
+    thread.start()
+    yield httpd
+    httpd.shutdown()
+    httpd.server_close()
+
+
+def test_http_cache_revalidates(server, tmp_path):
+    cache = HTTPCache(str(tmp_path))
+    server.files["/metadata"] = b'{"familyMetadataList": []}'
+    url = server.url + "/metadata"
+
+    assert cache.get(url) == b'{"familyMetadataList": []}'
+    assert cache.get(url) == b'{"familyMetadataList": []}'
+    etag = f'"{hash(server.files["/metadata"])}"'
+    # The second request only asked whether the file changed.
+    assert server.log == [("/metadata", None), ("/metadata", etag)]
+
+    server.files["/metadata"] = b'{"familyMetadataList": [{}]}'
+    assert cache.get(url) == b'{"familyMetadataList": [{}]}'
+
+    # A new cache on the same directory, as in a later run.
+    assert HTTPCache(str(tmp_path)).get(url) == b'{"familyMetadataList": [{}]}'
+    assert server.log[-1] == ("/metadata", f'"{hash(server.files["/metadata"])}"')
+
+
+def test_http_cache_offline(server, tmp_path):
+    cache = HTTPCache(str(tmp_path))
+    server.files["/Family.ttf"] = b"font"
+    url = server.url + "/Family.ttf"
+
+    with pytest.raises(NotCached):
+        cache.get(url, offline=True)
+    assert cache.get(url) == b"font"
+
+    server.files["/Family.ttf"] = b"changed"
+    assert cache.get(url, offline=True) == b"font"
+    assert len(server.log) == 1
+
+    with pytest.raises(requests.HTTPError):
+        cache.get(server.url + "/Missing.ttf")
+
+    # Without a server, the copy from earlier is used.
+    server.shutdown()
+    server.server_close()
+    assert cache.get(url, timeout=1) == b"font"
+    with pytest.raises(requests.ConnectionError):
+        cache.get(server.url + "/Other.ttf", timeout=1)
+
+
+def test_http_cache_server_errors(server, tmp_path):
+    cache = HTTPCache(str(tmp_path))
+    server.files["/metadata"] = b"{}"
+    url = server.url + "/metadata"
+    assert cache.get(url) == b"{}"
+
+    # The copy from earlier is used while the server fails...
+    server.errors["/metadata"] = 503
+    assert cache.get(url) == b"{}"
+    # ...but without a copy, the error is raised.
+    server.errors["/other"] = 503
+    with pytest.raises(requests.HTTPError):
+        cache.get(server.url + "/other")
+
+
+def test_http_cache_without_a_cache_directory(server, tmp_path, monkeypatch):
+    (tmp_path / "file").write_text("")
+    monkeypatch.setenv("FONTBAKERY_CACHE_DIR", str(tmp_path / "file" / "cache"))
+    cache = HTTPCache()
+    server.files["/metadata"] = b"{}"
+
+    # The files are still downloaded, and kept for this process only.
+    assert cache.get(server.url + "/metadata") == b"{}"
+    assert not cache.directory.startswith(str(tmp_path))
+
+
+def test_http_cache_evicts_least_recently_used(server, tmp_path):
+    cache = HTTPCache(str(tmp_path), max_size=2500)
+    for name in "abc":
+        server.files[f"/{name}"] = name.encode() * 1000
+        cache.get(f"{server.url}/{name}")
+        # Modification times can be too coarse to tell the files apart.
+        time.sleep(0.01)
+
+    # Only the last two files fit.
+    cache.get(f"{server.url}/c")
+    cache.get(f"{server.url}/b")
+    assert [etag is not None for _, etag in server.log[-2:]] == [True, True]
+    cache.get(f"{server.url}/a")
+    assert server.log[-1] == ("/a", None)
+
+
+def test_http_cache_prefetch(server, tmp_path):
+    cache = HTTPCache(str(tmp_path))
+    urls = []
+    for i in range(5):
+        server.files[f"/Family-{i}.ttf"] = f"font {i}".encode()
+        urls.append(f"{server.url}/Family-{i}.ttf")
+
+    paths = cache.prefetch(urls)
+    assert [open(path, "rb").read() for path in paths] == [
+        f"font {i}".encode() for i in range(5)
+    ]
+    assert sorted(path for path, _ in server.log) == [
+        f"/Family-{i}.ttf" for i in range(5)
+    ]
+
+
+def test_link_checker(server, tmp_path):
+    checker = LinkChecker(str(tmp_path))
+    server.files["/bio.html"] = b"<p>A designer.</p>"
+    good, broken = server.url + "/bio.html", server.url + "/missing.html"
+
+    futures = [checker.submit(url) for url in (good, broken, good, broken)]
+    assert [future.result().status_code for future in futures] == [200, 404] * 2
+    assert checker.status(good).ok and not checker.status(broken).ok
+    # Each link was only checked once...
+    assert sorted(path for path, _ in server.log) == ["/bio.html", "/missing.html"]
+
+    # ...and the statuses are kept for the next runs, until they get too old.
+    assert LinkChecker(str(tmp_path)).statuses([good, broken]) == {
+        good: checker.status(good),
+        broken: checker.status(broken),
+    }
+    assert len(server.log) == 2
+    assert LinkChecker(str(tmp_path), ttl=0).status(broken).status_code == 404
+    assert len(server.log) == 3
+
+
+def test_link_checker_does_not_keep_errors(tmp_path):
+    # Nothing listens on port 9 (discard) of the loopback interface.
+    url = "http://127.0.0.1:9/"
+    status = LinkChecker(str(tmp_path)).status(url, timeout=1)
+    assert status.status_code is None and status.error and not status.ok
+    assert not list(tmp_path.iterdir())
+
+
+def test_link_checker_without_a_cache_directory(server, tmp_path, monkeypatch):
+    (tmp_path / "file").write_text("")
+    monkeypatch.setenv("FONTBAKERY_CACHE_DIR", str(tmp_path / "file" / "cache"))
+    checker = LinkChecker()
+    server.files["/bio.html"] = b"<p>A designer.</p>"
+    url = server.url + "/bio.html"
+
+    # The statuses are still checked once per run, and kept in memory only.
+    assert checker.status(url).ok and checker.status(url).ok
+    assert len(server.log) == 1
+    assert LinkChecker().status(url).ok
+    assert len(server.log) == 2
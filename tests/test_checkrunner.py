@@ -0,0 +1,496 @@
+from collections import Counter
+from dataclasses import dataclass
+import multiprocessing
+import os
+import pickle
+import shutil
+import time
+
+import pytest
+
+from fontbakery.callable import attribute_paths, check, condition
+from fontbakery.cache import CostHistory, ResultCache
+from fontbakery.checkrunner import CheckRunner, run_concurrently
+from fontbakery.codetesting import TEST_FILE
+from fontbakery.configuration import Configuration
+from fontbakery.fonts_profile import (
+    profile_factory,
+    setup_context,
+    setup_family_contexts,
+)
+from fontbakery.profile import Profile, Section
+from fontbakery.profiling import Profiler
+from fontbakery.reporters import FontbakeryReporter
+from fontbakery.status import PASS, FAIL, Status
+from fontbakery.testable import CheckRunContext
+import fontbakery.testable
+import fontbakery.profiles.universal
+
+
+NUNITO_FONTS = [
+    TEST_FILE("nunito/Nunito-Regular.ttf"),
+    TEST_FILE("nunito/Nunito-Bold.ttf"),
+    TEST_FILE("nunito/Nunito-Italic.ttf"),
+]
+
+SOME_CHECKS = [
+    "opentype/family/equal_font_versions",
+    "name/trailing_spaces",
+    "valid_glyphnames",
+    "whitespace_glyphs",
+]
+
+
+def run_checks(files, checks, **runner_args):
+    profile = profile_factory(fontbakery.profiles.universal)
+    context = setup_context(files)
+    config = Configuration(explicit_checks=checks)
+    runner = CheckRunner(profile, context, config, **runner_args)
+    reporter = FontbakeryReporter(runner=runner, loglevels=[PASS])
+    runner.run([reporter])
+    return {
+        result.identity.key: [(sub.status, sub.message.code) for sub in result.results]
+        for result in reporter._results
+    }
+
+
+def test_status_survives_pickling():
+    """Statuses are sent back from worker processes."""
+    assert pickle.loads(pickle.dumps(FAIL)) is FAIL
+    assert pickle.loads(pickle.dumps(Status("CUSTOM", 42))).weight == 42
+
+
+def test_batches_by_testable():
+    """All identities of a given font end up in the same batch."""
+    profile = profile_factory(fontbakery.profiles.universal)
+    context = setup_context(NUNITO_FONTS)
+    config = Configuration(explicit_checks=SOME_CHECKS)
+    runner = CheckRunner(profile, context, config)
+    order = runner.order
+    batches = runner._batches_by_testable(order)
+
+    assert sorted(i for batch in batches for i in batch) == list(range(len(order)))
+    for batch in batches:
+        assert len(set(order[i].iterargs for i in batch)) == 1
+    # One batch per font, plus one for the family-wide check.
+    assert len(batches) == len(NUNITO_FONTS) + 1
+
+
+def test_process_pool_results_match_sequential_run():
+    sequential = run_checks(NUNITO_FONTS, SOME_CHECKS)
+    in_processes = run_checks(NUNITO_FONTS, SOME_CHECKS, jobs=2, executor="processes")
+    assert in_processes == sequential
+
+
+def test_process_pool_falls_back_to_threads(monkeypatch):
+    monkeypatch.setattr(multiprocessing, "get_all_start_methods", lambda: ["spawn"])
+    profile = profile_factory(fontbakery.profiles.universal)
+    context = setup_context(NUNITO_FONTS)
+    config = Configuration(explicit_checks=SOME_CHECKS)
+    runner = CheckRunner(profile, context, config, jobs=2, executor="processes")
+    with pytest.warns(UserWarning, match="Using threads instead"):
+        runner.run([])
+    assert context.is_multithreaded
+
+
+def test_setup_family_contexts(tmp_path):
+    for family, font in [("a", NUNITO_FONTS[0]), ("b", NUNITO_FONTS[1])]:
+        os.makedirs(tmp_path / "ofl" / family)
+        shutil.copy(font, tmp_path / "ofl" / family)
+    shutil.copy(
+        TEST_FILE("cabinvf/METADATA.pb"), tmp_path / "ofl" / "a" / "METADATA.pb"
+    )
+    (tmp_path / "README.md").write_text("Not a family", encoding="utf-8")
+
+    contexts = setup_family_contexts([str(tmp_path)])
+    assert list(contexts) == [str(tmp_path / "ofl" / "a"), str(tmp_path / "ofl" / "b")]
+    a = contexts[str(tmp_path / "ofl" / "a")]
+    b = contexts[str(tmp_path / "ofl" / "b")]
+    assert [t.singular for t in a.testables] == ["metadata_pb", "font"]
+    assert [os.path.basename(font.file) for font in b.fonts] == ["Nunito-Bold.ttf"]
+
+
+def test_unknown_executor():
+    profile = profile_factory(fontbakery.profiles.universal)
+    context = setup_context(NUNITO_FONTS)
+    with pytest.raises(ValueError):
+        CheckRunner(profile, context, Configuration(), executor="fibers")
+
+
+@dataclass
+class Thing(fontbakery.testable.Testable):
+    singular = "thing"
+    plural = "things"
+
+
+condition_calls = Counter()
+
+
+@condition(Thing)
+def thing_length(thing):
+    condition_calls["thing_length"] += 1
+    time.sleep(0.01)
+    return len(thing.file)
+
+
+@condition(Thing)
+def is_long_thing(thing):
+    condition_calls["is_long_thing"] += 1
+    return thing.thing_length > 3
+
+
+@condition(Thing)
+def unused_thing_condition(thing):
+    condition_calls["unused_thing_condition"] += 1
+
+
+@condition(Thing)
+def thing_initial(thing):
+    return thing.file[0]
+
+
+@condition(Thing, shared_by="thing_initial")
+def things_with_same_initial(thing):
+    condition_calls["things_with_same_initial"] += 1
+    time.sleep(0.01)
+    things = thing.context.testables_by_type["thing"]
+    return [other for other in things if other.file[0] == thing.file[0]]
+
+
+@condition(CheckRunContext)
+def longest_thing(context):
+    return max(thing.thing_length for thing in context.things)
+
+
+@check(id="test/long_things", conditions=["is_long_thing"])
+def check_long_things(thing, thing_length):
+    """Long things are long."""
+    yield PASS, f"{thing_length} is long enough"
+
+
+@condition(Thing)
+def thing_is_online(thing):
+    return thing.context.network
+
+
+@check(id="test/online_things", conditions=["thing_is_online"])
+def check_online_things(thing):
+    """Things are online."""
+    yield PASS, "Online"
+
+
+def things_runner(names, checks=(check_long_things,), config=None, **runner_args):
+    profile = Profile(
+        name="things",
+        iterargs={"thing": "things"},
+        sections=[Section(name="Things", checks=list(checks))],
+    )
+    context = CheckRunContext([Thing(name) for name in names])
+    return CheckRunner(profile, context, config or Configuration(), **runner_args)
+
+
+def test_attribute_paths():
+    def some_condition(font):
+        if font.context.network:
+            return font.ttFont["head"].unitsPerEm
+        return None
+
+    assert set(attribute_paths(some_condition)) == {
+        ("context",),
+        ("context", "network"),
+        ("ttFont",),
+    }
+
+
+def test_condition_waves():
+    runner = things_runner(["a", "abcd"])
+    things = runner.context.testables_by_type["thing"]
+    needed = {
+        (id(thing), name): (thing, name)
+        for thing in things
+        for name in ["is_long_thing", "thing_length"]
+    }
+    needed[(id(runner.context), "longest_thing")] = (runner.context, "longest_thing")
+
+    waves = runner._condition_waves(needed)
+    assert [sorted(names for _, names in wave.values()) for wave in waves] == [
+        [["thing_length"], ["thing_length"]],
+        [["is_long_thing"], ["is_long_thing"]],
+        [["longest_thing"]],
+    ]
+
+
+def test_conditions_are_computed_once():
+    condition_calls.clear()
+    names = ["a", "abcd", "abcde", "bc", "xyzzy"]
+    runner = things_runner(names, jobs=4)
+    reporter = FontbakeryReporter(runner=runner, loglevels=[PASS])
+    runner.run([reporter])
+
+    assert len(reporter._results) == len(names)
+    assert condition_calls == {
+        "thing_length": len(names),
+        "is_long_thing": len(names),
+    }
+    assert ("is_long_thing", (("thing", 1),)) in runner.condition_costs
+
+
+@check(id="test/initials", conditions=["things_with_same_initial"])
+def check_initials(thing, things_with_same_initial):
+    """Things share their initial."""
+    yield PASS, f"{len(things_with_same_initial)} things start like {thing.file}"
+
+
+def test_shared_conditions_are_computed_once_per_key():
+    condition_calls.clear()
+    names = ["a", "abcd", "abcde", "bc", "b", "xyzzy"]
+    runner = things_runner(names, checks=(check_initials,), jobs=4)
+    reporter = FontbakeryReporter(runner=runner, loglevels=[PASS])
+    runner.run([reporter])
+
+    assert len(reporter._results) == len(names)
+    assert condition_calls["things_with_same_initial"] == 3
+    things = runner.context.testables_by_type["thing"]
+    assert things[0].things_with_same_initial is things[2].things_with_same_initial
+    assert [t.file for t in things[3].things_with_same_initial] == ["bc", "b"]
+
+    # Values are only shared within a context.
+    other_run = things_runner(["abc"])
+    assert len(other_run.context.testables[0].things_with_same_initial) == 1
+    assert condition_calls["things_with_same_initial"] == 4
+
+
+def test_run_concurrently():
+    condition_calls.clear()
+    families = [["a", "abcd"], ["abcde", "bc", "xyzzy"], ["efgh"]]
+    runs = []
+    for names in families:
+        runner = things_runner(names, jobs=4)
+        runs.append((runner, [FontbakeryReporter(runner=runner, loglevels=[PASS])]))
+    run_concurrently(runs, jobs=4)
+
+    for names, (runner, [reporter]) in zip(families, runs):
+        assert len(reporter._results) == len(names)
+        assert all(result.identity.iterargs for result in reporter._results)
+    assert condition_calls["thing_length"] == sum(len(names) for names in families)
+
+
+def test_profiler():
+    profiler = Profiler()
+    runner = things_runner(["a", "abcd", "abcde"], jobs=2, profiler=profiler)
+    runner.run([FontbakeryReporter(runner=runner, loglevels=[PASS])])
+
+    checks = profiler.slowest(10, "check")
+    assert sorted(m.subject for m in checks) == ["a", "abcd", "abcde"]
+    assert all(m.name == "test/long_things" for m in checks)
+    conditions = Counter(m.name for m in profiler.measurements if m.kind == "condition")
+    assert conditions == {"thing_length": 3, "is_long_thing": 3}
+    for measurement in profiler.measurements:
+        if measurement.name in ("thing_length", "is_long_thing"):
+            # is_long_thing computes thing_length, which sleeps.
+            assert measurement.wall >= 0.01 > measurement.cpu
+
+    events = profiler.trace_events()
+    assert len(events) == len(profiler.measurements)
+    assert {event["ph"] for event in events} == {"X"}
+
+
+def test_profiler_with_processes():
+    profiler = Profiler()
+    runner = things_runner(
+        ["a", "abcd"], jobs=2, executor="processes", profiler=profiler
+    )
+    runner.run([FontbakeryReporter(runner=runner, loglevels=[PASS])])
+    assert sorted(m.subject for m in profiler.slowest(10, "check")) == ["a", "abcd"]
+
+
+def test_cost_history(tmp_path):
+    path = str(tmp_path / "costs.json")
+    history = CostHistory(path)
+    assert history.check("test/long_things") == 0.0
+    history.update(
+        {("test/long_things", (("thing", 0),)): 1.0},
+        {("thing_length", (("thing", 0),)): 2.0, ("thing_length", ()): 4.0},
+    )
+    history.save()
+
+    history = CostHistory(path)
+    assert history.check("test/long_things") == 1.0
+    assert history.condition("thing_length") == 3.0
+    # Checks which never ran are expected to cost as much as the average one.
+    assert history.check("test/online_things") == 1.0
+    history.update({("test/long_things", ()): 3.0}, {})
+    assert history.check("test/long_things") == 2.0
+
+
+def test_cost_history_without_a_cache_directory(tmp_path, monkeypatch):
+    (tmp_path / "file").write_text("")
+    monkeypatch.setenv("FONTBAKERY_CACHE_DIR", str(tmp_path / "file" / "cache"))
+    history = CostHistory()
+    history.update({("test/long_things", ()): 1.0}, {})
+    history.save()
+    assert history.check("test/long_things") == 1.0
+
+
+def test_longest_checks_start_first(tmp_path):
+    history = CostHistory(str(tmp_path / "costs.json"))
+    history.checks = {"test/long_things": 0.1, "test/online_things": 10.0}
+    runner = things_runner(
+        ["a", "abcd", "abcde"],
+        checks=(check_long_things, check_online_things),
+        jobs=4,
+        cost_history=history,
+    )
+    order = runner.order
+    assert [identity.check.id for identity in runner._longest_first(order)] == [
+        "test/online_things"
+    ] * 3 + ["test/long_things"] * 3
+
+    # Results still arrive in the order of the profile.
+    reporter = FontbakeryReporter(runner=runner, loglevels=[PASS])
+    runner.run([reporter])
+    assert [result.identity for result in reporter._results] == list(order)
+    assert history.checks["test/long_things"] < 0.1
+
+
+def run_things(names, **runner_args):
+    runner = things_runner(names, **runner_args)
+    reporter = FontbakeryReporter(runner=runner, loglevels=[PASS])
+    runner.run([reporter])
+    return [
+        [(sub.status, str(sub.message)) for sub in result.results]
+        for result in reporter._results
+    ]
+
+
+def test_result_cache(tmp_path):
+    names = []
+    for name in ["a", "abcd", "abcde"]:
+        (tmp_path / name).write_text(name)
+        names.append(str(tmp_path / name))
+    cache = ResultCache(str(tmp_path / "cache"))
+
+    condition_calls.clear()
+    results = run_things(names, result_cache=cache)
+    assert condition_calls["thing_length"] == len(names)
+
+    # Everything is replayed from the cache, without computing anything.
+    condition_calls.clear()
+    assert run_things(names, result_cache=cache) == results
+    assert not condition_calls
+
+    # Changing a file invalidates only the results for that file (whose
+    # result only depends on its name, so is the same).
+    (tmp_path / "a").write_text("changed")
+    assert run_things(names, result_cache=cache) == results
+    assert condition_calls["thing_length"] == 1
+
+    # ...and so does changing the configuration of the check.
+    condition_calls.clear()
+    config = Configuration(**{"test/long_things": {"threshold": 3}})
+    run_things(names, result_cache=cache, config=config)
+    assert condition_calls["thing_length"] == len(names)
+
+
+def test_result_cache_skips_network_checks(tmp_path):
+    (tmp_path / "a").write_text("a")
+    runner = things_runner(
+        [str(tmp_path / "a")],
+        checks=[check_long_things, check_online_things],
+        result_cache=ResultCache(str(tmp_path / "cache")),
+    )
+    keys = {
+        identity.check.id: runner._result_cache_key(identity)
+        for identity in runner.order
+    }
+    assert keys["test/long_things"] is not None
+    assert keys["test/online_things"] is None
+
+
+def run_googlefonts_check(check_id, fonts, **runner_args):
+    import fontbakery.profiles.googlefonts
+
+    runner = CheckRunner(
+        profile_factory(fontbakery.profiles.googlefonts),
+        setup_context(fonts),
+        Configuration(explicit_checks=[check_id]),
+        **runner_args,
+    )
+    reporter = FontbakeryReporter(runner=runner, loglevels=[PASS])
+    runner.run([reporter])
+    return [
+        (sub.status, sub.message.code)
+        for result in reporter._results
+        for sub in result.results
+    ]
+
+
+def test_result_cache_depends_on_the_family_directory(tmp_path):
+    family = tmp_path / "cabinvf"
+    shutil.copytree(TEST_FILE("cabinvf"), family)
+    font = str(family / "Cabin[wdth,wght].ttf")
+    cache = ResultCache(str(tmp_path / "cache"))
+
+    check_id = "googlefonts/metadata/category"
+    results = run_googlefonts_check(check_id, [font], result_cache=cache)
+    assert results and set(results) == {(PASS, "ok")}
+
+    # Editing METADATA.pb is not hidden by the results of the earlier run.
+    metadata = (family / "METADATA.pb").read_text(encoding="utf-8")
+    (family / "METADATA.pb").write_text(
+        metadata.replace('category: "SANS_SERIF"', 'category: "BOGUS"'),
+        encoding="utf-8",
+    )
+    expected = run_googlefonts_check(check_id, [font])
+    assert (FAIL, "bad-value") in expected
+    assert run_googlefonts_check(check_id, [font], result_cache=cache) == expected
+
+    # Nor is renaming the font, which conditions such as `style` read.
+    renamed = str(family / "Cabin-Renamed.ttf")
+    shutil.copy(font, renamed)
+
+    def cache_keys(path):
+        runner = CheckRunner(
+            profile_factory(fontbakery.profiles.universal),
+            setup_context([path]),
+            Configuration(explicit_checks=["opentype/mac_style"]),
+            result_cache=cache,
+        )
+        return [runner._result_cache_key(identity) for identity in runner.order]
+
+    assert None not in cache_keys(font)
+    assert not set(cache_keys(font)) & set(cache_keys(renamed))
+
+
+def test_result_cache_skips_checks_reading_other_directories(tmp_path):
+    runner = CheckRunner(
+        profile_factory(fontbakery.profiles.universal),
+        setup_context([TEST_FILE("cabinvf/Cabin[wdth,wght].ttf")]),
+        Configuration(explicit_checks=["superfamily/list"]),
+        result_cache=ResultCache(str(tmp_path / "cache")),
+    )
+    assert runner.order
+    assert all(runner._result_cache_key(identity) is None for identity in runner.order)
+
+
+def test_result_cache_skips_checks_using_remote_data(tmp_path):
+    """Checks using the Google Fonts data (remote_styles, production_metadata,
+    listed_on_gfonts_api) depend on the network, and are not cached."""
+    import fontbakery.profiles.googlefonts
+
+    for check_id in [
+        "googlefonts/vertical_metrics_regressions",
+        "googlefonts/axes_match",
+        "googlefonts/vertical_metrics",
+        "googlefonts/metadata/includes_production_subsets",
+    ]:
+        runner = CheckRunner(
+            profile_factory(fontbakery.profiles.googlefonts),
+            setup_context([TEST_FILE("cabinvf/Cabin[wdth,wght].ttf")]),
+            Configuration(explicit_checks=[check_id]),
+            result_cache=ResultCache(str(tmp_path / "cache")),
+        )
+        assert runner.order, check_id
+        assert all(
+            runner._result_cache_key(identity) is None for identity in runner.order
+        ), check_id
@@ -1,3 +1,4 @@
+from collections import OrderedDict
 import math
 import os
 import shutil
@@ -8,7 +9,7 @@ from conftest import check_id
 from fontTools.ttLib import TTFont
 
 from fontbakery.checks.vendorspecific.googlefonts.conditions import (
-    expected_font_names,
+    build_expected_font_names,
 )
 from fontbakery.codetesting import (
     TEST_FILE,
@@ -2039,6 +2040,20 @@ def test_check_production_encoded_glyphs(check, cabin_ttFonts):
         assert_results_contain(check(ttFont), FAIL, "lost-glyphs")
 
 
+@check_id("googlefonts/metadata/category")
+def test_shared_conditions_with_a_mock_context(check):
+    """Fonts in a MockContext compute family-level conditions on their own."""
+    context = MockContext(
+        testables=[
+            Font(TEST_FILE(f"cabin/Cabin-{style}.ttf")) for style in ("Regular", "Bold")
+        ]
+    )
+    for testable in context.testables:
+        testable.context = context
+    assert_PASS(check(context))
+    assert context.testables[0].family_metadata.category == ["SANS_SERIF"]
+
+
 @check_id("googlefonts/metadata/category")
 def test_check_metadata_category(check):
     """Category field for this font on METADATA.pb is valid?"""
@@ -2232,7 +2247,7 @@ def test_check_font_names(check, fp, mod, result):
 
     ttFont = TTFont(fp)
     # get the expecteed font names now before we modify them
-    expected = expected_font_names(ttFont, [])
+    expected = build_expected_font_names(ttFont, [])
     if mod:
         for k, v in mod.items():
             if v is None:
@@ -2261,6 +2276,46 @@ def test_check_font_names(check, fp, mod, result):
         )
 
 
+def test_expected_font_names_are_built_once_per_font(monkeypatch):
+    """The naming checks share the expected names of each font."""
+    from fontbakery.checks.vendorspecific.googlefonts import conditions
+    import fontbakery.profiles.googlefonts
+    from fontbakery.checkrunner import CheckRunner
+    from fontbakery.configuration import Configuration
+    from fontbakery.fonts_profile import profile_factory, setup_context
+    from fontbakery.reporters import FontbakeryReporter
+
+    built = []
+
+    def counting_build(ttFont, ttFonts):
+        built.append(ttFont)
+        return build_expected_font_names(ttFont, ttFonts)
+
+    monkeypatch.setattr(conditions, "build_expected_font_names", counting_build)
+    checks = [
+        "googlefonts/font_names",
+        "googlefonts/weightclass",
+        "googlefonts/fvar_instances",
+        "googlefonts/STAT/compulsory_axis_values",
+    ]
+    fonts = [
+        TEST_FILE("varfont/OpenSans[wdth,wght].ttf"),
+        TEST_FILE("varfont/OpenSans-Italic[wdth,wght].ttf"),
+    ]
+    runner = CheckRunner(
+        profile_factory(fontbakery.profiles.googlefonts),
+        setup_context(fonts),
+        Configuration(explicit_checks=checks),
+    )
+    reporter = FontbakeryReporter(runner=runner, loglevels=[PASS])
+    runner.run([reporter])
+
+    assert len(reporter._results) == len(checks) * len(fonts)
+    assert not any(r.summary_status == ERROR for r in reporter._results)
+    assert len(built) == len(fonts)
+    assert len({id(ttFont) for ttFont in built}) == len(fonts)
+
+
 @check_id("googlefonts/name/mandatory_entries")
 def test_check_name_mandatory_entries(check):
     """Font has all mandatory 'name' table entries ?"""
@@ -3358,6 +3413,10 @@ def test_check_metadata_designer_profiles(check, requests_mock):
         "catalog/designers/sorkintype/sorkin_type.png",
         content=b"\x89PNG\x0D\x0A\x1A\x0A",
     )
+    requests_mock.head(
+        "https://raw.githubusercontent.com/google/fonts/master/"
+        "catalog/designers/sorkintype/sorkin_type.png",
+    )
 
     # Delve Withrington is still not listed on the designers catalog.
     font = TEST_FILE("overpassmono/OverpassMono-Regular.ttf")
@@ -3767,7 +3826,7 @@ def test_check_STAT_compulsory_axis_values(check, fps, new_stat, result):
 
     ttFonts = [TTFont(f) for f in fps]
     ttFont = ttFonts[0]
-    expected = expected_font_names(ttFont, ttFonts)
+    expected = build_expected_font_names(ttFont, ttFonts)
     if new_stat:
         buildStatTable(ttFont, new_stat)
 
@@ -3855,6 +3914,45 @@ def test_check_shape_languages(check):
     assert_results_contain(check(test_font), FAIL, "failed-language-shaping")
 
 
+def test_languages_are_shaped_once_per_layout(monkeypatch, tmp_path):
+    """Fonts with the same cmap and layout tables share shaperglot's results."""
+    import shaperglot
+    from fontbakery.checks.vendorspecific.googlefonts.glyphsets import (
+        shape_languages,
+    )
+    from fontbakery.codetesting import CheckTester
+
+    checkers = []
+    real_checker = shaperglot.Checker
+
+    def counting_checker(path):
+        checkers.append(path)
+        return real_checker(path)
+
+    monkeypatch.setattr(shaperglot, "Checker", counting_checker)
+    monkeypatch.setattr(shape_languages, "_language_results", OrderedDict())
+    check = CheckTester("googlefonts/glyphsets/shape_languages")
+
+    font = TEST_FILE("annie/AnnieUseYourTelescope-Regular.ttf")
+    renamed = TTFont(font)
+    renamed["name"].setName("Annie Renamed", 1, 3, 1, 0x409)
+    renamed.save(tmp_path / "AnnieRenamed-Regular.ttf")
+    results = [
+        [(r.status, str(r.message)) for r in check(path)]
+        for path in (font, font, str(tmp_path / "AnnieRenamed-Regular.ttf"))
+    ]
+    assert results[0] and results[0] == results[1] == results[2]
+    assert checkers == [font]
+
+    # Only the results for the most recently used tables are kept.
+    monkeypatch.setattr(shape_languages, "_max_cached_digests", 1)
+    other_font = TEST_FILE("cabin/Cabin-Regular.ttf")
+    check(other_font)
+    check(font)
+    assert checkers == [font, other_font, font]
+    assert len(shape_languages._language_results) == 1
+
+
 @check_id("googlefonts/metadata/minisite_url")
 def test_check_metadata_minisite_url(check):
     """Validate minisite_url field"""
@@ -1,8 +1,10 @@
+import shutil
+
 import pytest
 from fontTools.ttLib import TTFont
 
 from fontbakery.codetesting import TEST_FILE, MockContext, MockFont
-from fontbakery.fonts_profile import setup_context
+from fontbakery.fonts_profile import setup_context, setup_family_contexts
 from fontbakery.testable import Font
 from fontbakery.utils import is_icon_font
 
@@ -83,3 +85,37 @@ def test_is_icon_font_condition():
 
     font = TTFont(TEST_FILE("notoemoji/NotoEmoji-Regular.ttf"))
     assert is_icon_font(font, {}) is True
+
+
+def test_production_metadata_is_shared_by_the_families_of_a_run(tmp_path, monkeypatch):
+    # Registers the network condition
+    import fontbakery.checks.conditions  # pylint: disable=unused-import
+    from fontbakery.checks.vendorspecific.googlefonts import conditions
+
+    downloads = []
+
+    def fake_production_metadata_json(timeout, offline=False):
+        downloads.append(timeout)
+        return {"familyMetadataList": []}
+
+    monkeypatch.setattr(
+        conditions, "production_metadata_json", fake_production_metadata_json
+    )
+    for family, font in [
+        ("a", "nunito/Nunito-Regular.ttf"),
+        ("b", "mada/Mada-Black.ttf"),
+    ]:
+        (tmp_path / family).mkdir()
+        shutil.copy(TEST_FILE(font), tmp_path / family)
+
+    contexts = setup_family_contexts([str(tmp_path)]).values()
+    for context in contexts:
+        context.config = {"skip_network": False}
+        assert context.production_metadata == {"familyMetadataList": []}
+    assert len(downloads) == 1
+
+    # Runs of their own (e.g. each request to a server) download it again.
+    context = setup_context([TEST_FILE("nunito/Nunito-Regular.ttf")])
+    context.config = {"skip_network": False}
+    assert context.production_metadata == {"familyMetadataList": []}
+    assert len(downloads) == 2
@@ -0,0 +1,32 @@
+from fontTools.ttLib import TTFont
+
+from conftest import check_id
+from fontbakery.codetesting import (
+    assert_PASS,
+    assert_results_contain,
+    TEST_FILE,
+)
+from fontbakery.status import WARN
+
+
+@check_id("notofonts/unicode_range_bits")
+def test_check_unicode_range_bits(check):
+    """Ensure UnicodeRange bits are properly set."""
+    ttFont = TTFont(TEST_FILE("notosanskhudawadi/NotoSansKhudawadi-Regular.ttf"))
+    assert_PASS(check(ttFont))
+
+    os2 = ttFont["OS/2"]
+    os2.ulUnicodeRange1 &= ~1  # Basic Latin
+    message = assert_results_contain(check(ttFont), WARN, "bad-range-bit")
+    assert message == (
+        'UnicodeRange bit 0 "Basic Latin" should be 1 because cmap has'
+        f" {sum(c < 0x80 for c in ttFont.getBestCmap())} of the 128 codepoints"
+        " in this range."
+    )
+
+    os2.ulUnicodeRange1 |= 1 | (1 << 9)  # Basic Latin and Cyrillic
+    message = assert_results_contain(check(ttFont), WARN, "bad-range-bit")
+    assert message == (
+        'UnicodeRange bit 9 "Cyrillic" should be 0 because cmap has none of'
+        " the 432 codepoints in this range."
+    )
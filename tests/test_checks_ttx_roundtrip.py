@@ -1,11 +1,12 @@
 from conftest import check_id
 
-#  from fontbakery.status import FAIL
+from fontbakery.status import FAIL
 from fontbakery.codetesting import (
     assert_PASS,
     #    assert_results_contain,
     TEST_FILE,
 )
+from fontbakery.checks.ttx_roundtrip import _ttx_roundtrip
 
 
 @check_id("ttx_roundtrip")
@@ -20,3 +21,17 @@ def test_check_ttx_roundtrip(check):
     # font = TEST_FILE("...")
     # assert_results_contain(check(font),
     #                        FAIL, None) # FIXME: This needs a message keyword
+
+    # This one doesn't even make it to XML, as it has no maxp table.
+    font = TEST_FILE("bizudpmincho-nameonly/BIZUDPMincho-Regular.ttf")
+    messages = [str(r.message) for r in check(font) if r.status == FAIL]
+    assert "ERROR: Unhandled exception has occurred" in messages
+    assert "KeyError: 'maxp'" in messages
+
+
+def test_ttx_roundtrip_of_collections():
+    """Each font of a collection is round-tripped on its own."""
+    for index in range(2):
+        roundtrip = _ttx_roundtrip(TEST_FILE("ttc/NotoSerifToto.ttc"), index)
+        assert roundtrip["import_returncode"] == 0
+        assert not roundtrip["export_stderr"] and not roundtrip["import_stderr"]
@@ -0,0 +1,26 @@
+from fontTools.ttLib import TTFont
+
+from conftest import check_id
+from fontbakery.status import FAIL, SKIP, WARN
+from fontbakery.codetesting import (
+    assert_PASS,
+    assert_results_contain,
+    TEST_FILE,
+)
+
+
+@check_id("typoascender_exceeds_Agrave")
+def test_check_typoascender_exceeds_Agrave(check):
+    """Checking that the typoAscender exceeds the yMax of the /Agrave."""
+
+    ttFont = TTFont(TEST_FILE("nunito/Nunito-Regular.ttf"))
+    assert_PASS(check(ttFont))
+
+    ttFont["OS/2"].sTypoAscender = 100
+    assert_results_contain(check(ttFont), WARN, "typoAscender")
+
+    ttFont = TTFont(TEST_FILE("bizudpmincho-nameonly/BIZUDPMincho-Regular.ttf"))
+    assert_results_contain(check(ttFont), FAIL, "lacks-OS/2")
+
+    ttFont = TTFont(TEST_FILE("amiri/AmiriQuranColored.ttf"))
+    assert_results_contain(check(ttFont), SKIP, "lacks-Agrave")
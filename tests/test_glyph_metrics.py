@@ -0,0 +1,68 @@
+from fontTools.pens.areaPen import AreaPen
+from fontTools.pens.boundsPen import BoundsPen
+from fontTools.ttLib import TTFont
+import pytest
+
+from fontbakery.codetesting import TEST_FILE
+from fontbakery.glyph_metrics import FontGlyphMetrics
+from fontbakery.utils import glyph_contour_count, glyph_has_ink
+
+
+@pytest.mark.parametrize(
+    "font",
+    [
+        "nunito/Nunito-Regular.ttf",
+        "mada/Mada-Black.ttf",
+        "rokkitt/Rokkitt-Regular.otf",
+        "wonky_paths/WonkySourceSansPro-Regular.ttf",
+        "wonky_paths/WonkySourceSansPro-Regular.otf",
+    ],
+)
+def test_glyph_metrics_match_pens(font):
+    """Bounds and areas are those of BoundsPen and AreaPen, including for
+    composites worked out from their components, and ink and contour counts
+    are those of the utils functions."""
+    ttFont = TTFont(TEST_FILE(font))
+    glyphset = ttFont.getGlyphSet()
+    metrics = FontGlyphMetrics(ttFont)
+    assert list(metrics) == ttFont.getGlyphOrder()
+
+    for glyph_name in ttFont.getGlyphOrder():
+        row = metrics[glyph_name]
+        bounds_pen = BoundsPen(glyphset)
+        glyphset[glyph_name].draw(bounds_pen)
+        if bounds_pen.bounds is None:
+            assert row.bounds is None
+        else:
+            assert row.bounds == pytest.approx(bounds_pen.bounds)
+
+        area_pen = AreaPen(glyphset)
+        try:
+            glyphset[glyph_name].draw(area_pen)
+        except NotImplementedError:
+            pass  # An open contour
+        else:
+            assert row.area == pytest.approx(area_pen.value)
+
+        assert row.has_ink == glyph_has_ink(ttFont, glyph_name)
+        if "glyf" in ttFont:
+            assert row.contour_count == glyph_contour_count(ttFont, glyph_name)
+
+
+def test_composites_resolve_through_components():
+    ttFont = TTFont(TEST_FILE("nunito/Nunito-Regular.ttf"))
+    metrics = FontGlyphMetrics(ttFont)
+    glyph = ttFont["glyf"].glyphs["Aacute"]
+    glyph.expand(ttFont["glyf"])
+    assert glyph.isComposite()
+
+    assert metrics.contour_count("Aacute") == sum(
+        metrics.contour_count(c.glyphName) for c in glyph.components
+    )
+    assert metrics.point_count("Aacute") == sum(
+        metrics.point_count(c.glyphName) for c in glyph.components
+    )
+    assert metrics.has_ink("Aacute")
+    assert not metrics.has_ink("space")
+    assert metrics.bounds("space") is None
+    assert metrics.area("space") == 0
@@ -0,0 +1,112 @@
+import pytest
+from fontTools.ttLib import TTFont
+
+from fontbakery.codetesting import TEST_FILE
+from fontbakery.kerning import KerningModel, PairKerningIndex
+from fontbakery.shaper import Shaper
+
+
+def shaped_kerning(shaper, ttFont, left, right):
+    gids = [ttFont.getGlyphID(left), ttFont.getGlyphID(right)]
+
+    def width(parameters):
+        buf = shaper.shape_glyphs(gids, parameters)
+        return sum(pos.x_advance for pos in buf.glyph_positions)
+
+    return width({"features": {"kern": True}}) - width({"features": {"kern": False}})
+
+
+@pytest.mark.parametrize(
+    "font",
+    [
+        # Glyph pairs (format 1) and class kerning (format 2) in Extension lookups
+        TEST_FILE("mada/Mada-Regular.ttf"),
+        # Several lookups, each with several subtables
+        TEST_FILE("nunito/Nunito-Regular.ttf"),
+    ],
+)
+def test_pair_kerning_index_matches_shaping(font):
+    ttFont = TTFont(font)
+    shaper = Shaper(font)
+    index = PairKerningIndex(ttFont)
+    assert index.complete
+
+    glyphs = ["A", "T", "V", "Y", "a", "e", "o", "comma", "period", "one", "seven"]
+    for left in glyphs:
+        for right in glyphs:
+            assert index.kerning(left, right) == shaped_kerning(
+                shaper, ttFont, left, right
+            ), (left, right)
+
+
+def test_kerned_pairs():
+    ttFont = TTFont(TEST_FILE("sharetech/ShareTech-Regular.ttf"))
+    index = PairKerningIndex(ttFont)
+    digits = ["zero", "one", "two", "seven"]
+    glyphs = ttFont.getGlyphOrder()
+
+    kerned = list(index.kerned_pairs(glyphs, digits))
+    assert ("approxequal", "one", -25) in kerned
+    assert kerned == [
+        (left, right, index.kerning(left, right))
+        for left in glyphs
+        for right in digits
+        if index.kerning(left, right)
+    ]
+
+
+def test_pair_kerning_index_without_gpos():
+    index = PairKerningIndex(TTFont(TEST_FILE("mada/Mada-Regular.ttf")), "xxxx")
+    assert index.complete
+    assert index.kerning("A", "V") == 0
+    assert not list(index.kerned_pairs(["A"], ["V"]))
+
+
+def test_kerning_model_keeps_classes():
+    ttFont = TTFont(TEST_FILE("mada/Mada-Regular.ttf"))
+    model = KerningModel(ttFont)
+    rules = list(model.rules())
+
+    # Class kerning makes for fewer rules than kerned pairs...
+    pairs = list(model.pairs())
+    assert len(rules) < len(pairs)
+    assert any(len(rule.lefts) > 1 or len(rule.rights) > 1 for rule in rules)
+    # ...but the rules cover all the pairs.
+    assert len(pairs) == sum(len(rule.lefts) * len(rule.rights) for rule in rules)
+
+
+def test_kerning_model_filters_rules():
+    ttFont = TTFont(TEST_FILE("mada/Mada-Regular.ttf"))
+
+    def big_kern(value1, _value2):
+        return value1 is not None and getattr(value1, "XAdvance", 0) < -100
+
+    rules = list(KerningModel(ttFont).rules(big_kern))
+    assert rules
+    assert all(rule.value1.XAdvance < -100 for rule in rules)
+
+
+def test_pair_kerning_index_falls_through_out_of_range_classes():
+    from fontTools.feaLib.builder import addOpenTypeFeaturesFromString
+    from fontTools.fontBuilder import FontBuilder
+    from fontTools.pens.ttGlyphPen import TTGlyphPen
+
+    glyphs = [".notdef", "A", "B", "C"]
+    builder = FontBuilder(1000, isTTF=True)
+    builder.setupGlyphOrder(glyphs)
+    builder.setupGlyf({glyph: TTGlyphPen(None).glyph() for glyph in glyphs})
+    builder.setupHorizontalMetrics({glyph: (500, 0) for glyph in glyphs})
+    addOpenTypeFeaturesFromString(
+        builder.font,
+        "feature kern { pos [A] [C] -10; subtable; pos A B -50; } kern;",
+    )
+    # Class kerning first, with B in a second class past the end of its
+    # records: the glyph pair subtable after it defines the pair.
+    subtables = builder.font["GPOS"].table.LookupList.Lookup[0].SubTable
+    subtables.reverse()
+    assert [subtable.Format for subtable in subtables] == [2, 1]
+    subtables[0].ClassDef2.classDefs["B"] = 2
+
+    index = PairKerningIndex(builder.font)
+    assert index.kerning("A", "C") == -10
+    assert index.kerning("A", "B") == -50
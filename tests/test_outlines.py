@@ -0,0 +1,41 @@
+from fontTools.ttLib import TTFont
+
+from fontbakery.codetesting import TEST_FILE
+from fontbakery.outlines import FontOutlines, format_segment
+from fontbakery.utils import glyph_bezier_paths
+
+
+def test_outlines_match_beziers():
+    """Segments, tangents and lengths are those of the beziers package."""
+    for font in [
+        TEST_FILE("wonky_paths/WonkySourceSansPro-Regular.otf"),
+        TEST_FILE("wonky_paths/WonkySourceSansPro-Regular.ttf"),
+    ]:
+        ttFont = TTFont(font)
+        glyphset = ttFont.getGlyphSet()
+        for glyph in FontOutlines(ttFont):
+            paths = glyph_bezier_paths(glyphset, glyph.name)
+            assert len(glyph.contours) == len(paths)
+            for contour, path in zip(glyph.contours, paths):
+                segments = path.asSegments()
+                assert [format_segment(s) for s in contour.segments] == [
+                    repr(s) for s in segments
+                ]
+                assert contour.lengths == [s.length for s in segments]
+                assert contour.start_tangents == [
+                    (s.tangentAtTime(0).x, s.tangentAtTime(0).y) for s in segments
+                ]
+                assert contour.end_tangents == [
+                    (s.tangentAtTime(1).x, s.tangentAtTime(1).y) for s in segments
+                ]
+                if segments:
+                    assert contour.is_counter_clockwise == (path.direction == 1)
+
+
+def test_single_point_contour():
+    ttFont = TTFont(TEST_FILE("wonky_paths/WonkySourceSansPro-Regular.ttf"))
+    glyph = next(glyph for glyph in FontOutlines(ttFont) if glyph.name == "x")
+    points = [contour for contour in glyph.contours if not contour.segments]
+    assert points
+    assert points[0].bounds is None
+    assert len(points[0].oncurve_points) == 1
@@ -1,5 +1,4 @@
 import sys
-from unittest.mock import patch
 
 import pytest
 from fontTools.ttLib import TTFont
@@ -47,22 +46,26 @@ def test_axisregistry_extra_needed_exit(monkeypatch):
 
 
 def test_uharfbuzz_extra_needed_exit(monkeypatch):
+    check = CheckTester("iso15008/intercharacter_spacing")
     module_name = "uharfbuzz"
     sys.meta_path.insert(0, ImportRaiser(module_name))
     monkeypatch.delitem(sys.modules, module_name, raising=False)
-    from fontbakery.checks.iso15008.utils import pair_kerning
+    monkeypatch.delitem(sys.modules, "fontbakery.shaper", raising=False)
 
     with pytest.raises(SystemExit):
-        pair_kerning(None, None, None)
+        check(TEST_FILE("nunito/Nunito-Regular.ttf"))
 
     remove_import_raiser(module_name)
 
 
-@patch("vharfbuzz.Vharfbuzz", side_effect=ImportError)
-def test_extra_needed_exit(mock_import_error):
+def test_extra_needed_exit(monkeypatch):
     check = CheckTester("shaping/regression")
+    module_name = "vharfbuzz"
+    sys.meta_path.insert(0, ImportRaiser(module_name))
+    monkeypatch.delitem(sys.modules, module_name, raising=False)
+    monkeypatch.delitem(sys.modules, "fontbakery.shaper", raising=False)
 
-    font = TEST_FILE("nunito/Nunito-Regular.ttf")
-    with patch("sys.exit") as mock_exit:
-        check(font)
-        mock_exit.assert_called()
+    with pytest.raises(SystemExit):
+        check(TEST_FILE("nunito/Nunito-Regular.ttf"))
+
+    remove_import_raiser(module_name)
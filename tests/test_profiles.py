@@ -1,6 +1,10 @@
 import inspect
+import json
+import os
 import pkgutil
 import importlib
+import subprocess
+import sys
 import warnings
 
 import fontbakery
@@ -35,3 +39,47 @@ def test_rationale_field():
     for checkid, definition in checks_by_id.items():
         assert definition.rationale is not None
         assert definition.rationale.strip() != ""
+
+
+LOADED_CHECKS = """
+import json, sys
+from fontbakery.fonts_profile import profile_factory
+import fontbakery.profiles.universal
+
+profile = profile_factory(fontbakery.profiles.universal, sys.argv[1:] or None)
+print(json.dumps({
+    "checks": [check.id for section in profile.sections for check in section.checks],
+    "modules": [name for name in sys.modules if name.startswith("fontbakery.checks")],
+}))
+"""
+
+
+def loaded_checks(cache_dir, *explicit_checks):
+    env = dict(os.environ, FONTBAKERY_CACHE_DIR=str(cache_dir))
+    output = subprocess.run(
+        [sys.executable, "-c", LOADED_CHECKS, *explicit_checks],
+        env=env,
+        check=True,
+        capture_output=True,
+        text=True,
+    ).stdout
+    return json.loads(output.splitlines()[-1])
+
+
+def test_only_selected_checks_are_imported(tmp_path):
+    # The first run imports all checks, to build the check index...
+    first = loaded_checks(tmp_path, "name/trailing_spaces")
+    assert "fontbakery.checks.opentype.dsig" in first["modules"]
+
+    # ...and the next ones only import what they need.
+    selected = loaded_checks(tmp_path, "name/trailing_spaces")
+    assert selected["checks"] == first["checks"] == ["name/trailing_spaces"]
+    assert "fontbakery.checks.name.trailing_spaces" in selected["modules"]
+    assert "fontbakery.checks.opentype.dsig" not in selected["modules"]
+    assert "fontbakery.checks.conditions" in selected["modules"]
+
+    everything = loaded_checks(tmp_path)
+    assert "fontbakery.checks.opentype.dsig" in everything["modules"]
+    glyph_coverage = "fontbakery.checks.vendorspecific.googlefonts.glyph_coverage"
+    assert glyph_coverage not in everything["modules"]
+    assert len(everything["checks"]) > 100
@@ -0,0 +1,86 @@
+from concurrent.futures import ThreadPoolExecutor
+import threading
+import time
+
+from fontbakery import reference_data
+from fontbakery.reference_data import (
+    _parse_vendor_ids,
+    dataset,
+    datasets_used_by,
+    glyphsets,
+    subsets,
+    vendor_ids,
+)
+from fontbakery.codetesting import TEST_FILE
+from fontbakery.utils import get_resource_file_contents
+import fontbakery.checks.vendorspecific.googlefonts.metadata.can_render_samples
+import fontbakery.checks.vendorspecific.googlefonts.utils
+
+loads = []
+
+
+@dataset
+def slow_test_dataset():
+    loads.append(threading.get_ident())
+    time.sleep(0.05)
+    return {"loaded": True}
+
+
+def test_datasets_are_loaded_once():
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        results = list(executor.map(lambda _: slow_test_dataset(), range(8)))
+    assert len(loads) == 1
+    assert all(result is results[0] for result in results)
+    reference_data.preload("slow_test_dataset")
+    assert len(loads) == 1
+
+
+def test_datasets_used_by():
+    googlefonts = fontbakery.checks.vendorspecific.googlefonts
+    assert datasets_used_by([googlefonts.metadata.can_render_samples]) == {"languages"}
+    assert datasets_used_by([googlefonts.utils]) == {"axis_registry", "vendor_ids"}
+    assert not datasets_used_by([threading])
+
+
+def test_subsets():
+    gf_subsets = subsets()
+    assert "latin" in gf_subsets and "cyrillic-ext" in gf_subsets
+    cyrillic = gf_subsets.codepoints("cyrillic", unique_glyphs=True)
+    assert ord("Ж") in cyrillic and ord("A") not in cyrillic
+    assert gf_subsets.codepoints("cyrillic") == (
+        cyrillic | gf_subsets.codepoints("latin", unique_glyphs=True)
+    )
+    assert gf_subsets.codepoints("cyrillic-ext") >= cyrillic
+    # Asking for all the codepoints of a subset doesn't change its own.
+    assert gf_subsets.codepoints("cyrillic", unique_glyphs=True) == cyrillic
+    assert "cyrillic" in gf_subsets.subsets_of(ord("Ж"))
+    assert not gf_subsets.subsets_of(0x10FFFF)
+
+
+def test_glyphsets():
+    from glyphsets import defined_glyphsets, get_unicodes_unique_in_glyphset
+
+    gf_glyphsets = glyphsets()
+    assert gf_glyphsets.names == defined_glyphsets()
+    assert gf_glyphsets.unique_codepoints(
+        "GF_Latin_Plus", "GF_Latin_Core"
+    ) == get_unicodes_unique_in_glyphset("GF_Latin_Plus", "GF_Latin_Core")
+    assert "en_Latn" in gf_glyphsets.languages("GF_Latin_Core")
+
+
+def test_glyphsets_fulfilled():
+    from fontTools.ttLib import TTFont
+    from glyphsets import get_glyphsets_fulfilled
+
+    for font in ("cabin/Cabin-Regular.ttf", "moiraione/MoiraiOne-Regular.ttf"):
+        ttFont = TTFont(TEST_FILE(font))
+        expected = get_glyphsets_fulfilled(ttFont)
+        fulfilled = glyphsets().fulfilled(set(ttFont.getBestCmap()))
+        assert fulfilled == expected and list(fulfilled) == list(expected)
+
+
+def test_vendor_ids():
+    content = get_resource_file_contents("data/fontbakery-microsoft-vendorlist.cache")
+    ids = vendor_ids()
+    assert ids == _parse_vendor_ids(content)
+    assert "GOOG" in ids
@@ -0,0 +1,54 @@
+import json
+
+from fontbakery.checkrunner import CheckRunner
+from fontbakery.codetesting import TEST_FILE
+from fontbakery.configuration import Configuration
+from fontbakery.fonts_profile import profile_factory, setup_context
+from fontbakery.reporters import FontbakeryReporter
+from fontbakery.reporters.serialize import NDJSONReporter
+from fontbakery.status import PASS
+import fontbakery.profiles.universal
+
+
+def test_ndjson_reporter_streams_results(tmp_path):
+    output_file = str(tmp_path / "report.ndjson")
+    profile = profile_factory(fontbakery.profiles.universal)
+    context = setup_context(
+        [TEST_FILE("nunito/Nunito-Regular.ttf"), TEST_FILE("nunito/Nunito-Bold.ttf")]
+    )
+    config = Configuration(
+        explicit_checks=["name/trailing_spaces", "opentype/family/equal_font_versions"]
+    )
+    runner = CheckRunner(profile, context, config)
+    ndjson = NDJSONReporter(
+        runner=runner, loglevels=[PASS], output_file=output_file, quiet=True
+    )
+
+    lines_seen = []
+
+    class Tail(FontbakeryReporter):
+        def receive_result(self, checkresult):
+            super().receive_result(checkresult)
+            with open(output_file, encoding="utf-8") as f:
+                lines_seen.append(len(f.readlines()))
+
+    runner.run([ndjson, Tail(runner=runner, loglevels=[PASS])])
+    ndjson.write()
+
+    # Each result is on disk as soon as it has been received...
+    assert lines_seen == [1, 2, 3]
+    # ...and is not kept in memory.
+    assert not ndjson._results
+
+    with open(output_file, encoding="utf-8") as f:
+        records = [json.loads(line) for line in f]
+    assert [record["type"] for record in records] == [
+        "result",
+        "result",
+        "result",
+        "summary",
+    ]
+    results = records[:-1]
+    assert sum("name/trailing_spaces" in record["key"][1] for record in results) == 2
+    assert records[0]["section"]
+    assert records[-1]["result"]["PASS"] == 3
@@ -0,0 +1,134 @@
+import argparse
+import os
+import subprocess
+import sys
+import threading
+
+import pytest
+
+from fontbakery import cli
+from fontbakery.checkrunner import CheckRunner
+from fontbakery.codetesting import TEST_FILE
+from fontbakery.server import FontBakeryServer, submit
+from fontbakery.status import FAIL
+
+
+@pytest.fixture
+def server(tmp_path):
+    socket_path = str(tmp_path / "fontbakery.sock")
+    with FontBakeryServer(socket_path, ["universal"]) as server:
+        thread = threading.Thread(target=server.serve_forever)
+        thread.start()
+        yield socket_path
+        server.shutdown()
+        thread.join()
+
+
+def test_server_runs_requested_checks(server):
+    fonts = [
+        TEST_FILE("nunito/Nunito-Regular.ttf"),
+        TEST_FILE("nunito/Nunito-Bold.ttf"),
+    ]
+    configuration = {"explicit_checks": ["name/trailing_spaces"]}
+
+    # The profile stays loaded between requests.
+    for _ in range(2):
+        records = list(submit("universal", fonts, configuration, socket_path=server))
+        assert [record["type"] for record in records] == [
+            "result",
+            "result",
+            "summary",
+        ]
+        assert {record["check_id"] for record in records[:-1]} == {
+            "name/trailing_spaces"
+        }
+        assert {record["filename"] for record in records[:-1]} == {
+            "Nunito-Regular.ttf",
+            "Nunito-Bold.ttf",
+        }
+        assert records[-1]["result"]["PASS"] == 2
+
+
+def test_server_reports_bad_requests(server):
+    records = list(
+        submit(
+            "no_such_profile",
+            [TEST_FILE("nunito/Nunito-Regular.ttf")],
+            socket_path=server,
+        )
+    )
+    assert len(records) == 1
+    assert records[0]["type"] == "error"
+
+
+def test_server_refuses_a_socket_in_use(server):
+    with pytest.raises(OSError):
+        FontBakeryServer(server)
+
+
+def test_server_reports_runs_which_fail(server, monkeypatch):
+    def broken_run(self, reporters):
+        raise RuntimeError("Something broke.")
+
+    monkeypatch.setattr(CheckRunner, "run", broken_run)
+    records = list(
+        submit(
+            "universal",
+            [TEST_FILE("nunito/Nunito-Regular.ttf")],
+            socket_path=server,
+        )
+    )
+    assert records == [{"type": "error", "message": "Something broke."}]
+
+
+def test_server_socket_is_private(server, monkeypatch):
+    assert os.stat(server).st_mode & 0o777 == 0o600
+
+    # Do not talk to a server run by someone else.
+    monkeypatch.setattr(os, "getuid", lambda: os.stat(server).st_uid + 1)
+    with pytest.raises(OSError):
+        list(
+            submit(
+                "universal",
+                [TEST_FILE("nunito/Nunito-Regular.ttf")],
+                socket_path=server,
+            )
+        )
+
+
+def test_client_fails_without_a_summary(monkeypatch, capsys):
+    records = [
+        {
+            "type": "result",
+            "check_id": "name/trailing_spaces",
+            "result": "PASS",
+            "experimental": False,
+        }
+    ]
+    monkeypatch.setattr(
+        "fontbakery.server.submit", lambda *args, **kwargs: iter(records)
+    )
+    monkeypatch.setattr(cli, "get_configuration", lambda args: {})
+    args = argparse.Namespace(
+        batch=False,
+        trace=False,
+        slowest=False,
+        trace_memory=False,
+        profile="universal",
+        files=[TEST_FILE("nunito/Nunito-Regular.ttf")],
+        loglevels=None,
+        multiprocessing=0,
+        cache=False,
+        server="fontbakery.sock",
+        quiet=True,
+        error_code_on=FAIL,
+    )
+    assert cli.run_on_server(args) == 1
+    assert "stopped before the end" in capsys.readouterr().err
+
+
+def test_cli_does_not_need_unix_sockets():
+    """The server is only imported when asked for, as platforms without
+    Unix sockets can not import it."""
+    code = "import sys, fontbakery.cli; assert 'fontbakery.server' not in sys.modules"
+    subprocess.run([sys.executable, "-c", code], check=True)
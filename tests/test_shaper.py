@@ -0,0 +1,32 @@
+from fontTools.ttLib import TTFont
+
+from fontbakery.codetesting import TEST_FILE
+from fontbakery.shaper import Shaper
+
+MADA = TEST_FILE("mada/Mada-Regular.ttf")
+
+
+def test_shape_is_memoized():
+    shaper = Shaper(MADA)
+    kerned = shaper.shape("AV", {"features": {"kern": True}})
+
+    assert shaper.shape("AV", {"features": {"kern": True}}) is kerned
+    assert shaper.shape("AV", {"features": {"kern": False}}) is not kerned
+    assert shaper.shape_many(["AV", "VA"], {"features": {"kern": True}})[0] is kerned
+    assert shaper.serialize_buf(kerned, glyphsonly=True) == "A|V"
+
+
+def test_can_shape():
+    shaper = Shaper(MADA)
+    assert shaper.can_shape("ABC")
+    assert not shaper.can_shape("こんにちは")
+
+
+def test_shape_glyphs():
+    shaper = Shaper(MADA)
+    ttFont = TTFont(MADA)
+    gids = [ttFont.getGlyphID("A"), ttFont.getGlyphID("V")]
+
+    buf = shaper.shape_glyphs(gids)
+    assert [info.codepoint for info in buf.glyph_infos] == gids
+    assert shaper.glyph_shaper.face is shaper.face
@@ -0,0 +1,45 @@
+import concurrent.futures
+
+from fontTools.ttLib import TTFont
+
+from fontbakery.checkrunner import CheckRunner
+from fontbakery.codetesting import TEST_FILE
+from fontbakery.configuration import Configuration
+from fontbakery.fonts_profile import profile_factory, setup_context
+from fontbakery.reporters import FontbakeryReporter
+from fontbakery.status import PASS
+from fontbakery.testable import ThreadSafeTTFont
+import fontbakery.profiles.universal
+
+
+NUNITO = TEST_FILE("nunito/Nunito-Regular.ttf")
+
+
+def count_contours(ttFont):
+    glyf = ttFont["glyf"]
+    return sum(glyf[name].numberOfContours for name in ttFont.getGlyphOrder())
+
+
+def test_thread_safe_ttfont_decompiles_tables_once():
+    font = ThreadSafeTTFont(NUNITO)
+    assert not font.isLoaded("glyf")
+
+    with concurrent.futures.ThreadPoolExecutor(max_workers=8) as executor:
+        results = set(executor.map(count_contours, [font] * 32))
+
+    assert results == {count_contours(TTFont(NUNITO))}
+    assert font.reader.file.name == NUNITO
+
+
+def test_threaded_runs_only_load_the_tables_they_need():
+    profile = profile_factory(fontbakery.profiles.universal)
+    context = setup_context([NUNITO])
+    context.is_multithreaded = True
+    config = Configuration(explicit_checks=["name/trailing_spaces"])
+    runner = CheckRunner(profile, context, config, jobs=2)
+    runner.run([FontbakeryReporter(runner=runner, loglevels=[PASS])])
+
+    ttFont = context.fonts[0].ttFont
+    assert isinstance(ttFont, ThreadSafeTTFont)
+    assert ttFont.isLoaded("name")
+    assert not ttFont.isLoaded("glyf")
@@ -21,6 +21,8 @@ from fontbakery.utils import (
     unindent_and_unwrap_rationale,
     all_kerning,
     iterate_lookup_list_with_extensions,
+    ReadOnlyGlyphSet,
+    unicoderange_chars,
 )
 from fontbakery.codetesting import TEST_FILE
 
@@ -359,3 +361,65 @@ def test_iterate_lookup_list_with_extensions_doesnt_change_font():
     all_kerning_after = all_kerning(ttFont)
 
     assert all_kerning_before == all_kerning_after
+
+
+def test_iterate_lookup_list_with_extensions_unwraps_extensions():
+    from fontTools.ttLib import TTFont
+
+    ttFont = TTFont(TEST_FILE("abeezee_ext_lookup/ABeeZee-Regular_GPOS_ext_lookup.ttf"))
+    lookups = []
+    iterate_lookup_list_with_extensions(ttFont, "GPOS", lookups.append)
+
+    assert lookups
+    assert 9 not in [lookup.LookupType for lookup in lookups]
+    for lookup in lookups:
+        assert all(sub.LookupType == lookup.LookupType for sub in lookup.SubTable)
+        assert lookup.LookupFlag is not None
+
+
+def test_read_only_glyphset_draws_concurrently():
+    from concurrent.futures import ThreadPoolExecutor
+    from fontTools.pens.areaPen import AreaPen
+    from fontTools.ttLib import TTFont
+
+    reference = TTFont(TEST_FILE("source-sans-pro/OTF/SourceSansPro-Regular.otf"))
+    expected = {}
+    for name, glyph in reference.getGlyphSet().items():
+        pen = AreaPen()
+        glyph.draw(pen)
+        expected[name] = pen.value
+
+    ttFont = TTFont(TEST_FILE("source-sans-pro/OTF/SourceSansPro-Regular.otf"))
+    glyphset = ReadOnlyGlyphSet(ttFont)
+    assert set(glyphset) == set(expected)
+
+    def areas(names):
+        result = {}
+        for name in names:
+            pen = AreaPen(glyphset)
+            glyphset[name].draw(pen)
+            result[name] = pen.value
+        return result
+
+    names = sorted(expected)
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        chunks = executor.map(areas, [names[i::4] for i in range(4)])
+    assert {k: v for chunk in chunks for k, v in chunk.items()} == expected
+
+
+def test_unicoderange_chars():
+    from fontbakery.constants import UNICODERANGE_DATA
+
+    codepoints = [0x41, 0x20AC, 0x4E00, 0x10000, 0x1D400, 0xFFFFF, 0x110000]
+    expected = {}
+    for c in codepoints:
+        for bit, entries in enumerate(UNICODERANGE_DATA):
+            if any(first <= c <= last for _, _, first, last in entries):
+                expected.setdefault(bit, []).append(c)
+
+    chars = unicoderange_chars(reversed(codepoints))
+    assert chars == expected
+    # Ranges overlap: bit 57 ("Non-Plane 0") covers everything beyond the BMP.
+    assert chars[57] == [0x10000, 0x1D400, 0xFFFFF]
+    assert chars[101] == [0x10000]
+    assert 0x110000 not in sum(chars.values(), [])